@@ -1,9 +1,32 @@
+import bisect
+import csv
+import json
 import math
-import re
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import ttkbootstrap as tb
 
+from cable_engine import (
+    aggregation_totals, atlas_lookup, build_extrema_table, build_sizing_atlas, build_thermal_networks, cable_list,
+    calc_cyclic_factors, calc_emergency_times, calc_lifecycle_costs, calc_max_length_table, calc_motor_start_dips,
+    calc_pareto_frontier, calc_performance, calc_sweep_curves, clear_result_cache, close_result_cache,
+    close_result_store, close_sizing_atlas, decimate_columns, economic_settings, evict_result_cache, filter_cables,
+    flush_result_store, get_base_capacity, get_cyclic_factors, get_temp_factor, get_trench_factor, load_categories,
+    load_category, load_contribution, load_project, motor_csv_fields, new_load_aggregation, open_result_cache,
+    open_result_store, open_sizing_atlas, optimize_tapered_chain, optimize_trench_grouping, parse_trench_routes, parse_voltage_kV,
+    project, query_result_store, range_extrema, rank_parallel_additions, read_collector_chain, read_load_list,
+    read_motor_list, read_routes, recompute_project, record_result, result_cache, result_cache_stats, result_store,
+    result_store_queries, save_project, search_catalog, set_cable_price, sheath_settings, size_motor_feeder,
+    size_route, sizing_atlas_stale, solve_parallel_circuits, sweep_metrics, thermal_settings, transient_settings,
+    update_load, validate_sizing_atlas, voltage_settings,
+)
+
 import locale
 
 # try to set locale properly
@@ -14,6 +37,57 @@ for _candidate in ("en_US.utf8", "English_United_States.1252", "C"):
     except locale.Error:
         continue
 
+# session record/replay for UI latency measurements:
+#   --record FILE                 save the session's input events and widget values on exit
+#   --replay FILE [--report FILE] [--budget-ms MS] [--quiet-ms MS]
+#                                 replay them (headless under Xvfb when there is no display) and
+#                                 report p50/p99 latency per interaction type; an event has settled
+#                                 once nothing visible changed for the quiet window
+ui_session = {"mode": None, "path": None, "report": None, "budget_ms": None, "quiet_ms": 750.0, "events": [],
+              "started": 0.0, "xvfb": None, "exit_code": 0}
+
+
+def parse_session_args(argv):
+    args = list(argv)
+    while args:
+        flag = args.pop(0)
+        if flag in ("--record", "--replay") and args:
+            ui_session["mode"], ui_session["path"] = flag[2:], args.pop(0)
+        elif flag == "--report" and args:
+            ui_session["report"] = args.pop(0)
+        elif flag == "--budget-ms" and args:
+            ui_session["budget_ms"] = float(args.pop(0))
+        elif flag == "--quiet-ms" and args:
+            ui_session["quiet_ms"] = float(args.pop(0))
+
+
+def start_virtual_display():
+    # replays run headless: start Xvfb on a free display number when no display is set
+    if os.environ.get("DISPLAY") or not sys.platform.startswith("linux"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise SystemExit("No display available and Xvfb was not found; install it or run under xvfb-run")
+    for number in range(99, 140):
+        if os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        proc = subprocess.Popen([xvfb, f":{number}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(100):
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                os.environ["DISPLAY"] = f":{number}"
+                return proc
+            if proc.poll() is not None:
+                break
+            time.sleep(0.05)
+        proc.kill()
+    raise SystemExit("Could not start Xvfb")
+
+
+parse_session_args(sys.argv[1:])
+if ui_session["mode"] == "replay":
+    ui_session["xvfb"] = start_virtual_display()
+
 # setup theme
 style = tb.Style(theme="superhero")
 root = style.master
@@ -55,6 +129,8 @@ STEP 2 - SPECIFY INSTALLATION CONDITIONS:
    - Parallel Circuits: Number of parallel cable runs (1-6 for three-core, 1-2 for single-core)
    - Cable Length: Total cable length in kilometers
    - Ambient Temperature: Installation environment temperature (5-40°C)
+   - Max Regulation: Allowed voltage regulation in %; cables that exceed it over the
+     entered length are filtered out (0 = no limit), and it sets the Max Length columns
 
 STEP 3 - AUTOMATIC FILTERING:
    The app automatically shows only suitable cables as you type. Cables are filtered by:
@@ -69,14 +145,60 @@ STEP 4 - SELECT A CABLE:
 
 STEP 5 - CALCULATE PERFORMANCE:
    - Click "Calculate Losses & Regulation" for detailed analysis (or press Enter)
-   - Review voltage regulation, power losses, and 10-year costs
+   - Review voltage regulation, power losses, and lifecycle costs
    - Lower total cost usually indicates better cable choice
 
 TIPS:
    - Start with Load Type and System Voltage
    - The app shows the cheapest suitable cable highlighted in green
    - Safety Margin shows how much extra capacity you have
+   - Max Length shows the longest run each cable can reach within your regulation limit;
+     By Circuits lists it for 1, 2, ... parallel circuits ("-" where that count is overloaded)
    - Consider both cable cost and energy loss cost for best value
+   - Project > Feeders keeps many feeders in one project file; only feeders whose
+     inputs, cable or prices changed are recalculated
+   - Tools > Result Store saves every calculation to a local database that you
+     can query later (e.g. all feeders above 3% regulation)
+   - Tools > Sizing Atlas precomputes the cheapest cable over a grid of loads so
+     later lookups are instant; use Validate to spot-check it
+   - Tools > Economic Settings sets the lifecycle horizon, discount rate, load
+     growth, energy price escalation and residual value; the Lifecycle Cost
+     column ranks every listed cable on that basis
+   - Tools > Trench Optimizer assigns project feeders to shared trenches and picks
+     cables that still pass with the grouped trench derating
+   - Losses and voltage drop use the conductor resistance at its operating
+     temperature (Tools > Resistance at Operating Temperature to switch off)
+   - Tools > Mixed Parallel Circuits shares current between different cable sizes
+     by impedance and suggests the best cable to parallel with an existing one
+   - Industrial loads: enter the motor locked-rotor current, starting power factor
+     and source impedance to filter cables by starting voltage dip; the feeder
+     load P/Q is taken as already running while the motor starts.
+     Tools > Motor Starting Batch sizes a whole motor list from a CSV file
+     (optional load_P/load_Q columns for other loads on the motor feeder)
+   - Tools > Sweep Charts plots regulation, losses or lifecycle cost of every cable
+     against cable length or load; drag the Range slider to rescale
+   - Tools > Exact Voltage Drop in Filter computes max lengths and the regulation
+     limit check from the exact phasor solution instead of the approximation
+   - Tools > Screen Bonding sets how single-core MV screens are bonded; both-ends
+     bonding adds circulating-current losses that lower the rating and raise costs;
+     the screen material sets its resistance and temperature coefficient
+   - Tools > Transient Rating steps a thermal network through a daily load cycle
+     and an emergency overload: cyclic rating factor and time to 90 degC. Compute
+     is a what-if; Apply Cycle to Model makes the cyclic capacity check use the cycle
+   - Tools > Result Cache keeps project results on disk so later sessions and batch
+     runs only recompute feeders whose inputs, cables or model settings changed
+   - Tools > Load Aggregation derives P and Q from a connected-load list using
+     demand and diversity factors per load category
+   - Tools > Route Import reads cable routes from GeoJSON or CSV, measures each
+     section and sizes the route against its worst section
+   - The search box filters the results as you type: "3x95", "mm2:50..150", "kv>=10",
+     "cores:4", "price<500k" (terms are combined)
+   - Start with --record FILE to save a session, and --replay FILE to replay it and
+     report p50/p99 UI latency per interaction type (headless under Xvfb)
+   - Tools > Tapered Collector Feeder picks a cable per section of a daisy-chained
+     collector circuit, cheapest overall within a total voltage rise limit
+   - Tools > Pareto Frontier lists every configuration that is not beaten on
+     installation cost, regulation and losses at the same time
 
 COMMON VALUES:
    - Residential: 0.01-0.1 MW, 400V-1kV
@@ -148,194 +270,37 @@ def _is_positive_int(txt: str) -> bool:
         return False
 
 
-# cable database
-cable_list = [
-    # 0.6/1kV single-core
-    {"id": 1, "code": "1x10 mm2", "voltage": "0.6/1 kV", "fcc": 81, "tcc": 69, "resistance": 1.83,
-     "inductance_flat": 0.34, "inductance_trefoil": 0.41, "capacitance": None, "price": 102300},
-    {"id": 2, "code": "1x16 mm2", "voltage": "0.6/1 kV", "fcc": 108, "tcc": 92, "resistance": 1.15,
-     "inductance_flat": 0.317, "inductance_trefoil": 0.387, "capacitance": None, "price": 156600},
-    {"id": 3, "code": "1x25 mm2", "voltage": "0.6/1 kV", "fcc": 146, "tcc": 124, "resistance": 0.727,
-     "inductance_flat": 0.304, "inductance_trefoil": 0.374, "capacitance": None, "price": 241400},
-    {"id": 4, "code": "1x35 mm2", "voltage": "0.6/1 kV", "fcc": 180, "tcc": 153, "resistance": 0.524,
-     "inductance_flat": 0.291, "inductance_trefoil": 0.36, "capacitance": None, "price": 328300},
-    {"id": 5, "code": "1x50 mm2", "voltage": "0.6/1 kV", "fcc": 220, "tcc": 187, "resistance": 0.387,
-     "inductance_flat": 0.281, "inductance_trefoil": 0.351, "capacitance": None, "price": 434000},
-    {"id": 6, "code": "1x70 mm2", "voltage": "0.6/1 kV", "fcc": 279, "tcc": 237, "resistance": 0.268,
-     "inductance_flat": 0.272, "inductance_trefoil": 0.341, "capacitance": None, "price": 623000},
-    {"id": 7, "code": "1x95 mm2", "voltage": "0.6/1 kV", "fcc": 347, "tcc": 294, "resistance": 0.193,
-     "inductance_flat": 0.264, "inductance_trefoil": 0.333, "capacitance": None, "price": 847000},
-    {"id": 8, "code": "1x120 mm2", "voltage": "0.6/1 kV", "fcc": 405, "tcc": 343, "resistance": 0.153,
-     "inductance_flat": 0.259, "inductance_trefoil": 0.329, "capacitance": None, "price": 1080000},
-
-    # 0.6/1kV three-core
-    {"id": 9, "code": "3x16+10 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 89, "resistance": 1.15,
-     "inductance_flat": None, "inductance_trefoil": 0.264, "capacitance": None, "price": 640000},
-    {"id": 10, "code": "3x25+16 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 120, "resistance": 0.727,
-     "inductance_flat": None, "inductance_trefoil": 0.265, "capacitance": None, "price": 990000},
-    {"id": 11, "code": "3x35+16 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 147, "resistance": 0.524,
-     "inductance_flat": None, "inductance_trefoil": 0.258, "capacitance": None, "price": 1300000},
-    {"id": 12, "code": "3x50+25 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 179, "resistance": 0.387,
-     "inductance_flat": None, "inductance_trefoil": 0.256, "capacitance": None, "price": 1750000},
-    {"id": 13, "code": "3x70+35 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 224, "resistance": 0.268,
-     "inductance_flat": None, "inductance_trefoil": 0.253, "capacitance": None, "price": 2520000},
-    {"id": 14, "code": "3x95+50 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 277, "resistance": 0.193,
-     "inductance_flat": None, "inductance_trefoil": 0.247, "capacitance": None, "price": 3400000},
-    {"id": 15, "code": "3x120+70 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 323, "resistance": 0.153,
-     "inductance_flat": None, "inductance_trefoil": 0.246, "capacitance": None, "price": 4400000},
-    {"id": 16, "code": "3x150+70 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 368, "resistance": 0.124,
-     "inductance_flat": None, "inductance_trefoil": 0.248, "capacitance": None, "price": 5200000},
-
-    # 3.6/6kV single-core
-    {"id": 17, "code": "1x25 mm2", "voltage": "3.6/6 kV", "fcc": 196, "tcc": 163, "resistance": 0.727,
-     "inductance_flat": 0.77, "inductance_trefoil": 0.43, "capacitance": 0.25, "price": 351000},
-    {"id": 18, "code": "1x35 mm2", "voltage": "3.6/6 kV", "fcc": 238, "tcc": 198, "resistance": 0.524,
-     "inductance_flat": 0.75, "inductance_trefoil": 0.41, "capacitance": 0.28, "price": 532000},
-    {"id": 19, "code": "1x50 mm2", "voltage": "3.6/6 kV", "fcc": 286, "tcc": 238, "resistance": 0.387,
-     "inductance_flat": 0.72, "inductance_trefoil": 0.39, "capacitance": 0.31, "price": 638000},
-    {"id": 20, "code": "1x70 mm2", "voltage": "3.6/6 kV", "fcc": 356, "tcc": 296, "resistance": 0.268,
-     "inductance_flat": 0.68, "inductance_trefoil": 0.37, "capacitance": 0.36, "price": 825000},
-    {"id": 21, "code": "1x95 mm2", "voltage": "3.6/6 kV", "fcc": 434, "tcc": 361, "resistance": 0.193,
-     "inductance_flat": 0.65, "inductance_trefoil": 0.36, "capacitance": 0.4, "price": 1070000},
-    {"id": 22, "code": "1x120 mm2", "voltage": "3.6/6 kV", "fcc": 600, "tcc": 417, "resistance": 0.153,
-     "inductance_flat": 0.63, "inductance_trefoil": 0.34, "capacitance": 0.44, "price": 1300000},
-    {"id": 23, "code": "1x150 mm2", "voltage": "3.6/6 kV", "fcc": 559, "tcc": 473, "resistance": 0.124,
-     "inductance_flat": 0.62, "inductance_trefoil": 0.33, "capacitance": 0.48, "price": 1640000},
-    {"id": 24, "code": "1x185 mm2", "voltage": "3.6/6 kV", "fcc": 637, "tcc": 543, "resistance": 0.0991,
-     "inductance_flat": 0.6, "inductance_trefoil": 0.32, "capacitance": 0.52, "price": 1950000},
-
-    # 3.6/6kV three-core
-    {"id": 25, "code": "3x25+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 143, "resistance": 0.727,
-     "inductance_flat": None, "inductance_trefoil": 0.37, "capacitance": 0.25, "price": 1647000},
-    {"id": 26, "code": "3x35+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 172, "resistance": 0.524,
-     "inductance_flat": None, "inductance_trefoil": 0.35, "capacitance": 0.28, "price": 2002000},
-    {"id": 27, "code": "3x50+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 205, "resistance": 0.387,
-     "inductance_flat": None, "inductance_trefoil": 0.34, "capacitance": 0.3, "price": 2594000},
-    {"id": 28, "code": "3x70+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 253, "resistance": 0.268,
-     "inductance_flat": None, "inductance_trefoil": 0.32, "capacitance": 0.35, "price": 3450000},
-    {"id": 29, "code": "3x95+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 307, "resistance": 0.193,
-     "inductance_flat": None, "inductance_trefoil": 0.31, "capacitance": 0.39, "price": 4727000},
-    {"id": 30, "code": "3x120+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 352, "resistance": 0.153,
-     "inductance_flat": None, "inductance_trefoil": 0.3, "capacitance": 0.43, "price": 5784000},
-    {"id": 31, "code": "3x150+25 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 397, "resistance": 0.124,
-     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.47, "price": 6963000},
-    {"id": 32, "code": "3x185+25 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 453, "resistance": 0.0991,
-     "inductance_flat": None, "inductance_trefoil": 0.28, "capacitance": 0.5, "price": 8481000},
-
-    # 6/10kV single-core
-    {"id": 33, "code": "1x35 mm2", "voltage": "6/10 kV", "fcc": 231, "tcc": 195, "resistance": 0.524,
-     "inductance_flat": 0.661, "inductance_trefoil": 0.383, "capacitance": 0.223, "price": 785100},
-    {"id": 34, "code": "1x50 mm2", "voltage": "6/10 kV", "fcc": 277, "tcc": 234, "resistance": 0.387,
-     "inductance_flat": 0.636, "inductance_trefoil": 0.366, "capacitance": 0.248, "price": 944900},
-    {"id": 35, "code": "1x70 mm2", "voltage": "6/10 kV", "fcc": 345, "tcc": 292, "resistance": 0.268,
-     "inductance_flat": 0.606, "inductance_trefoil": 0.349, "capacitance": 0.285, "price": 1226000},
-    {"id": 36, "code": "1x95 mm2", "voltage": "6/10 kV", "fcc": 418, "tcc": 354, "resistance": 0.193,
-     "inductance_flat": 0.582, "inductance_trefoil": 0.334, "capacitance": 0.32, "price": 1533000},
-    {"id": 37, "code": "1x120 mm2", "voltage": "6/10 kV", "fcc": 481, "tcc": 407, "resistance": 0.153,
-     "inductance_flat": 0.563, "inductance_trefoil": 0.323, "capacitance": 0.35, "price": 1872000},
-    {"id": 38, "code": "1x150 mm2", "voltage": "6/10 kV", "fcc": 537, "tcc": 460, "resistance": 0.124,
-     "inductance_flat": 0.546, "inductance_trefoil": 0.313, "capacitance": 0.382, "price": 2362000},
-    {"id": 39, "code": "1x185 mm2", "voltage": "6/10 kV", "fcc": 612, "tcc": 527, "resistance": 0.0991,
-     "inductance_flat": 0.529, "inductance_trefoil": 0.304, "capacitance": 0.415, "price": 2838000},
-
-    # 6/10kV three-core
-    {"id": 40, "code": "3x35 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 173, "resistance": 0.524,
-     "inductance_flat": None, "inductance_trefoil": 0.374, "capacitance": 0.189, "price": 2127000},
-    {"id": 41, "code": "3x50 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 206, "resistance": 0.387,
-     "inductance_flat": None, "inductance_trefoil": 0.355, "capacitance": 0.209, "price": 2716000},
-    {"id": 42, "code": "3x70 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 257, "resistance": 0.268,
-     "inductance_flat": None, "inductance_trefoil": 0.336, "capacitance": 0.236, "price": 3603000},
-    {"id": 43, "code": "3x95 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 313, "resistance": 0.193,
-     "inductance_flat": None, "inductance_trefoil": 0.32, "capacitance": 0.263, "price": 4901000},
-    {"id": 44, "code": "3x120 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 360, "resistance": 0.153,
-     "inductance_flat": None, "inductance_trefoil": 0.308, "capacitance": 0.291, "price": 5934000},
-    {"id": 45, "code": "3x150 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 410, "resistance": 0.124,
-     "inductance_flat": None, "inductance_trefoil": 0.299, "capacitance": 0.314, "price": 7125000},
-    {"id": 46, "code": "3x185 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 469, "resistance": 0.0991,
-     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.341, "price": 8659000},
-
-    # 12/20kV single-core
-    {"id": 47, "code": "1x95 mm2", "voltage": "12/20 kV", "fcc": 420, "tcc": 358, "resistance": 0.193,
-     "inductance_flat": 0.59, "inductance_trefoil": 0.36, "capacitance": 0.218, "price": 1560000},
-    {"id": 48, "code": "1x120 mm2", "voltage": "12/20 kV", "fcc": 483, "tcc": 412, "resistance": 0.153,
-     "inductance_flat": 0.571, "inductance_trefoil": 0.349, "capacitance": 0.238, "price": 1906000},
-    {"id": 49, "code": "1x150 mm2", "voltage": "12/20 kV", "fcc": 540, "tcc": 466, "resistance": 0.124,
-     "inductance_flat": 0.554, "inductance_trefoil": 0.338, "capacitance": 0.258, "price": 2393000},
-    {"id": 50, "code": "1x185 mm2", "voltage": "12/20 kV", "fcc": 614, "tcc": 534, "resistance": 0.0991,
-     "inductance_flat": 0.538, "inductance_trefoil": 0.329, "capacitance": 0.278, "price": 2877000},
-    {"id": 51, "code": "1x240 mm2", "voltage": "12/20 kV", "fcc": 718, "tcc": 627, "resistance": 0.0754,
-     "inductance_flat": 0.518, "inductance_trefoil": 0.317, "capacitance": 0.308, "price": 3543000},
-    {"id": 52, "code": "1x300 mm2", "voltage": "12/20 kV", "fcc": 813, "tcc": 715, "resistance": 0.0601,
-     "inductance_flat": 0.501, "inductance_trefoil": 0.308, "capacitance": 0.336, "price": 4455000},
-    {"id": 53, "code": "1x400 mm2", "voltage": "12/20 kV", "fcc": 904, "tcc": 819, "resistance": 0.047,
-     "inductance_flat": 0.48, "inductance_trefoil": 0.298, "capacitance": 0.377, "price": 5669000},
-
-    # 20.3/35kV single-core
-    {"id": 54, "code": "1x150 mm2", "voltage": "20.3/35 kV", "fcc": 559, "tcc": 473, "resistance": 0.124,
-     "inductance_flat": 0.64, "inductance_trefoil": 0.41, "capacitance": 0.17, "price": 1720000},
-    {"id": 55, "code": "1x185 mm2", "voltage": "20.3/35 kV", "fcc": 637, "tcc": 543, "resistance": 0.0991,
-     "inductance_flat": 0.63, "inductance_trefoil": 0.39, "capacitance": 0.18, "price": 2020000},
-    {"id": 56, "code": "1x240 mm2", "voltage": "20.3/35 kV", "fcc": 745, "tcc": 641, "resistance": 0.0754,
-     "inductance_flat": 0.6, "inductance_trefoil": 0.38, "capacitance": 0.2, "price": 2530000},
-    {"id": 57, "code": "1x300 mm2", "voltage": "20.3/35 kV", "fcc": 846, "tcc": 735, "resistance": 0.0601,
-     "inductance_flat": 0.59, "inductance_trefoil": 0.37, "capacitance": 0.21, "price": 3150000},
-    {"id": 58, "code": "1x400 mm2", "voltage": "20.3/35 kV", "fcc": 938, "tcc": 845, "resistance": 0.047,
-     "inductance_flat": 0.57, "inductance_trefoil": 0.35, "capacitance": 0.23, "price": 4100000},
-    {"id": 59, "code": "1x500 mm2", "voltage": "20.3/35 kV", "fcc": 1010, "tcc": 950, "resistance": 0.0366,
-     "inductance_flat": 0.55, "inductance_trefoil": 0.34, "capacitance": 0.26, "price": 5150000},
-    {"id": 60, "code": "1x630 mm2", "voltage": "20.3/35 kV", "fcc": 1120, "tcc": 1040, "resistance": 0.0283,
-     "inductance_flat": 0.52, "inductance_trefoil": 0.33, "capacitance": 0.29, "price": 6550000},
-
-    # 20.3/35kV three-core
-    {"id": 61, "code": "3x95 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 307, "resistance": 0.193,
-     "inductance_flat": None, "inductance_trefoil": 0.4, "capacitance": 0.15, "price": 4600000},
-    {"id": 62, "code": "3x120 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 352, "resistance": 0.153,
-     "inductance_flat": None, "inductance_trefoil": 0.39, "capacitance": 0.16, "price": 5500000},
-    {"id": 63, "code": "3x150 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 397, "resistance": 0.124,
-     "inductance_flat": None, "inductance_trefoil": 0.37, "capacitance": 0.17, "price": 6400000},
-    {"id": 64, "code": "3x185 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 453, "resistance": 0.0991,
-     "inductance_flat": None, "inductance_trefoil": 0.36, "capacitance": 0.18, "price": 7500000},
-    {"id": 65, "code": "3x240 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 529, "resistance": 0.0754,
-     "inductance_flat": None, "inductance_trefoil": 0.35, "capacitance": 0.2, "price": 9400000},
-    {"id": 66, "code": "3x300 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 626, "resistance": 0.0601,
-     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.22, "price": 11300000},
-    {"id": 67, "code": "3x400 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 720, "resistance": 0.047,
-     "inductance_flat": None, "inductance_trefoil": 0.28, "capacitance": 0.24, "price": 14300000},
-]
-
+def format_length(km):
+    return "-" if km is None else f"{km:.3f}"
 
-def parse_voltage_kV(voltage_str):
-    # get max voltage from string like "6/10 kV"
-    if not voltage_str:
-        return 0.0
-    parts = voltage_str.replace('kV', '').strip().split('/')
-    try:
-        nums = [float(p) for p in parts]
-        return max(nums) if nums else 0.0
-    except:
-        return float(parts[-1]) if parts else 0.0
 
+def format_lengths(kms):
+    # one max length per circuit count, N = 1 first
+    return " / ".join("-" if km is None else f"{km:.2f}" for km in kms)
 
-def get_temp_factor(temp_c):
-    temp_table = {5: 1.15, 10: 1.10, 15: 1.05, 20: 1.00, 25: 0.95, 30: 0.90, 35: 0.85, 40: 0.80}
-    if temp_c <= 5:
-        return 1.15
-    if temp_c >= 40:
-        return 0.80
-    rounded_up = min(k for k in temp_table if k >= temp_c)
-    return temp_table[rounded_up]
 
-
-def get_trench_factor(num_circuits):
-    trench_table = {1: 1.00, 2: 0.90, 3: 0.85, 4: 0.80, 5: 0.75, 6: 0.70}
-    num_circuits = max(1, min(6, num_circuits))
-    return trench_table[num_circuits]
+def apply_search(*_):
+    # hides non-matching result rows; detached rows are kept so clearing the query restores them
+    rows = list(tree.get_children("")) + search_state["detached"]
+    ids = search_catalog(search_var.get())
+    shown, hidden = [], []
+    for iid in rows:
+        (shown if ids is None or int(tree.set(iid, "ID")) in ids else hidden).append(iid)
+    if hidden:
+        tree.detach(*hidden)
+    for pos, iid in enumerate(shown):
+        tree.move(iid, "", pos)
+    search_state["detached"] = hidden
+    search_count_label.config(text="" if ids is None else f"{len(shown)} of {len(rows)}")
 
 
 def auto_filter_cables():
     # clear table
     for item in tree.get_children():
         tree.delete(item)
+    if search_state["detached"]:
+        tree.delete(*search_state["detached"])
+        search_state["detached"] = []
 
     selected_cable["data"] = None
     if 'update_cable_display' in globals():
@@ -351,10 +316,21 @@ def auto_filter_cables():
         # show all if invalid input
         for idx, cable in enumerate(cable_list):
             tags = ["oddrow" if idx % 2 == 0 else "evenrow"]
-            tree.insert("", tk.END, values=(cable["id"], cable["code"], cable["voltage"], f"{cable['price']}"),
-                        tags=tags)
+            tree.insert("", tk.END, values=(cable["id"], cable["code"], cable["voltage"], f"{cable['price']}",
+                                            "-", "-", "-", "-"), tags=tags)
+        apply_search()
         return
 
+    try:
+        reg_limit = float(regulation_limit_var.get().replace(',', '.')) or 0.0
+    except ValueError:
+        reg_limit = 0.0
+    try:
+        length = float(cable_length_var.get().replace(',', '.')) or 1.0
+    except ValueError:
+        length = 1.0
+    load_type = load_type_combo.get()
+
     max_c = 2 if cable_type_combo.get() == "Single-core" else 6
     if not (1 <= N <= max_c):
         N = min(max_c, max(1, N))
@@ -366,55 +342,54 @@ def auto_filter_cables():
         # show all if no valid load
         for idx, cable in enumerate(cable_list):
             tags = ["oddrow" if idx % 2 == 0 else "evenrow"]
-            tree.insert("", tk.END, values=(cable["id"], cable["code"], cable["voltage"], f"{cable['price']}"),
-                        tags=tags)
+            tree.insert("", tk.END, values=(cable["id"], cable["code"], cable["voltage"], f"{cable['price']}",
+                                            "-", "-", "-", "-"), tags=tags)
+        apply_search()
         return
 
-    # calc required current
-    S_MVA = math.sqrt(P ** 2 + Q ** 2)
-    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
-    I_per_circuit = I_total / N
-
     ctype = cable_type_combo.get()
     arrangement = arrangement_combo.get()
-    results = []
-
-    for cable in cable_list:
-        code = cable["code"]
-        is_single_core = code.startswith("1x")
-
-        # filter by type
-        if (ctype == "Single-core" and not is_single_core) or (ctype == "Three-core" and is_single_core):
-            continue
-
-        # filter by voltage
-        if parse_voltage_kV(cable["voltage"]) < V:
-            continue
-
-        # check capacity
-        base_capacity = cable["fcc"] if is_single_core and arrangement == "Flat" else cable["tcc"]
-        if base_capacity is None:
-            continue
-
-        # apply derating
-        temp_factor = get_temp_factor(ambient)
-        cables_in_trench = N * 3 if is_single_core else N
-        trench_factor = get_trench_factor(min(cables_in_trench, 6))
-        derated_capacity = base_capacity * temp_factor * trench_factor
-
-        if derated_capacity >= I_per_circuit:
-            results.append((cable["id"], code, cable["voltage"], base_capacity, cable["price"]))
+    results = filter_cables(P, Q, V, N, ambient, ctype, arrangement)
+
+    # motor starting dip as an extra criterion for industrial feeders
+    motor = read_motor_inputs() if load_type == "Industrial" else None
+    if motor is not None:
+        # the feeder keeps carrying its load while the motor starts
+        dips = calc_motor_start_dips(results, N, arrangement, length, V, motor["lrc"], motor["start_pf"],
+                                     motor["source_r"], motor["source_x"], P, Q)
+        passing = [(c, d) for c, d in zip(results, dips) if motor["max_dip"] <= 0 or d <= motor["max_dip"]]
+        results = [c for c, _ in passing]
+        dips = [d for _, d in passing]
+    else:
+        dips = [None for _ in results]
+
+    length_table = calc_max_length_table(results, P, Q, V, max_c, arrangement, ambient, reg_limit)
+    if reg_limit > 0:
+        # the entered length must be within each cable's maximum; the Exact Voltage Drop option only
+        # switches the drop formula behind it. None: the drop never reaches the limit
+        passing = [(c, row, d) for c, row, d in zip(results, length_table, dips)
+                   if row[N - 1] is None or row[N - 1] >= length]
+        results = [c for c, _, _ in passing]
+        length_table = [row for _, row, _ in passing]
+        dips = [d for _, _, d in passing]
 
     # show results
     if results:
-        min_rating = min(parse_voltage_kV(r[2]) for r in results)
-        results = [r for r in results if parse_voltage_kV(r[2]) == min_rating]
-        min_price = min(r[4] for r in results)
+        min_price = min(c["price"] for c in results)
 
-        for idx, (cid, code, volt, cap, price) in enumerate(results):
-            tags = ["best"] if price == min_price else []
+        # lifecycle cost of every candidate in one pass
+        performance = [calc_performance(c, P, Q, V, N, arrangement, length, ambient, load_type)
+                       for c in results]
+        _, _, lifecycle = calc_lifecycle_costs([r["annual_loss_cost"] for r in performance],
+                                               [r["cable_installation_cost"] for r in performance])
+
+        for idx, (cable, row, life_cost, dip) in enumerate(zip(results, length_table, lifecycle, dips)):
+            tags = ["best"] if cable["price"] == min_price else []
             tags.append("oddrow" if idx % 2 == 0 else "evenrow")
-            tree.insert("", tk.END, values=(cid, code, volt, f"{price}"), tags=tags)
+            tree.insert("", tk.END, values=(cable["id"], cable["code"], cable["voltage"], f"{cable['price']}",
+                                            format_length(row[N - 1]), format_lengths(row), f"{life_cost:,.0f}",
+                                            "-" if dip is None else f"{dip:.2f}"), tags=tags)
+    apply_search()
 
 
 # GUI setup
@@ -499,6 +474,16 @@ ambient_spin = ttk.Spinbox(
 )
 ambient_spin.set("20")
 
+regulation_limit_label = ttk.Label(input_frame, text="Max Regulation (%):")
+regulation_limit_var = tk.StringVar(value="5")
+regulation_limit_spin = ttk.Entry(
+    input_frame,
+    textvariable=regulation_limit_var,
+    validate="key",
+    validatecommand=(root.register(_is_positive_float), "%P"),
+    width=15
+)
+
 # layout grid
 load_type_label.grid(row=0, column=0, sticky=tk.W, pady=5, padx=(0, 10))
 load_type_combo.grid(row=0, column=1, sticky=tk.W, pady=5, padx=(0, 20))
@@ -521,6 +506,47 @@ cable_length_spin.grid(row=1, column=5, sticky=tk.W, pady=5)
 ambient_label.grid(row=2, column=4, sticky=tk.W, pady=5, padx=(0, 10))
 ambient_spin.grid(row=2, column=5, sticky=tk.W, pady=5)
 
+regulation_limit_label.grid(row=3, column=0, sticky=tk.W, pady=5, padx=(0, 10))
+regulation_limit_spin.grid(row=3, column=1, sticky=tk.W, pady=5, padx=(0, 20))
+
+# motor starting (industrial feeders only)
+motor_frame = ttk.Labelframe(input_frame, text="Motor Starting (leave LRC empty to skip)", padding=10)
+motor_frame.grid(row=4, column=0, columnspan=6, sticky="ew", pady=(5, 0))
+
+motor_vars = {}
+for _idx, (_key, _text, _default) in enumerate((("lrc", "Locked-Rotor Current (A):", ""),
+                                                ("start_pf", "Starting PF:", "0.3"),
+                                                ("max_dip", "Max Start Dip (%):", "15"),
+                                                ("source_r", "Source R (Ω):", "0"),
+                                                ("source_x", "Source X (Ω):", "0"))):
+    motor_vars[_key] = tk.StringVar(value=_default)
+    ttk.Label(motor_frame, text=_text).grid(row=_idx // 3, column=(_idx % 3) * 2, sticky=tk.W, pady=3,
+                                            padx=(0, 10))
+    ttk.Entry(motor_frame, textvariable=motor_vars[_key], width=12, validate="key",
+              validatecommand=(root.register(_is_positive_float), "%P")).grid(
+        row=_idx // 3, column=(_idx % 3) * 2 + 1, sticky=tk.W, pady=3, padx=(0, 20))
+
+
+def read_motor_inputs():
+    try:
+        motor = {key: float(var.get().replace(',', '.')) for key, var in motor_vars.items()}
+    except ValueError:
+        return None
+    if motor["lrc"] <= 0 or not 0 < motor["start_pf"] <= 1:
+        return None
+    return motor
+
+
+def on_load_type_change(event=None):
+    if load_type_combo.get() == "Industrial":
+        motor_frame.grid()
+    else:
+        motor_frame.grid_remove()
+    root.after(100, auto_filter_cables)
+
+
+load_type_combo.bind("<<ComboboxSelected>>", on_load_type_change)
+
 input_frame.columnconfigure(1, weight=1, minsize=150)
 input_frame.columnconfigure(3, weight=1, minsize=150)
 input_frame.columnconfigure(5, weight=1, minsize=150)
@@ -579,7 +605,20 @@ result_frame = ttk.Frame(root, padding=15)
 result_frame.grid(row=2, column=0, padx=15, pady=(0, 15), sticky="nsew")
 root.rowconfigure(2, weight=1)
 
-columns = ("ID", "Code", "Voltage", "Price (TL/km)")
+# search box over the results
+search_frame = ttk.Frame(result_frame)
+search_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 8))
+ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+search_var = tk.StringVar()
+search_state = {"detached": []}
+search_entry = ttk.Entry(search_frame, textvariable=search_var, width=40)
+search_entry.pack(side=tk.LEFT)
+search_count_label = ttk.Label(search_frame, text="")
+search_count_label.pack(side=tk.LEFT, padx=10)
+search_var.trace_add("write", apply_search)
+
+columns = ("ID", "Code", "Voltage", "Price (TL/km)", "Max Length (km)", "By Circuits N=1.. (km)",
+           "Lifecycle Cost (TL)", "Start Dip (%)")
 tree = ttk.Treeview(result_frame, columns=columns, show="headings", height=6)
 
 normal_fg = style.colors.fg
@@ -595,6 +634,10 @@ tree.column("ID", anchor="center", width=80)
 tree.column("Code", anchor="center", width=150)
 tree.column("Voltage", anchor="center", width=120)
 tree.column("Price (TL/km)", anchor="center", width=150)
+tree.column("Max Length (km)", anchor="center", width=130)
+tree.column("By Circuits N=1.. (km)", anchor="center", width=190)
+tree.column("Lifecycle Cost (TL)", anchor="center", width=150)
+tree.column("Start Dip (%)", anchor="center", width=100)
 
 style.configure("Treeview", rowheight=20)
 
@@ -649,8 +692,14 @@ derated_capacity_label.grid(row=0, column=1, sticky=tk.W, pady=1)
 safety_margin_label = ttk.Label(capacity_main_frame, text="Safety Margin: - %")
 safety_margin_label.grid(row=1, column=1, sticky=tk.W, pady=1)
 
+cyclic_rating_label = ttk.Label(capacity_main_frame, text="Cyclic Rating: - A")
+cyclic_rating_label.grid(row=2, column=0, sticky=tk.W, pady=1, padx=(0, 15))
+
+emergency_time_label = ttk.Label(capacity_main_frame, text="Emergency (N-1): -")
+emergency_time_label.grid(row=2, column=1, sticky=tk.W, pady=1)
+
 capacity_status_label = ttk.Label(capacity_main_frame, text="Status: -", font=("TkDefaultFont", 10, "bold"))
-capacity_status_label.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=1)
+capacity_status_label.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=1)
 
 cable_capacity_container.columnconfigure(0, weight=1)
 cable_capacity_container.columnconfigure(1, weight=1)
@@ -757,8 +806,22 @@ def show_log_window(log_content):
 
 def sort_tree(col, descending=False):
     rows = [(tree.set(iid, col), iid) for iid in tree.get_children('')]
-    if col in ("Capacity (A)", "Price (TL/km)"):
-        rows = [(float(txt.replace(',', '')), iid) for txt, iid in rows]
+    if col in ("Capacity (A)", "Price (TL/km)", "Lifecycle Cost (TL)"):
+        parsed = []
+        for txt, iid in rows:
+            try:
+                parsed.append((float(txt.replace(',', '')), iid))
+            except ValueError:
+                parsed.append((float("inf"), iid))
+        rows = parsed
+    elif col in ("Max Length (km)", "Start Dip (%)"):
+        parsed = []
+        for txt, iid in rows:
+            try:
+                parsed.append((float(txt), iid))
+            except ValueError:
+                parsed.append((float("inf"), iid))
+        rows = parsed
     elif col == "Voltage":
         parsed = []
         for txt, iid in rows:
@@ -810,6 +873,8 @@ def update_cable_display():
         derated_capacity_label.config(text="Derated Capacity: - A")
         current_per_circuit_label.config(text="Current per Circuit: - A")
         safety_margin_label.config(text="Safety Margin: - %")
+        cyclic_rating_label.config(text="Cyclic Rating: - A")
+        emergency_time_label.config(text="Emergency (N-1): -")
         capacity_status_label.config(text="Status: -", foreground="white")
         capacity_main_frame.config(text="Capacity Check")
         try:
@@ -848,12 +913,10 @@ def update_cable_display():
     capacitance_label.config(text=f"Capacitance: {cap_value} μF/km")
 
     # capacity calculations
-    if cable['code'].startswith('1x'):
-        base_capacity = cable['fcc'] if arrangement == "Flat" else cable['tcc']
-    else:
-        base_capacity = cable['tcc']
+    base_capacity = get_base_capacity(cable, arrangement)
 
-    base_capacity_label.config(text=f"Base Capacity: {base_capacity} A")
+    base_capacity_label.config(text="Base Capacity: - A" if base_capacity is None else
+                               f"Base Capacity: {base_capacity:.0f} A")
 
     try:
         P = float(active_power_var.get()) or 0.0
@@ -873,14 +936,36 @@ def update_cable_display():
         trench_factor = get_trench_factor(min(cables_in_trench, 6))
         derated_capacity = base_capacity * temp_factor * trench_factor
 
+        # transient ratings: daily cycle, and losing one of N parallel circuits
+        network = build_thermal_networks([cable], [derated_capacity], ambient)
+        cyclic_factor = get_cyclic_factors([cable], [derated_capacity], ambient)[0]
+        rated_capacity = derated_capacity
+        if transient_settings["use_cyclic_rating"] and cyclic_factor:
+            rated_capacity = derated_capacity * cyclic_factor
+        if N > 1 and derated_capacity > 0:
+            I_emergency = I_total / (N - 1)
+            hours = calc_emergency_times(network, [I_per_circuit / derated_capacity],
+                                         [I_emergency / derated_capacity])[0]
+            if I_emergency <= derated_capacity:
+                emergency_text = f"Emergency (N-1): {I_emergency:.0f} A, continuous"
+            elif hours is None:
+                emergency_text = f"Emergency (N-1): {I_emergency:.0f} A, > {transient_settings['emergency_hours']} h"
+            else:
+                emergency_text = f"Emergency (N-1): {I_emergency:.0f} A, {hours:.2f} h to max"
+        else:
+            emergency_text = "Emergency (N-1): -"
+
         # safety margin
-        safety_margin = ((derated_capacity - I_per_circuit) / derated_capacity * 100) if derated_capacity > 0 else 0
+        safety_margin = ((rated_capacity - I_per_circuit) / rated_capacity * 100) if rated_capacity > 0 else 0
 
         derated_capacity_label.config(text=f"Derated Capacity: {derated_capacity:.1f} A")
         current_per_circuit_label.config(text=f"Current per Circuit: {I_per_circuit:.1f} A")
         safety_margin_label.config(text=f"Safety Margin: {safety_margin:.1f}%")
+        cyclic_rating_label.config(text="Cyclic Rating: - A" if not cyclic_factor else
+                                   f"Cyclic Rating: {derated_capacity * cyclic_factor:.1f} A (M = {cyclic_factor:.3f})")
+        emergency_time_label.config(text=emergency_text)
 
-        if I_per_circuit <= derated_capacity:
+        if I_per_circuit <= rated_capacity:
             capacity_status_label.config(text="Status: Valid", foreground="#00ff00")
         else:
             capacity_status_label.config(text="Status: Invalid", foreground="#ff0000")
@@ -889,6 +974,8 @@ def update_cable_display():
         derated_capacity_label.config(text="Derated Capacity: - A")
         current_per_circuit_label.config(text="Current per Circuit: - A")
         safety_margin_label.config(text="Safety Margin: - %")
+        cyclic_rating_label.config(text="Cyclic Rating: - A")
+        emergency_time_label.config(text="Emergency (N-1): -")
         capacity_status_label.config(text="Status: -", foreground="white")
 
     calc_button.config(state="normal")
@@ -914,6 +1001,9 @@ active_power_var.trace_add('write', on_input_change)
 reactive_power_var.trace_add('write', on_input_change)
 voltage_var.trace_add('write', on_input_change)
 cable_length_var.trace_add('write', on_input_change)
+regulation_limit_var.trace_add('write', on_input_change)
+for _var in motor_vars.values():
+    _var.trace_add('write', on_input_change)
 
 
 def on_spinbox_change(event=None):
@@ -948,96 +1038,51 @@ def calculate_losses_and_regulation():
     load_type = load_type_combo.get()
     arrangement = arrangement_combo.get()
 
-    # main calcs
-    S_MVA = math.sqrt(P ** 2 + Q ** 2)
-    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
-    I_per_circuit = I_total / N
-
-    cos_phi = P / S_MVA if S_MVA > 0 else 1.0
-    sin_phi = Q / S_MVA if S_MVA > 0 else 0.0
+    r = calc_performance(cable, P, Q, V, N, arrangement, length, ambient, load_type)
+    if result_store["enabled"]:
+        record_result("calculation", None, read_form_inputs(), dict(r, cable_id=cable["id"]))
+        flush_result_store()
 
-    # cable params
-    R = cable['resistance']  # ohm/km
-    if cable['code'].startswith('1x'):
-        L = (cable['inductance_flat'] if arrangement == "Flat" and cable['inductance_flat']
-             else cable['inductance_trefoil']) or 0.3
-    else:
-        L = cable['inductance_trefoil'] or 0.3
+    # update display
+    voltage_reg_value.config(text=f"{r['voltage_regulation_percent']:.3f}% ({r['voltage_drop_volts']:.1f}V drop)")
+    years = economic_settings["years"]
+    energy_cost_head.config(text=f"{years}-Year Energy Loss Cost (PV):")
+    total_cost_head.config(text=f"{years}-Year Lifecycle Cost:")
+    energy_cost_value.config(text=f"{r['energy_loss_cost_pv']:,.0f} TL")
+    cable_cost_value.config(text=f"{r['cable_installation_cost']:,.0f} TL")
+    total_cost_value.config(text=f"{r['lifecycle_cost']:,.0f} TL")
 
-    X = 2 * math.pi * 50 * L / 1000  # reactance at 50Hz
+    summary_frame.grid()
 
-    # capacity check
-    if cable['code'].startswith('1x'):
-        base_capacity = cable['fcc'] if arrangement == "Flat" else cable['tcc']
+    # cost breakdown
+    lifecycle_cost = r['lifecycle_cost']
+    cable_percent = r['cable_installation_cost'] / lifecycle_cost * 100 if lifecycle_cost > 0 else 0
+    energy_percent = r['energy_loss_cost_pv'] / lifecycle_cost * 100 if lifecycle_cost > 0 else 0
+
+    if not thermal_settings["enabled"]:
+        thermal_text = "not modelled (catalog resistance used)"
+    elif r['thermal_converged']:
+        thermal_text = f"{r['conductor_temp']:.1f}°C (converged in {r['thermal_iterations']} iterations)"
     else:
-        base_capacity = cable['tcc']
-
-    temp_factor = get_temp_factor(ambient)
-    cables_in_trench = N * 3 if cable['code'].startswith('1x') else N
-    trench_factor = get_trench_factor(min(cables_in_trench, 6))
-    derated_capacity = base_capacity * temp_factor * trench_factor
-
-    capacity_check = "PASS" if I_per_circuit <= derated_capacity else "FAIL"
-    capacity_margin = ((derated_capacity - I_per_circuit) / derated_capacity * 100) if derated_capacity > 0 else 0
-
-    # power losses
-    I_per_circuit_A = I_per_circuit
-
-    if cable['code'].startswith('1x'):  # single core
-        P_loss_per_circuit_kW = 3 * (I_per_circuit_A ** 2) * R * length / 1000
-        Q_loss_per_circuit_kVar = 3 * (I_per_circuit_A ** 2) * X * length / 1000
-    else:  # three core
-        P_loss_per_circuit_kW = 3 * (I_per_circuit_A ** 2) * R * length / 1000
-        Q_loss_per_circuit_kVar = 3 * (I_per_circuit_A ** 2) * X * length / 1000
-
-    # total losses
-    P_loss_total_kW = P_loss_per_circuit_kW * N
-    Q_loss_total_kVar = Q_loss_per_circuit_kVar * N
-
-    P_loss_MW = P_loss_total_kW / 1000
-    Q_loss_MVar = Q_loss_total_kVar / 1000
-
-    # voltage regulation
-    VLN_volts = V * 1000 / math.sqrt(3)
-
-    voltage_regulation_percent = (I_per_circuit * R * cos_phi + I_per_circuit * X * sin_phi) * length / VLN_volts * 100
-
-    voltage_drop_volts = (I_per_circuit * R * cos_phi + I_per_circuit * X * sin_phi) * length
+        thermal_text = f"{r['conductor_temp']:.1f}°C (NOT converged - thermal runaway, cable overloaded)"
 
-    terminal_voltage_ll = V * 1000 - voltage_drop_volts * math.sqrt(3)
-
-    theta = math.acos(cos_phi)
-
-    # economics
-    electricity_price = 2500  # TL/MWh
-    hours_per_day = {"Industrial": 10, "Residential": 5, "Municipal": 12, "Commercial": 8}
-    daily_hours = hours_per_day.get(load_type, 8)
-    annual_hours = daily_hours * 365
-
-    annual_energy_loss_MWh = P_loss_MW * annual_hours
-    energy_loss_cost_10yr = annual_energy_loss_MWh * 10 * electricity_price
-
-    # cable cost
-    cable_cost_per_km = cable['price']
-    if cable['code'].startswith('1x'):  # single core: need 3 cables per circuit
-        total_cable_length = length * N * 3
-    else:  # three core: 1 cable per circuit
-        total_cable_length = length * N
-
-    cable_installation_cost = cable_cost_per_km * total_cable_length
-    total_cost_10yr = energy_loss_cost_10yr + cable_installation_cost
-
-    # update display
-    voltage_reg_value.config(text=f"{voltage_regulation_percent:.3f}% ({voltage_drop_volts:.1f}V drop)")
-    energy_cost_value.config(text=f"{energy_loss_cost_10yr:,.0f} TL")
-    cable_cost_value.config(text=f"{cable_installation_cost:,.0f} TL")
-    total_cost_value.config(text=f"{total_cost_10yr:,.0f} TL")
+    if r['exact_terminal_voltage_ll'] is None:
+        exact_voltage_text = "no solution - load beyond the cable's maximum transfer (voltage collapse)"
+        exact_regulation_text = "-"
+    else:
+        exact_voltage_text = f"{r['exact_terminal_voltage_ll']:.1f} V (constant-power load, pi model with shunt C)"
+        exact_regulation_text = (f"{r['exact_regulation_percent']:.3f}% "
+                                 f"(approximation error {r['regulation_error_percent']:+.3f} points)")
 
-    summary_frame.grid()
+    if r['sheath_loss_factor'] > 0:
+        sheath_text = f"{r['sheath_loss_factor']:.4f} of conductor loss ({sheath_settings['bonding'].lower()} bonding)"
+    else:
+        sheath_text = "none"
 
-    # cost breakdown
-    cable_percent = cable_installation_cost / total_cost_10yr * 100 if total_cost_10yr > 0 else 0
-    energy_percent = energy_loss_cost_10yr / total_cost_10yr * 100 if total_cost_10yr > 0 else 0
+    if r['cyclic_factor']:
+        rating_text = f"Cyclic Rating: {r['rated_capacity']:.1f} A (M = {r['cyclic_factor']:.3f}, daily load cycle)"
+    else:
+        rating_text = "Rating Basis: continuous"
 
     # detailed log
     result_output = f"""
@@ -1049,44 +1094,54 @@ SELECTED CABLE: {cable['code']} - {cable['voltage']}
 Cable Length: {length} km | Parallel Circuits: {N} | Arrangement: {arrangement} | Load Type: {load_type}
 
 ELECTRICAL PARAMETERS:
-├─ Resistance (R): {R} Ω/km
-├─ Inductance (L): {L} mH/km  
-└─ Reactance (X): {X:.4f} Ω/km (at 50Hz)
+├─ Resistance (R): {r['R']} Ω/km (at {thermal_settings['reference_temp']:.0f}°C)
+├─ Conductor Temperature: {thermal_text}
+├─ Resistance at Operating Temp: {r['R_op']:.4f} Ω/km
+├─ Inductance (L): {r['L']} mH/km  
+└─ Reactance (X): {r['X']:.4f} Ω/km (at 50Hz)
 
 LOAD CONDITIONS:
 ├─ Active Power (P): {P} MW
 ├─ Reactive Power (Q): {Q} MVar
-├─ Apparent Power: {S_MVA:.3f} MVA
-├─ Power Factor: {cos_phi:.3f}
-├─ Total Current: {I_total:.1f} A
-└─ Current per Circuit: {I_per_circuit:.1f} A
+├─ Apparent Power: {r['S_MVA']:.3f} MVA
+├─ Power Factor: {r['cos_phi']:.3f}
+├─ Total Current: {r['I_total']:.1f} A
+└─ Current per Circuit: {r['I_per_circuit']:.1f} A
 
 LINE LOSSES:
-├─ Active Power Loss: {P_loss_total_kW:.3f} kW ({P_loss_MW / P * 100:.2f}% of load)
-└─ Reactive Power Loss: {Q_loss_total_kVar:.3f} kVar ({Q_loss_MVar / Q * 100:.2f}% of load)
+├─ Active Power Loss: {r['P_loss_total_kW']:.3f} kW ({r['P_loss_total_kW'] / 1000 / P * 100:.2f}% of load)
+├─ Reactive Power Loss: {r['Q_loss_total_kVar']:.3f} kVar ({r['Q_loss_total_kVar'] / 1000 / Q * 100:.2f}% of load)
+└─ Screen Loss Factor: {sheath_text}
 
 CAPACITY CHECK:
-├─ Base Capacity: {base_capacity} A
-├─ Temperature Factor: {temp_factor:.2f}
-├─ Trench Factor: {trench_factor:.2f}
-├─ Derated Capacity: {derated_capacity:.1f} A
-├─ Current per Circuit: {I_per_circuit:.1f} A
-├─ Status: {capacity_check}
-└─ Safety Margin: {capacity_margin:.1f}%
+├─ Base Capacity: {r['base_capacity']} A
+├─ Temperature Factor: {r['temp_factor']:.2f}
+├─ Trench Factor: {r['trench_factor']:.2f}
+├─ Derated Capacity: {r['derated_capacity']:.1f} A
+├─ {rating_text}
+├─ Current per Circuit: {r['I_per_circuit']:.1f} A
+├─ Status: {r['capacity_check']}
+└─ Safety Margin: {r['capacity_margin']:.1f}%
 
 VOLTAGE REGULATION (Formula: VR = (I×R×cos φ + I×X×sin φ)×L / VLN×100%):
-├─ Power Factor Angle (θ): {math.degrees(theta):.2f}°
-├─ Voltage Drop (L-N): {voltage_drop_volts:.1f} V
-├─ Voltage Regulation: {voltage_regulation_percent:.3f}%
-└─ Terminal Voltage (L-L): {terminal_voltage_ll:.1f} V
-
-ECONOMIC ANALYSIS (10-Year Period):
-├─ Operating Hours: {daily_hours} hours/day ({annual_hours} hours/year)
-├─ Annual Energy Loss: {annual_energy_loss_MWh:.2f} MWh
-├─ Electricity Price: {electricity_price} TL/MWh
-├─ 10-Year Energy Loss Cost: {energy_loss_cost_10yr:,.0f} TL
-├─ Cable Installation Cost: {cable_installation_cost:,.0f} TL
-└─ TOTAL 10-YEAR COST: {total_cost_10yr:,.0f} TL
+├─ Power Factor Angle (θ): {math.degrees(r['theta']):.2f}°
+├─ Voltage Drop (L-N): {r['voltage_drop_volts']:.1f} V
+├─ Voltage Regulation: {r['voltage_regulation_percent']:.3f}%
+├─ Terminal Voltage (L-L): {r['terminal_voltage_ll']:.1f} V
+├─ Exact Terminal Voltage (L-L): {exact_voltage_text}
+└─ Exact Regulation: {exact_regulation_text}
+
+ECONOMIC ANALYSIS ({years}-Year Lifecycle):
+├─ Operating Hours: {r['daily_hours']} hours/day ({r['annual_hours']} hours/year)
+├─ Annual Energy Loss (Year 1): {r['annual_energy_loss_MWh']:.2f} MWh
+├─ Electricity Price (Year 1): {r['electricity_price']} TL/MWh
+├─ Discount Rate: {economic_settings['discount_rate'] * 100:.2f}%
+├─ Load Growth: {economic_settings['load_growth'] * 100:.2f}%/year
+├─ Energy Price Escalation: {economic_settings['price_escalation'] * 100:.2f}%/year
+├─ Energy Loss Cost (PV): {r['energy_loss_cost_pv']:,.0f} TL
+├─ Cable Installation Cost: {r['cable_installation_cost']:,.0f} TL
+├─ Residual Value (PV): -{r['residual_value_pv']:,.0f} TL
+└─ TOTAL LIFECYCLE COST: {lifecycle_cost:,.0f} TL
 
 COST BREAKDOWN:
 ├─ Cable Cost: {cable_percent:.1f}%
@@ -1103,6 +1158,1616 @@ COST BREAKDOWN:
 calc_button.config(command=calculate_losses_and_regulation)
 
 
+def show_pareto_window():
+    try:
+        length = float(cable_length_var.get()) or 1.0
+        P = float(active_power_var.get()) or 0.0
+        Q = float(reactive_power_var.get()) or 0.0
+        V = float(voltage_var.get()) or 0.0
+        ambient = float(ambient_spin.get()) or 20.0
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+    if P <= 0 or V <= 0:
+        messagebox.showerror("Invalid Input", "Active power and system voltage must be positive.")
+        return
+
+    frontier = calc_pareto_frontier(P, Q, V, length, ambient, load_type_combo.get())
+    if not frontier:
+        messagebox.showinfo("Pareto Frontier", "No cable configuration can carry this load.")
+        return
+
+    pareto_window = tk.Toplevel(root)
+    pareto_window.title("Pareto Frontier - Cost / Regulation / Losses")
+    pareto_window.geometry("900x550")
+    pareto_window.transient(root)
+
+    pareto_frame = ttk.Frame(pareto_window, padding=15)
+    pareto_frame.pack(fill=tk.BOTH, expand=True)
+
+    filter_frame = ttk.Labelframe(pareto_frame, text="Frontier Filter", padding=10)
+    filter_frame.pack(fill=tk.X, pady=(0, 10))
+
+    pareto_columns = ("Code", "Voltage", "Arrangement", "Circuits", "Installation (TL)",
+                      "Regulation (%)", "Losses (kW)", "Lifecycle Cost (TL)")
+    pareto_tree = ttk.Treeview(pareto_frame, columns=pareto_columns, show="headings", height=12)
+    for col in pareto_columns:
+        pareto_tree.heading(col, text=col)
+        pareto_tree.column(col, anchor="center", width=105)
+    pareto_tree.tag_configure("oddrow", background="#2a2a2a", foreground="#ffffff")
+    pareto_tree.tag_configure("evenrow", background="#3a3a3a", foreground="#ffffff")
+
+    # one slider per objective, each limited to the range spanned by the frontier
+    objectives = [("Max Installation (TL)", "cable_installation_cost"),
+                  ("Max Regulation (%)", "voltage_regulation_percent"),
+                  ("Max Losses (kW)", "P_loss_total_kW")]
+    limit_vars = {}
+    limit_labels = {}
+
+    def refresh(*args):
+        for item in pareto_tree.get_children():
+            pareto_tree.delete(item)
+        shown = [c for c in frontier
+                 if all(c["result"][key] <= limit_vars[key].get() for _, key in objectives)]
+        shown.sort(key=lambda c: c["result"]["cable_installation_cost"])
+        for idx, c in enumerate(shown):
+            r = c["result"]
+            pareto_tree.insert("", tk.END, values=(
+                c["cable"]["code"], c["cable"]["voltage"], c["arrangement"], c["N"],
+                f"{r['cable_installation_cost']:,.0f}", f"{r['voltage_regulation_percent']:.3f}",
+                f"{r['P_loss_total_kW']:.3f}", f"{r['lifecycle_cost']:,.0f}"),
+                tags=["oddrow" if idx % 2 == 0 else "evenrow"])
+        for text, key in objectives:
+            limit_labels[key].config(text=f"{text}: {limit_vars[key].get():,.3f}")
+        pareto_status.config(text=f"Showing {len(shown)} of {len(frontier)} non-dominated configurations")
+
+    for col_idx, (text, key) in enumerate(objectives):
+        values = [c["result"][key] for c in frontier]
+        limit_vars[key] = tk.DoubleVar(value=max(values))
+        limit_labels[key] = ttk.Label(filter_frame, text=text)
+        limit_labels[key].grid(row=0, column=col_idx, sticky=tk.W, padx=(0, 20))
+        ttk.Scale(filter_frame, from_=min(values), to=max(values), variable=limit_vars[key],
+                  command=refresh, length=220).grid(row=1, column=col_idx, sticky=tk.W, padx=(0, 20))
+
+    pareto_status = ttk.Label(pareto_frame, text="")
+    pareto_tree.pack(fill=tk.BOTH, expand=True)
+    pareto_status.pack(anchor=tk.W, pady=(10, 0))
+
+    refresh()
+
+
+def read_form_inputs():
+    return {
+        "load_type": load_type_combo.get(),
+        "cable_type": cable_type_combo.get(),
+        "arrangement": arrangement_combo.get(),
+        "P": float(active_power_var.get().replace(',', '.')) or 0.0,
+        "Q": float(reactive_power_var.get().replace(',', '.')) or 0.0,
+        "V": float(voltage_var.get().replace(',', '.')) or 0.0,
+        "N": int(circuits_spin.get()) or 1,
+        "length": float(cable_length_var.get().replace(',', '.')) or 1.0,
+        "ambient": float(ambient_spin.get()) or 20.0,
+    }
+
+
+def apply_form_inputs(inputs):
+    load_type_combo.set(inputs["load_type"])
+    cable_type_combo.set(inputs["cable_type"])
+    arrangement_combo.set(inputs["arrangement"])
+    active_power_var.set(str(inputs["P"]))
+    reactive_power_var.set(str(inputs["Q"]))
+    voltage_var.set(str(inputs["V"]))
+    circuits_spin.set(str(inputs["N"]))
+    cable_length_var.set(str(inputs["length"]))
+    ambient_spin.set(str(inputs["ambient"]))
+    on_cable_type_change()
+
+
+def open_project_dialog(parent=None):
+    path = filedialog.askopenfilename(parent=parent or root, title="Open Project",
+                                      filetypes=[("Cable project", "*.json"), ("All files", "*.*")])
+    if not path:
+        return None
+    try:
+        recomputed = load_project(path)
+    except (OSError, ValueError, KeyError) as e:
+        messagebox.showerror("Open Error", f"Failed to open project: {str(e)}")
+        return None
+    return recomputed
+
+
+def save_project_dialog(parent=None):
+    path = project["path"] or filedialog.asksaveasfilename(parent=parent or root, title="Save Project",
+                                                           defaultextension=".json",
+                                                           filetypes=[("Cable project", "*.json")])
+    if not path:
+        return
+    try:
+        save_project(path)
+    except OSError as e:
+        messagebox.showerror("Save Error", f"Failed to save project: {str(e)}")
+
+
+def show_project_window():
+    project_window = tk.Toplevel(root)
+    project_window.title("Project Feeders")
+    project_window.geometry("1000x500")
+    project_window.transient(root)
+
+    project_frame = ttk.Frame(project_window, padding=15)
+    project_frame.pack(fill=tk.BOTH, expand=True)
+
+    feeder_columns = ("Feeder", "Cable", "Voltage", "Circuits", "Length (km)", "Regulation (%)",
+                      "Losses (kW)", "Lifecycle Cost (TL)", "Status")
+    feeder_tree = ttk.Treeview(project_frame, columns=feeder_columns, show="headings", height=14)
+    for col in feeder_columns:
+        feeder_tree.heading(col, text=col)
+        feeder_tree.column(col, anchor="center", width=105)
+    feeder_tree.tag_configure("oddrow", background="#2a2a2a", foreground="#ffffff")
+    feeder_tree.tag_configure("evenrow", background="#3a3a3a", foreground="#ffffff")
+    feeder_tree.pack(fill=tk.BOTH, expand=True)
+
+    project_status = ttk.Label(project_frame, text="")
+    project_status.pack(anchor=tk.W, pady=(10, 0))
+
+    def refresh(recomputed=None):
+        for item in feeder_tree.get_children():
+            feeder_tree.delete(item)
+        cables = {c["id"]: c for c in cable_list}
+        for idx, feeder in enumerate(project["feeders"]):
+            r = feeder.get("result") or {}
+            cable = cables.get(r.get("cable_id"))
+            inputs = feeder["inputs"]
+            if cable is None:
+                values = (feeder["name"], "-", "-", inputs["N"], inputs["length"], "-", "-", "-", "NO CABLE")
+            else:
+                values = (feeder["name"], cable["code"], cable["voltage"], inputs["N"], inputs["length"],
+                          f"{r['voltage_regulation_percent']:.3f}", f"{r['P_loss_total_kW']:.3f}",
+                          f"{r['lifecycle_cost']:,.0f}", r["capacity_check"])
+            feeder_tree.insert("", tk.END, iid=str(idx), values=values,
+                               tags=["oddrow" if idx % 2 == 0 else "evenrow"])
+        text = f"{len(project['feeders'])} feeders"
+        if project["path"]:
+            text += f" | {project['path']}"
+        if recomputed is not None:
+            text += f" | recalculated {recomputed}"
+        project_status.config(text=text)
+
+    def selected_index():
+        selection = feeder_tree.selection()
+        return int(selection[0]) if selection else None
+
+    def add_feeder():
+        try:
+            inputs = read_form_inputs()
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check your input values.", parent=project_window)
+            return
+        name = simpledialog.askstring("Add Feeder", "Feeder name:", parent=project_window,
+                                      initialvalue=f"Feeder {len(project['feeders']) + 1}")
+        if not name:
+            return
+        cable = selected_cable["data"]
+        project["feeders"].append({"name": name, "inputs": inputs,
+                                   "cable_id": cable["id"] if cable else None, "result": None, "deps": None})
+        refresh(recompute_project(project["feeders"]))
+
+    def update_feeder():
+        idx = selected_index()
+        if idx is None:
+            return
+        try:
+            inputs = read_form_inputs()
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check your input values.", parent=project_window)
+            return
+        feeder = project["feeders"][idx]
+        feeder["inputs"] = inputs
+        feeder["cable_id"] = selected_cable["data"]["id"] if selected_cable["data"] else None
+        refresh(recompute_project(project["feeders"]))
+
+    def load_feeder():
+        idx = selected_index()
+        if idx is not None:
+            apply_form_inputs(project["feeders"][idx]["inputs"])
+
+    def remove_feeder():
+        idx = selected_index()
+        if idx is not None:
+            del project["feeders"][idx]
+            refresh()
+
+    def edit_price():
+        idx = selected_index()
+        initial = None
+        if idx is not None:
+            initial = (project["feeders"][idx].get("result") or {}).get("cable_id")
+        cable_id = simpledialog.askinteger("Edit Price", "Cable ID:", parent=project_window,
+                                           initialvalue=initial, minvalue=1)
+        if cable_id is None:
+            return
+        cable = next((c for c in cable_list if c["id"] == cable_id), None)
+        if cable is None:
+            messagebox.showerror("Edit Price", f"Unknown cable id: {cable_id}", parent=project_window)
+            return
+        price = simpledialog.askfloat("Edit Price", f"Price for {cable['code']} - {cable['voltage']} (TL/km):",
+                                      parent=project_window, initialvalue=cable["price"], minvalue=0)
+        if price is None:
+            return
+        set_cable_price(cable_id, price)
+        refresh(recompute_project(project["feeders"]))
+        auto_filter_cables()
+
+    def open_project():
+        recomputed = open_project_dialog(project_window)
+        if recomputed is not None:
+            refresh(recomputed)
+            auto_filter_cables()
+
+    def save_project_as():
+        project["path"] = None
+        save_project_dialog(project_window)
+        refresh()
+
+    project_button_frame = ttk.Frame(project_frame)
+    project_button_frame.pack(fill=tk.X, pady=(10, 0))
+    for text, command, btn_style in (("Add from Form", add_feeder, "success.TButton"),
+                                     ("Update from Form", update_feeder, "info.TButton"),
+                                     ("Load into Form", load_feeder, "info.TButton"),
+                                     ("Remove", remove_feeder, "danger.TButton"),
+                                     ("Edit Price...", edit_price, "secondary.TButton"),
+                                     ("Open...", open_project, "secondary.TButton"),
+                                     ("Save", lambda: (save_project_dialog(project_window), refresh()),
+                                      "secondary.TButton"),
+                                     ("Save As...", save_project_as, "secondary.TButton")):
+        ttk.Button(project_button_frame, text=text, command=command, style=btn_style).pack(side=tk.LEFT, padx=(0, 8))
+
+    refresh()
+
+
+def show_result_store_window():
+    store_window = tk.Toplevel(root)
+    store_window.title("Result Store")
+    store_window.geometry("900x550")
+    store_window.transient(root)
+
+    store_frame = ttk.Frame(store_window, padding=15)
+    store_frame.pack(fill=tk.BOTH, expand=True)
+
+    top_frame = ttk.Frame(store_frame)
+    top_frame.pack(fill=tk.X)
+
+    enabled_var = tk.BooleanVar(value=result_store["enabled"])
+    path_label = ttk.Label(top_frame, text=f"Database: {result_store['path']}")
+
+    def toggle_store():
+        try:
+            if enabled_var.get():
+                open_result_store(result_store["path"])
+            else:
+                close_result_store()
+        except sqlite3.Error as e:
+            enabled_var.set(False)
+            messagebox.showerror("Result Store", f"Failed to open database: {str(e)}", parent=store_window)
+
+    def choose_path():
+        path = filedialog.asksaveasfilename(parent=store_window, title="Result Database",
+                                            defaultextension=".db", confirmoverwrite=False,
+                                            filetypes=[("SQLite database", "*.db"), ("All files", "*.*")])
+        if not path:
+            return
+        result_store["path"] = path
+        path_label.config(text=f"Database: {path}")
+        if enabled_var.get():
+            toggle_store()
+
+    ttk.Checkbutton(top_frame, text="Store every calculation", variable=enabled_var,
+                    command=toggle_store).pack(side=tk.LEFT, padx=(0, 15))
+    path_label.pack(side=tk.LEFT, padx=(0, 10))
+    ttk.Button(top_frame, text="Change...", command=choose_path, style="secondary.TButton").pack(side=tk.LEFT)
+
+    query_frame = ttk.Frame(store_frame)
+    query_frame.pack(fill=tk.X, pady=(10, 0))
+
+    query_combo = ttk.Combobox(query_frame, values=list(result_store_queries), state="readonly", width=40)
+    query_combo.pack(side=tk.LEFT, padx=(0, 10))
+
+    sql_text = tk.Text(store_frame, height=4, font=("Consolas", 9), background="#1a1a1a", foreground="#ffffff",
+                       insertbackground="#ffffff", wrap=tk.WORD)
+    sql_text.pack(fill=tk.X, pady=(10, 0))
+
+    results_view = ttk.Treeview(store_frame, show="headings", height=12)
+    results_view.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+    store_status = ttk.Label(store_frame, text="")
+    store_status.pack(anchor=tk.W, pady=(10, 0))
+
+    def on_query_select(event=None):
+        sql_text.delete("1.0", tk.END)
+        sql_text.insert("1.0", result_store_queries[query_combo.get()])
+
+    def run_query():
+        if result_store["conn"] is None:
+            messagebox.showinfo("Result Store", "Enable the result store first.", parent=store_window)
+            return
+        sql = sql_text.get("1.0", tk.END).strip()
+        if not sql.lower().startswith("select"):
+            messagebox.showerror("Result Store", "Only SELECT queries can be run here.", parent=store_window)
+            return
+        started = time.perf_counter()
+        try:
+            columns, rows = query_result_store(sql)
+        except sqlite3.Error as e:
+            messagebox.showerror("Query Error", str(e), parent=store_window)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        results_view.delete(*results_view.get_children())
+        results_view.configure(columns=columns)
+        for col in columns:
+            results_view.heading(col, text=col)
+            results_view.column(col, anchor="center", width=110)
+        for row in rows:
+            results_view.insert("", tk.END, values=[f"{v:,.3f}" if isinstance(v, float) else v for v in row])
+        store_status.config(text=f"{len(rows)} rows in {elapsed_ms:.1f} ms")
+
+    query_combo.bind("<<ComboboxSelected>>", on_query_select)
+    ttk.Button(query_frame, text="Run Query", command=run_query, style="success.TButton").pack(side=tk.LEFT)
+    query_combo.current(0)
+    on_query_select()
+
+
+def show_cache_window():
+    cache_window = tk.Toplevel(root)
+    cache_window.title("Result Cache")
+    cache_window.geometry("560x330")
+    cache_window.transient(root)
+
+    cache_frame = ttk.Frame(cache_window, padding=15)
+    cache_frame.pack(fill=tk.BOTH, expand=True)
+
+    enabled_var = tk.BooleanVar(value=result_cache["enabled"])
+    path_frame = ttk.Frame(cache_frame)
+    path_label = ttk.Label(path_frame, text=f"Cache file: {result_cache['path']}")
+    size_var = tk.StringVar(value=str(result_cache["max_bytes"] >> 20))
+    stats_label = ttk.Label(cache_frame, text="", justify=tk.LEFT)
+
+    def refresh_stats():
+        if result_cache["conn"] is None:
+            stats_label.config(text="Cache disabled: project feeders are recomputed every session.")
+            return
+        stats = result_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        session = stats["session_hits"] + stats["session_misses"]
+        stats_label.config(text=(
+            f"Entries: {stats['entries']:,}   Size: {stats['bytes'] / (1 << 20):.1f} MB\n"
+            f"This session: {stats['session_hits']:,} hits / {session:,} lookups "
+            f"({stats['session_hits'] / session * 100 if session else 0:.1f}%)\n"
+            f"All time: {stats['hits']:,} hits / {lookups:,} lookups "
+            f"({stats['hits'] / lookups * 100 if lookups else 0:.1f}%), {stats['evictions']:,} evictions"))
+
+    def toggle_cache():
+        try:
+            if enabled_var.get():
+                open_result_cache(result_cache["path"])
+            else:
+                close_result_cache()
+        except sqlite3.Error as e:
+            enabled_var.set(False)
+            messagebox.showerror("Result Cache", f"Failed to open cache: {str(e)}", parent=cache_window)
+        refresh_stats()
+
+    def choose_path():
+        path = filedialog.asksaveasfilename(parent=cache_window, title="Cache File",
+                                            defaultextension=".db", confirmoverwrite=False,
+                                            filetypes=[("SQLite database", "*.db"), ("All files", "*.*")])
+        if not path:
+            return
+        result_cache["path"] = path
+        path_label.config(text=f"Cache file: {path}")
+        if enabled_var.get():
+            toggle_cache()
+
+    def apply_size():
+        try:
+            result_cache["max_bytes"] = max(1, int(size_var.get())) << 20
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check your input values.", parent=cache_window)
+            return
+        if result_cache["conn"] is not None:
+            evict_result_cache()
+        refresh_stats()
+
+    def clear_cache():
+        if result_cache["conn"] is not None and messagebox.askyesno("Result Cache", "Delete all cached results?",
+                                                                    parent=cache_window):
+            clear_result_cache()
+            refresh_stats()
+
+    ttk.Checkbutton(cache_frame, text="Cache project results on disk", variable=enabled_var,
+                    command=toggle_cache).pack(anchor=tk.W)
+    path_frame.pack(fill=tk.X, pady=(10, 0))
+    path_label.pack(side=tk.LEFT, padx=(0, 10))
+    ttk.Button(path_frame, text="Change...", command=choose_path, style="secondary.TButton").pack(side=tk.LEFT)
+
+    size_frame = ttk.Frame(cache_frame)
+    size_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Label(size_frame, text="Size limit (MB):").pack(side=tk.LEFT, padx=(0, 5))
+    ttk.Entry(size_frame, textvariable=size_var, width=8).pack(side=tk.LEFT, padx=(0, 10))
+    ttk.Button(size_frame, text="Apply", command=apply_size, style="info.TButton").pack(side=tk.LEFT)
+
+    stats_label.pack(anchor=tk.W, pady=(15, 0))
+    cache_button_frame = ttk.Frame(cache_frame)
+    cache_button_frame.pack(fill=tk.X, pady=(15, 0))
+    ttk.Button(cache_button_frame, text="Refresh", command=refresh_stats,
+               style="secondary.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(cache_button_frame, text="Clear Cache", command=clear_cache,
+               style="danger.TButton").pack(side=tk.LEFT)
+    refresh_stats()
+
+
+sizing_atlas = {"atlas": None}
+
+
+def show_atlas_window():
+    atlas_window = tk.Toplevel(root)
+    atlas_window.title("Sizing Atlas")
+    atlas_window.geometry("650x420")
+    atlas_window.transient(root)
+
+    atlas_frame = ttk.Frame(atlas_window, padding=15)
+    atlas_frame.pack(fill=tk.BOTH, expand=True)
+
+    settings_frame = ttk.Labelframe(atlas_frame, text="Grid (cable type and arrangement from the main form)",
+                                    padding=10)
+    settings_frame.pack(fill=tk.X)
+
+    atlas_voltages_var = tk.StringVar(value="0.4, 0.8, 1, 3.3, 6, 6.3, 10, 15, 20, 30, 33, 34.5")
+    atlas_step_var = tk.StringVar(value="0.01")
+    atlas_count_var = tk.StringVar(value="5000")
+    for row, (text, var) in enumerate((("System Voltages (kV):", atlas_voltages_var),
+                                       ("Apparent Power Step (MVA):", atlas_step_var),
+                                       ("Power Steps:", atlas_count_var))):
+        ttk.Label(settings_frame, text=text).grid(row=row, column=0, sticky=tk.W, pady=3, padx=(0, 10))
+        ttk.Entry(settings_frame, textvariable=var, width=45).grid(row=row, column=1, sticky=tk.W, pady=3)
+
+    atlas_text = tk.Text(atlas_frame, height=9, font=("Consolas", 9), background="#1a1a1a",
+                         foreground="#ffffff", wrap=tk.WORD)
+    atlas_text.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+    def report(message):
+        atlas_text.insert(tk.END, message + "\n")
+        atlas_text.see(tk.END)
+
+    def use_atlas(path):
+        if sizing_atlas["atlas"] is not None:
+            close_sizing_atlas(sizing_atlas["atlas"])
+            sizing_atlas["atlas"] = None
+        atlas = open_sizing_atlas(path)
+        sizing_atlas["atlas"] = atlas
+        h = atlas["header"]
+        report(f"Opened {path}: {h['cable_type']} / {h['arrangement']}, {len(h['voltages'])} voltages, "
+               f"up to {h['s_step'] * h['s_count']:.2f} MVA")
+        if sizing_atlas_stale(atlas):
+            report("WARNING: catalog or model settings changed since this atlas was built - rebuild it.")
+
+    def build():
+        try:
+            voltages = [float(v) for v in atlas_voltages_var.get().replace(';', ',').split(',') if v.strip()]
+            s_step = float(atlas_step_var.get())
+            s_count = int(atlas_count_var.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check the atlas grid values.", parent=atlas_window)
+            return
+        path = filedialog.asksaveasfilename(parent=atlas_window, title="Save Sizing Atlas",
+                                            defaultextension=".atlas", filetypes=[("Sizing atlas", "*.atlas")])
+        if not path:
+            return
+        if sizing_atlas["atlas"] is not None and sizing_atlas["atlas"]["path"] == path:
+            close_sizing_atlas(sizing_atlas["atlas"])
+            sizing_atlas["atlas"] = None
+        started = time.perf_counter()
+        count = build_sizing_atlas(path, cable_type_combo.get(), arrangement_combo.get(), voltages, s_step, s_count)
+        report(f"Built {count:,} cells in {time.perf_counter() - started:.2f} s")
+        use_atlas(path)
+
+    def open_atlas():
+        path = filedialog.askopenfilename(parent=atlas_window, title="Open Sizing Atlas",
+                                          filetypes=[("Sizing atlas", "*.atlas"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            use_atlas(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Open Error", f"Failed to open atlas: {str(e)}", parent=atlas_window)
+
+    def validate():
+        if sizing_atlas["atlas"] is None:
+            return
+        stats = validate_sizing_atlas(sizing_atlas["atlas"])
+        report(f"Validation: {stats['exact']} exact, {stats['conservative']} conservative, "
+               f"{stats['unsafe']} unsafe of {stats['samples']} samples")
+        for S_MVA, V, N, ambient, atlas_id, exact_id in stats["mismatches"][:10]:
+            report(f"  S={S_MVA:.3f} MVA V={V} kV N={N} T={ambient:.1f}: atlas {atlas_id}, exact {exact_id}")
+
+    def lookup():
+        if sizing_atlas["atlas"] is None:
+            return
+        try:
+            inputs = read_form_inputs()
+        except ValueError:
+            return
+        S_MVA = math.sqrt(inputs["P"] ** 2 + inputs["Q"] ** 2)
+        started = time.perf_counter()
+        answer = atlas_lookup(sizing_atlas["atlas"], S_MVA, inputs["V"], inputs["N"], inputs["ambient"])
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        if answer is None:
+            report("Current inputs are outside the atlas grid.")
+            return
+        if sizing_atlas_stale(sizing_atlas["atlas"]):
+            report("WARNING: catalog or model settings changed since this atlas was built - rebuild it.")
+        cable = next((c for c in cable_list if c["id"] == answer[0]), None)
+        if cable is None:
+            report(f"No cable passes ({elapsed_us:.1f} us)")
+        else:
+            report(f"Cheapest: {cable['code']} - {cable['voltage']} (ID {cable['id']}), "
+                   f"margin {answer[1]:.1f}% ({elapsed_us:.1f} us)")
+
+    atlas_button_frame = ttk.Frame(atlas_frame)
+    atlas_button_frame.pack(fill=tk.X, pady=(10, 0))
+    for text, command, btn_style in (("Build...", build, "success.TButton"),
+                                     ("Open...", open_atlas, "secondary.TButton"),
+                                     ("Validate", validate, "info.TButton"),
+                                     ("Lookup Current Inputs", lookup, "info.TButton")):
+        ttk.Button(atlas_button_frame, text=text, command=command, style=btn_style).pack(side=tk.LEFT, padx=(0, 8))
+
+
+def show_economics_window():
+    econ_window = tk.Toplevel(root)
+    econ_window.title("Economic Settings")
+    econ_window.geometry("420x330")
+    econ_window.transient(root)
+    econ_window.grab_set()
+
+    econ_frame = ttk.Frame(econ_window, padding=15)
+    econ_frame.pack(fill=tk.BOTH, expand=True)
+
+    # (label, key, scale from the entry to the stored value, check on the entered value, requirement)
+    fields = [("Electricity Price (TL/MWh):", "electricity_price", 1, lambda v: v >= 0, "must not be negative"),
+              ("Horizon (years):", "years", 1, lambda v: v >= 1 and v == int(v), "must be a whole number of years, "
+                                                                                 "at least one"),
+              ("Discount Rate (%):", "discount_rate", 100, lambda v: v > -100, "must be above -100%"),
+              ("Load Growth (%/year):", "load_growth", 100, lambda v: v > -100, "must be above -100%"),
+              ("Energy Price Escalation (%/year):", "price_escalation", 100, lambda v: v > -100,
+               "must be above -100%"),
+              ("Residual Value (% of installation):", "residual_value", 100, lambda v: 0 <= v <= 100,
+               "must be between 0 and 100%")]
+    field_vars = {}
+    for row, (text, key, scale, _, _) in enumerate(fields):
+        field_vars[key] = tk.StringVar(value=f"{economic_settings[key] * scale:g}")
+        ttk.Label(econ_frame, text=text).grid(row=row, column=0, sticky=tk.W, pady=4, padx=(0, 10))
+        ttk.Entry(econ_frame, textvariable=field_vars[key], width=12).grid(row=row, column=1, sticky=tk.W, pady=4)
+
+    def apply_settings():
+        values = {}
+        for text, key, scale, check, requirement in fields:
+            name = text.split(" (")[0]
+            try:
+                value = float(field_vars[key].get().replace(',', '.'))
+            except ValueError:
+                messagebox.showerror("Invalid Input", f"{name} must be a number.", parent=econ_window)
+                return
+            if not check(value):
+                messagebox.showerror("Invalid Input", f"{name} {requirement}.", parent=econ_window)
+                return
+            values[key] = value / scale
+        values["years"] = int(values["years"])
+        economic_settings.update(values)
+        econ_window.destroy()
+        auto_filter_cables()
+
+    econ_button_frame = ttk.Frame(econ_frame)
+    econ_button_frame.grid(row=len(fields), column=0, columnspan=2, sticky=tk.W, pady=(15, 0))
+    ttk.Button(econ_button_frame, text="Apply", command=apply_settings,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(econ_button_frame, text="Cancel", command=econ_window.destroy,
+               style="secondary.TButton").pack(side=tk.LEFT)
+
+
+def show_parallel_window():
+    try:
+        inputs = read_form_inputs()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+
+    parallel_window = tk.Toplevel(root)
+    parallel_window.title("Mixed Parallel Circuits")
+    parallel_window.geometry("950x650")
+    parallel_window.transient(root)
+
+    parallel_frame = ttk.Frame(parallel_window, padding=15)
+    parallel_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(parallel_frame, text=f"Load: {inputs['P']} MW / {inputs['Q']} MVar at {inputs['V']} kV, "
+                                   f"ambient {inputs['ambient']}°C (from the main form)").pack(anchor=tk.W)
+
+    circuits = []
+    circuit_columns = ("Cable", "Voltage", "Arrangement", "Length (km)", "Current (A)", "Share (%)",
+                       "Derated Capacity (A)", "Loading (%)", "Temp (°C)", "Loss (kW)", "Status")
+    circuit_tree = ttk.Treeview(parallel_frame, columns=circuit_columns, show="headings", height=6)
+    for col in circuit_columns:
+        circuit_tree.heading(col, text=col)
+        circuit_tree.column(col, anchor="center", width=82)
+    circuit_tree.pack(fill=tk.X, pady=(10, 0))
+
+    parallel_status = ttk.Label(parallel_frame, text="Add the existing circuits, then Analyze or Suggest.")
+    parallel_status.pack(anchor=tk.W, pady=(8, 0))
+
+    suggestion_columns = ("Cable", "Voltage", "New Circuit (A)", "Max Loading (%)", "Total Loss (kW)",
+                          "Regulation (%)", "New Cable Cost (TL)", "Lifecycle Cost (TL)", "Status")
+    suggestion_tree = ttk.Treeview(parallel_frame, columns=suggestion_columns, show="headings", height=10)
+    for col in suggestion_columns:
+        suggestion_tree.heading(col, text=col)
+        suggestion_tree.column(col, anchor="center", width=100)
+
+    def analyze():
+        circuit_tree.delete(*circuit_tree.get_children())
+        if not circuits:
+            return
+        sol = solve_parallel_circuits(circuits, inputs["P"], inputs["Q"], inputs["V"], inputs["ambient"],
+                                      inputs["load_type"])
+        for row in sol["circuits"]:
+            circuit_tree.insert("", tk.END, values=(
+                row["cable"]["code"], row["cable"]["voltage"], row["arrangement"], row["length"],
+                f"{row['current']:.1f}", f"{row['share']:.1f}", f"{row['derated_capacity']:.1f}",
+                f"{row['loading']:.1f}", f"{row['conductor_temp']:.1f}", f"{row['P_loss_kW']:.3f}",
+                row["capacity_check"]))
+        parallel_status.config(text=f"Total loss {sol['P_loss_total_kW']:.3f} kW | regulation "
+                                    f"{sol['voltage_regulation_percent']:.3f}% | trench factor "
+                                    f"{sol['trench_factor']:.2f} | {sol['capacity_check']}")
+
+    def add_circuit(cable):
+        circuits.append({"cable": cable, "arrangement": inputs["arrangement"], "length": inputs["length"]})
+        analyze()
+
+    def add_selected():
+        if selected_cable["data"] is None:
+            messagebox.showinfo("Parallel Circuits", "Select a cable in the main table first.",
+                                parent=parallel_window)
+            return
+        add_circuit(selected_cable["data"])
+
+    def add_by_id():
+        cable_id = simpledialog.askinteger("Add Circuit", "Cable ID:", parent=parallel_window, minvalue=1)
+        cable = next((c for c in cable_list if c["id"] == cable_id), None)
+        if cable is not None and get_base_capacity(cable, inputs["arrangement"]) is not None:
+            add_circuit(cable)
+
+    def remove_circuit():
+        selection = circuit_tree.selection()
+        if selection:
+            del circuits[circuit_tree.index(selection[0])]
+            analyze()
+
+    def suggest():
+        if not circuits:
+            return
+        ranked = rank_parallel_additions(circuits, inputs["P"], inputs["Q"], inputs["V"], inputs["ambient"],
+                                         inputs["load_type"], inputs["arrangement"], inputs["length"])
+        suggestion_tree.delete(*suggestion_tree.get_children())
+        for item in ranked[:30]:
+            sol = item["solution"]
+            suggestion_tree.insert("", tk.END, values=(
+                item["cable"]["code"], item["cable"]["voltage"], f"{sol['circuits'][-1]['current']:.1f}",
+                f"{sol['max_loading']:.1f}", f"{sol['P_loss_total_kW']:.3f}",
+                f"{sol['voltage_regulation_percent']:.3f}", f"{item['installation_cost']:,.0f}",
+                f"{item['lifecycle_cost']:,.0f}", sol["capacity_check"]))
+
+    parallel_button_frame = ttk.Frame(parallel_frame)
+    parallel_button_frame.pack(fill=tk.X, pady=(10, 0))
+    for text, command, btn_style in (("Add Selected Cable", add_selected, "success.TButton"),
+                                     ("Add by ID...", add_by_id, "info.TButton"),
+                                     ("Remove", remove_circuit, "danger.TButton"),
+                                     ("Suggest Cable to Add", suggest, "secondary.TButton")):
+        ttk.Button(parallel_button_frame, text=text, command=command, style=btn_style).pack(side=tk.LEFT, padx=(0, 8))
+    suggestion_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+
+def show_motor_batch_window():
+    motor_window = tk.Toplevel(root)
+    motor_window.title("Motor Starting Batch")
+    motor_window.geometry("900x550")
+    motor_window.transient(root)
+
+    motor_batch_frame = ttk.Frame(motor_window, padding=15)
+    motor_batch_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(motor_batch_frame, text="CSV columns: " + ", ".join(motor_csv_fields) +
+              " [, ambient, load_P, load_Q, cable_type, arrangement]; missing values come from the main form"
+              ).pack(anchor=tk.W)
+
+    motor_columns = ("Motor", "Cable", "Voltage", "Circuits", "Start Dip (%)", "Cable Cost (TL)", "Status")
+    motor_tree = ttk.Treeview(motor_batch_frame, columns=motor_columns, show="headings", height=16)
+    for col in motor_columns:
+        motor_tree.heading(col, text=col)
+        motor_tree.column(col, anchor="center", width=120)
+    motor_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+    motor_status = ttk.Label(motor_batch_frame, text="")
+    motor_status.pack(anchor=tk.W, pady=(10, 0))
+    batch_results = []
+
+    def run_batch():
+        path = filedialog.askopenfilename(parent=motor_window, title="Open Motor List",
+                                          filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            defaults = read_form_inputs()
+            defaults.update(read_motor_inputs() or {"lrc": 0.0, "start_pf": 0.3, "max_dip": 15.0,
+                                                    "source_r": 0.0, "source_x": 0.0})
+            motors = read_motor_list(path, defaults)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Motor List", str(e), parent=motor_window)
+            return
+
+        started = time.perf_counter()
+        batch_results[:] = [(motor, size_motor_feeder(motor)) for motor in motors]
+        elapsed = time.perf_counter() - started
+
+        motor_tree.delete(*motor_tree.get_children())
+        failed = 0
+        for motor, best in batch_results:
+            if best is None:
+                failed += 1
+                motor_tree.insert("", tk.END, values=(motor["name"], "-", "-", "-", "-", "-", "NO CABLE"))
+            else:
+                motor_tree.insert("", tk.END, values=(
+                    motor["name"], best["cable"]["code"], best["cable"]["voltage"], best["N"],
+                    f"{best['dip']:.2f}", f"{best['cost']:,.0f}", "PASS"))
+        motor_status.config(text=f"{len(motors)} motors sized in {elapsed:.2f} s, {failed} without a passing cable")
+
+    def export_batch():
+        if not batch_results:
+            return
+        path = filedialog.asksaveasfilename(parent=motor_window, title="Export Results", defaultextension=".csv",
+                                            filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "cable_id", "cable_code", "voltage", "circuits", "start_dip_pct", "cable_cost"])
+            for motor, best in batch_results:
+                if best is None:
+                    writer.writerow([motor["name"], "", "", "", "", "", ""])
+                else:
+                    writer.writerow([motor["name"], best["cable"]["id"], best["cable"]["code"],
+                                     best["cable"]["voltage"], best["N"], f"{best['dip']:.3f}", f"{best['cost']:.0f}"])
+
+    motor_button_frame = ttk.Frame(motor_batch_frame)
+    motor_button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(motor_button_frame, text="Open Motor List...", command=run_batch,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(motor_button_frame, text="Export Results...", command=export_batch,
+               style="secondary.TButton").pack(side=tk.LEFT)
+
+
+_curve_colors = ["#4a90e2", "#ff8c00", "#00c853", "#e53935", "#ab47bc", "#26c6da", "#ffee58", "#8d6e63",
+                 "#ec407a", "#9ccc65", "#5c6bc0", "#ffa726"]
+
+
+def show_sweep_window():
+    try:
+        inputs = read_form_inputs()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+    if inputs["P"] <= 0 or inputs["V"] <= 0:
+        messagebox.showerror("Invalid Input", "Active power and system voltage must be positive.")
+        return
+
+    # all cables of the chosen type in the lowest voltage class that suits the system voltage
+    cables = [c for c in cable_list if c["code"].startswith("1x") == (inputs["cable_type"] == "Single-core")
+              and parse_voltage_kV(c["voltage"]) >= inputs["V"]
+              and get_base_capacity(c, inputs["arrangement"]) is not None]
+    if not cables:
+        messagebox.showinfo("Sweep Charts", "No cable suits this system voltage.")
+        return
+    min_rating = min(parse_voltage_kV(c["voltage"]) for c in cables)
+    cables = [c for c in cables if parse_voltage_kV(c["voltage"]) == min_rating]
+
+    sweep_window = tk.Toplevel(root)
+    sweep_window.title("Sweep Charts")
+    sweep_window.geometry("950x600")
+    sweep_window.transient(root)
+
+    controls = ttk.Frame(sweep_window, padding=(15, 15, 15, 5))
+    controls.pack(fill=tk.X)
+
+    variable_combo = ttk.Combobox(controls, values=["Cable Length (km)", "Active Power (MW)"],
+                                  state="readonly", width=18)
+    variable_combo.current(0)
+    metric_combo = ttk.Combobox(controls, values=list(sweep_metrics), state="readonly", width=18)
+    metric_combo.current(0)
+    range_var = tk.DoubleVar(value=3.0)
+    range_label = ttk.Label(controls, text="")
+    ttk.Label(controls, text="Sweep:").pack(side=tk.LEFT, padx=(0, 5))
+    variable_combo.pack(side=tk.LEFT, padx=(0, 15))
+    ttk.Label(controls, text="Show:").pack(side=tk.LEFT, padx=(0, 5))
+    metric_combo.pack(side=tk.LEFT, padx=(0, 15))
+    ttk.Label(controls, text="Range:").pack(side=tk.LEFT, padx=(0, 5))
+    range_scale = ttk.Scale(controls, from_=1.1, to=10.0, variable=range_var, length=200)
+    range_scale.pack(side=tk.LEFT, padx=(0, 10))
+    range_label.pack(side=tk.LEFT)
+
+    canvas = tk.Canvas(sweep_window, background="#1a1a1a", highlightthickness=0)
+    canvas.pack(fill=tk.BOTH, expand=True, padx=15, pady=(5, 15))
+
+    # curves are evaluated once over the full slider range, and each metric's min/max range tables are
+    # built once per sweep; dragging only reads one min/max per pixel column of every curve
+    sweep_points = 10000
+    cache = {}
+    tables = {}
+
+    def curves_for(variable, x_full):
+        if variable not in cache:
+            x_values = [x_full * (k + 1) / sweep_points for k in range(sweep_points)]
+            cache[variable] = (x_values, calc_sweep_curves(cables, inputs, variable, x_values))
+        return cache[variable]
+
+    def tables_for(variable, metric, curves):
+        # per curve: values with overloaded points as gaps, and their extrema table
+        if (variable, metric) not in tables:
+            entries = []
+            for ys, ok in zip(curves[metric], curves["feasible"]):
+                low_values = [y if f else float("inf") for y, f in zip(ys, ok)]
+                high_values = [y if f else float("-inf") for y, f in zip(ys, ok)]
+                entries.append((low_values, high_values, build_extrema_table(low_values, high_values)))
+            tables[(variable, metric)] = entries
+        return tables[(variable, metric)]
+
+    def redraw(*args):
+        variable = "length" if variable_combo.get().startswith("Cable") else "power"
+        x_now = inputs["length"] if variable == "length" else inputs["P"]
+        x_max = x_now * range_var.get()
+        range_label.config(text=f"0 - {x_max:.3g} {'km' if variable == 'length' else 'MW'}")
+        x_values, curves = curves_for(variable, x_now * float(range_scale.cget("to")))
+        entries = tables_for(variable, sweep_metrics[metric_combo.get()], curves)
+        n_shown = bisect.bisect_right(x_values, x_max)
+
+        width = max(canvas.winfo_width(), 200)
+        height = max(canvas.winfo_height(), 150)
+        left, right, top, bottom = 90, 170, 20, 40
+        plot_w, plot_h = width - left - right, height - top - bottom
+        peaks = [high_values[range_extrema(table, low_values, high_values, 0, n_shown)[1]]
+                 for low_values, high_values, table in entries] if n_shown else []
+        y_max = max((y for y in peaks if y != float("-inf")), default=1.0)
+        y_max = y_max * 1.05 or 1.0
+        # sweep indices falling in each pixel column of the plot
+        bounds = [bisect.bisect_left(x_values, x_max * c / plot_w, 0, n_shown) for c in range(plot_w)] + [n_shown]
+
+        def to_px(x, y):
+            return left + x / x_max * plot_w, top + plot_h - y / y_max * plot_h
+
+        canvas.delete("all")
+        canvas.create_rectangle(left, top, left + plot_w, top + plot_h, outline="#666666")
+        for k in range(5):
+            y = y_max * k / 4
+            _, py = to_px(0, y)
+            canvas.create_line(left, py, left + plot_w, py, fill="#333333")
+            canvas.create_text(left - 8, py, text=f"{y:,.3g}", anchor="e", fill="#cccccc")
+            x = x_max * k / 4
+            px, _ = to_px(x, 0)
+            canvas.create_text(px, top + plot_h + 15, text=f"{x:.3g}", fill="#cccccc")
+        canvas.create_text(left + plot_w / 2, height - 8, text=variable_combo.get(), fill="#cccccc")
+        canvas.create_text(15, top + plot_h / 2, text=metric_combo.get(), fill="#cccccc", angle=90)
+
+        # current operating point
+        px, _ = to_px(x_now, 0)
+        canvas.create_line(px, top, px, top + plot_h, fill="#888888", dash=(4, 3))
+
+        for idx, (cable, (low_values, high_values, table)) in enumerate(zip(cables, entries)):
+            color = _curve_colors[idx % len(_curve_colors)]
+            coords = []
+            # overloaded stretches are not drawn
+            for column in decimate_columns(table, low_values, high_values, bounds):
+                if column is not None:
+                    for k in column:
+                        coords.extend(to_px(x_values[k], min(low_values[k], y_max)))
+                elif coords:
+                    if len(coords) >= 4:
+                        canvas.create_line(*coords, fill=color, width=2)
+                    coords = []
+            if len(coords) >= 4:
+                canvas.create_line(*coords, fill=color, width=2)
+            canvas.create_line(width - right + 15, top + 10 + idx * 18, width - right + 35, top + 10 + idx * 18,
+                               fill=color, width=3)
+            canvas.create_text(width - right + 40, top + 10 + idx * 18, text=cable["code"], anchor="w",
+                               fill="#ffffff")
+
+    variable_combo.bind("<<ComboboxSelected>>", redraw)
+    metric_combo.bind("<<ComboboxSelected>>", redraw)
+    range_scale.configure(command=redraw)
+    canvas.bind("<Configure>", redraw)
+
+
+def show_route_window():
+    try:
+        inputs = read_form_inputs()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+    try:
+        reg_limit = float(regulation_limit_var.get().replace(',', '.')) or 0.0
+    except ValueError:
+        reg_limit = 0.0
+
+    route_window = tk.Toplevel(root)
+    route_window.title("Route Import")
+    route_window.geometry("1000x520")
+    route_window.transient(root)
+
+    route_frame = ttk.Frame(route_window, padding=15)
+    route_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(route_frame, text="GeoJSON LineStrings (properties: route, section, ambient, grouping, installation) "
+                                "or CSV vertices (route, section, lat, lon, ...). Load from the main form.").pack(
+        anchor=tk.W)
+
+    route_columns = ("Route", "Sections", "Length (km)", "Worst Section", "Worst Derating", "Cable", "Voltage",
+                     "Regulation (%)", "Losses (kW)", "Lifecycle Cost (TL)")
+    route_tree = ttk.Treeview(route_frame, columns=route_columns, show="headings", height=14)
+    for col in route_columns:
+        route_tree.heading(col, text=col)
+        route_tree.column(col, anchor="center", width=95)
+    route_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+    route_status = ttk.Label(route_frame, text="")
+    route_status.pack(anchor=tk.W, pady=(10, 0))
+    sized = {}
+
+    def import_routes():
+        path = filedialog.askopenfilename(parent=route_window, title="Import Routes",
+                                          filetypes=[("GeoJSON", "*.geojson *.json"), ("CSV", "*.csv"),
+                                                     ("All files", "*.*")])
+        if not path:
+            return
+        route_status.config(text="Reading routes...")
+        route_window.update_idletasks()
+        started = time.perf_counter()
+        try:
+            routes = read_routes(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            messagebox.showerror("Route Import", f"Failed to read routes: {str(e)}", parent=route_window)
+            route_status.config(text="")
+            return
+
+        route_tree.delete(*route_tree.get_children())
+        sized.clear()
+        for name, sections in routes.items():
+            summary = size_route(sections, inputs, reg_limit)
+            sized[name] = summary
+            cable, r = summary["cable"], summary["result"]
+            route_tree.insert("", tk.END, iid=name, values=(
+                name, summary["sections"], f"{summary['length']:.3f}", summary["worst_section"] or "-",
+                f"{summary['worst_derating']:.3f}", cable["code"] if cable else "NO CABLE",
+                cable["voltage"] if cable else "-",
+                f"{r['voltage_regulation_percent']:.3f}" if r else "-", f"{r['P_loss_total_kW']:.3f}" if r else "-",
+                f"{r['lifecycle_cost']:,.0f}" if r else "-"))
+        route_status.config(text=f"{len(routes)} routes imported in {time.perf_counter() - started:.2f} s")
+
+    def use_length():
+        selection = route_tree.selection()
+        if selection:
+            cable_length_var.set(f"{sized[selection[0]]['length']:.3f}")
+
+    route_button_frame = ttk.Frame(route_frame)
+    route_button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(route_button_frame, text="Import...", command=import_routes,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(route_button_frame, text="Use Route Length", command=use_length,
+               style="info.TButton").pack(side=tk.LEFT)
+
+
+def show_load_window():
+    load_window = tk.Toplevel(root)
+    load_window.title("Load Aggregation")
+    load_window.geometry("950x650")
+    load_window.transient(root)
+
+    load_frame = ttk.Frame(load_window, padding=15)
+    load_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(load_frame, text="CSV columns: name, category, kw [, quantity, pf, kvar]. Double-click a category "
+                               "to edit its demand and diversity factors.").pack(anchor=tk.W)
+
+    load_columns = ("Load", "Category", "Quantity", "kW", "PF", "kVAr", "Connected kW")
+    load_tree = ttk.Treeview(load_frame, columns=load_columns, show="headings", height=12)
+    for col in load_columns:
+        load_tree.heading(col, text=col)
+        load_tree.column(col, anchor="center", width=110)
+    load_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+    category_columns = ("Category", "Loads", "Connected kW", "Demand", "Diversity", "Demand kW", "Demand kVAr")
+    category_tree = ttk.Treeview(load_frame, columns=category_columns, show="headings", height=len(load_categories))
+    for col in category_columns:
+        category_tree.heading(col, text=col)
+        category_tree.column(col, anchor="center", width=110)
+    category_tree.pack(fill=tk.X, pady=(10, 0))
+
+    edit_frame = ttk.Frame(load_frame)
+    edit_frame.pack(fill=tk.X, pady=(10, 0))
+    edit_vars = {}
+    for col, (key, label) in enumerate((("kw", "kW:"), ("quantity", "Quantity:"), ("pf", "PF:"))):
+        ttk.Label(edit_frame, text=label).grid(row=0, column=col * 2, padx=(0, 5))
+        edit_vars[key] = tk.StringVar()
+        ttk.Entry(edit_frame, textvariable=edit_vars[key], width=10).grid(row=0, column=col * 2 + 1, padx=(0, 10))
+    ttk.Label(edit_frame, text="Category:").grid(row=0, column=6, padx=(0, 5))
+    edit_category = ttk.Combobox(edit_frame, values=list(load_categories), state="readonly", width=12)
+    edit_category.grid(row=0, column=7, padx=(0, 10))
+
+    load_total = ttk.Label(load_frame, text="", font=("Segoe UI", 10, "bold"))
+    load_total.pack(anchor=tk.W, pady=(10, 0))
+    state = {"aggregation": new_load_aggregation()}
+
+    def load_values(load):
+        P, _ = load_contribution(load)
+        return (load["name"], load["category"], load["quantity"], f"{load['kw']:.3f}", f"{load['pf']:.2f}",
+                "-" if load["kvar"] is None else f"{load['kvar']:.3f}", f"{P / 1e6:,.3f}")
+
+    def refresh_totals():
+        P, Q, categories = aggregation_totals(state["aggregation"])
+        for name, c in categories.items():
+            values = (name, c["count"], f"{c['connected_P'] * 1e3:,.1f}", f"{load_categories[name]['demand']:.2f}",
+                      f"{load_categories[name]['diversity']:.2f}", f"{c['P'] * 1e3:,.1f}", f"{c['Q'] * 1e3:,.1f}")
+            if category_tree.exists(name):
+                category_tree.item(name, values=values)
+            else:
+                category_tree.insert("", tk.END, iid=name, values=values)
+        load_total.config(text=f"Feeder demand: P = {P:.4f} MW, Q = {Q:.4f} MVAr")
+        return P, Q
+
+    def open_list():
+        path = filedialog.askopenfilename(parent=load_window, title="Open Load List",
+                                          filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            state["aggregation"] = read_load_list(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load List", str(e), parent=load_window)
+            return
+        load_tree.delete(*load_tree.get_children())
+        for idx, load in enumerate(state["aggregation"]["loads"]):
+            load_tree.insert("", tk.END, iid=str(idx), values=load_values(load))
+        refresh_totals()
+
+    def on_load_select(event=None):
+        selection = load_tree.selection()
+        if not selection:
+            return
+        load = state["aggregation"]["loads"][int(selection[0])]
+        edit_vars["kw"].set(f"{load['kw']:g}")
+        edit_vars["quantity"].set(str(load["quantity"]))
+        edit_vars["pf"].set(f"{load['pf']:g}")
+        edit_category.set(load_category(load))
+
+    def update_selected():
+        selection = load_tree.selection()
+        if not selection:
+            return
+        idx = int(selection[0])
+        try:
+            load = dict(state["aggregation"]["loads"][idx], kw=float(edit_vars["kw"].get().replace(',', '.')),
+                        quantity=int(edit_vars["quantity"].get()),
+                        pf=float(edit_vars["pf"].get().replace(',', '.')), category=edit_category.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check your input values.", parent=load_window)
+            return
+        update_load(state["aggregation"], idx, load)
+        load_tree.item(selection[0], values=load_values(load))
+        refresh_totals()
+
+    def edit_factors(event=None):
+        name = category_tree.focus()
+        if not name:
+            return
+        for key in ("demand", "diversity"):
+            value = simpledialog.askfloat("Load Factors", f"{name} {key} factor:", parent=load_window,
+                                          initialvalue=load_categories[name][key], minvalue=0.01, maxvalue=10.0)
+            if value is not None:
+                load_categories[name][key] = value
+        refresh_totals()
+
+    def apply_to_form():
+        P, Q = refresh_totals()
+        active_power_var.set(f"{P:.4f}")
+        reactive_power_var.set(f"{Q:.4f}")
+        auto_filter_cables()
+
+    load_tree.bind("<<TreeviewSelect>>", on_load_select)
+    category_tree.bind("<Double-1>", edit_factors)
+    refresh_totals()
+
+    load_button_frame = ttk.Frame(load_frame)
+    load_button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(load_button_frame, text="Open Load List...", command=open_list,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(load_button_frame, text="Update Load", command=update_selected,
+               style="info.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(load_button_frame, text="Apply to Form", command=apply_to_form,
+               style="primary.TButton").pack(side=tk.LEFT)
+
+
+def show_transient_window():
+    try:
+        inputs = read_form_inputs()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+
+    transient_window = tk.Toplevel(root)
+    transient_window.title("Transient Rating")
+    transient_window.geometry("950x560")
+    transient_window.transient(root)
+
+    transient_frame = ttk.Frame(transient_window, padding=15)
+    transient_frame.pack(fill=tk.BOTH, expand=True)
+
+    S_MVA = math.sqrt(inputs["P"] ** 2 + inputs["Q"] ** 2)
+    I_total = S_MVA * 1e6 / (math.sqrt(3) * inputs["V"] * 1e3) if inputs["V"] > 0 else 0
+    I_per_circuit = I_total / inputs["N"]
+
+    cycle_var = tk.StringVar(value=", ".join(f"{v:g}" for v in transient_settings["load_cycle"]))
+    emergency_var = tk.StringVar(value=f"{I_total / (inputs['N'] - 1) if inputs['N'] > 1 else I_per_circuit * 1.5:.1f}")
+    use_cyclic_var = tk.BooleanVar(value=transient_settings["use_cyclic_rating"])
+
+    ttk.Label(transient_frame, text="Daily load cycle (24 hourly values, p.u. of peak):").pack(anchor=tk.W)
+    ttk.Entry(transient_frame, textvariable=cycle_var).pack(fill=tk.X, pady=(5, 0))
+    emergency_frame = ttk.Frame(transient_frame)
+    emergency_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Label(emergency_frame, text="Emergency current per circuit (A):").pack(side=tk.LEFT, padx=(0, 5))
+    ttk.Entry(emergency_frame, textvariable=emergency_var, width=10).pack(side=tk.LEFT, padx=(0, 15))
+    ttk.Label(emergency_frame, text=f"from {I_per_circuit:.1f} A pre-load").pack(side=tk.LEFT)
+
+    transient_columns = ("Cable", "Voltage", "Arrangement", "Continuous (A)", "Cyclic Factor", "Cyclic Rating (A)",
+                         "Time to Max (h)")
+    transient_tree = ttk.Treeview(transient_frame, columns=transient_columns, show="headings", height=14)
+    for col in transient_columns:
+        transient_tree.heading(col, text=col)
+        transient_tree.column(col, anchor="center", width=120)
+    transient_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+    transient_status = ttk.Label(transient_frame, text="")
+    transient_status.pack(anchor=tk.W, pady=(10, 0))
+
+    def read_cycle():
+        cycle = [float(v) for v in cycle_var.get().replace(";", ",").split(",") if v.strip()]
+        if len(cycle) != 24 or min(cycle) < 0 or max(cycle) <= 0:
+            raise ValueError
+        return cycle
+
+    def compute():
+        # a what-if: the cycle goes to the engine calls only, so project results, cache entries
+        # and sizing atlases keyed on the model settings stay valid
+        try:
+            cycle = read_cycle()
+            I_emergency = float(emergency_var.get().replace(",", "."))
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter 24 non-negative cycle values and an emergency current.",
+                                 parent=transient_window)
+            return
+
+        # every candidate in both arrangements, stepped together
+        single = inputs["cable_type"] == "Single-core"
+        trench_factor = get_trench_factor(min(inputs["N"] * 3 if single else inputs["N"], 6))
+        entries = []
+        for cable in cable_list:
+            if cable["code"].startswith("1x") != single or parse_voltage_kV(cable["voltage"]) < inputs["V"]:
+                continue
+            for arrangement in (("Flat", "Trefoil") if single else ("Trefoil",)):
+                base = get_base_capacity(cable, arrangement)
+                if base:
+                    entries.append((cable, arrangement, base * get_temp_factor(inputs["ambient"]) * trench_factor))
+
+        started = time.perf_counter()
+        networks = build_thermal_networks([e[0] for e in entries], [e[2] for e in entries], inputs["ambient"])
+        factors = calc_cyclic_factors(networks, cycle)
+        times = calc_emergency_times(networks, [I_per_circuit / e[2] for e in entries],
+                                     [I_emergency / e[2] for e in entries])
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        transient_tree.delete(*transient_tree.get_children())
+        for (cable, arrangement, derated), factor, hours in zip(entries, factors, times):
+            if I_emergency <= derated:
+                time_text = "continuous"
+            elif hours is None:
+                time_text = f"> {transient_settings['emergency_hours']}"
+            else:
+                time_text = f"{hours:.2f}"
+            transient_tree.insert("", tk.END, values=(
+                cable["code"], cable["voltage"], arrangement, f"{derated:.1f}",
+                "-" if factor is None else f"{factor:.3f}", "-" if factor is None else f"{derated * factor:.1f}",
+                time_text))
+        transient_status.config(text=f"{len(entries)} cable/arrangement pairs stepped in {elapsed_ms:.1f} ms")
+
+    def toggle_cyclic():
+        transient_settings["use_cyclic_rating"] = use_cyclic_var.get()
+        if selected_cable["data"]:
+            update_cable_display()
+        auto_filter_cables()
+
+    def apply_cycle():
+        # makes the cycle part of the model: the cyclic capacity check uses it from now on
+        try:
+            transient_settings["load_cycle"] = read_cycle()
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter 24 non-negative cycle values.", parent=transient_window)
+            return
+        if selected_cable["data"]:
+            update_cable_display()
+        auto_filter_cables()
+
+    transient_button_frame = ttk.Frame(transient_frame)
+    transient_button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(transient_button_frame, text="Compute", command=compute,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(transient_button_frame, text="Apply Cycle to Model", command=apply_cycle,
+               style="info.TButton").pack(side=tk.LEFT, padx=(0, 15))
+    ttk.Checkbutton(transient_button_frame, text="Check capacity against the cyclic rating", variable=use_cyclic_var,
+                    command=toggle_cyclic).pack(side=tk.LEFT)
+    compute()
+
+
+def show_collector_window():
+    try:
+        inputs = read_form_inputs()
+    except ValueError:
+        messagebox.showerror("Invalid Input", "Please check your input values.")
+        return
+
+    collector_window = tk.Toplevel(root)
+    collector_window.title("Tapered Collector Feeder")
+    collector_window.geometry("1000x560")
+    collector_window.transient(root)
+
+    collector_frame = ttk.Frame(collector_window, padding=15)
+    collector_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(collector_frame, text="CSV columns: name, length, P [, Q] - one row per section from the substation "
+                                    "outward, power injected at its far node. V, circuits, arrangement and ambient "
+                                    "come from the main form.").pack(anchor=tk.W)
+
+    limit_frame = ttk.Frame(collector_frame)
+    limit_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Label(limit_frame, text="Total voltage rise limit (%):").pack(side=tk.LEFT, padx=(0, 5))
+    try:
+        default_limit = float(regulation_limit_var.get().replace(',', '.')) or 3.0
+    except ValueError:
+        default_limit = 3.0
+    limit_var = tk.StringVar(value=f"{default_limit:g}")
+    ttk.Entry(limit_frame, textvariable=limit_var, width=8).pack(side=tk.LEFT)
+
+    collector_columns = ("Section", "Length (km)", "P (MW)", "Current (A)", "Cable", "Drop (%)", "Cumulative (%)",
+                         "Losses (kW)", "Lifecycle Cost (TL)")
+    collector_tree = ttk.Treeview(collector_frame, columns=collector_columns, show="headings", height=14)
+    for col in collector_columns:
+        collector_tree.heading(col, text=col)
+        collector_tree.column(col, anchor="center", width=100)
+    collector_tree.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+    collector_status = ttk.Label(collector_frame, text="")
+    collector_status.pack(anchor=tk.W, pady=(10, 0))
+    chain = {"sections": []}
+
+    def run_optimizer():
+        if not chain["sections"]:
+            return
+        try:
+            reg_limit = float(limit_var.get().replace(',', '.'))
+            if reg_limit <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please check your input values.", parent=collector_window)
+            return
+        started = time.perf_counter()
+        result = optimize_tapered_chain(chain["sections"], inputs, reg_limit)
+        elapsed = time.perf_counter() - started
+
+        collector_tree.delete(*collector_tree.get_children())
+        if not result["feasible"]:
+            collector_status.config(text=result["reason"])
+            return
+        for row in result["sections"]:
+            collector_tree.insert("", tk.END, values=(
+                row["name"], f"{row['length']:.3f}", f"{row['P']:.3f}", f"{row['current']:.1f}",
+                f"{row['cable']['code']} {row['cable']['voltage']}", f"{row['drop']:.3f}", f"{row['cumulative']:.3f}",
+                f"{row['loss_kW']:.2f}", f"{row['cost']:,.0f}"))
+        uniform = result["uniform"]
+        reference = (f"uniform {uniform['cable']['code']}: {uniform['cost']:,.0f} TL, {uniform['drop']:.3f}%"
+                     if uniform else "no single cable meets the limit")
+        collector_status.config(text=(
+            f"Tapered: {result['cost']:,.0f} TL, {result['drop']:.3f}% | {reference} | "
+            f"{len(result['sections'])} sections in {elapsed * 1000:.0f} ms"))
+
+    def open_chain():
+        path = filedialog.askopenfilename(parent=collector_window, title="Open Collector Chain",
+                                          filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            chain["sections"] = read_collector_chain(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Collector Chain", str(e), parent=collector_window)
+            return
+        run_optimizer()
+
+    collector_button_frame = ttk.Frame(collector_frame)
+    collector_button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(collector_button_frame, text="Open Chain...", command=open_chain,
+               style="success.TButton").pack(side=tk.LEFT, padx=(0, 8))
+    ttk.Button(collector_button_frame, text="Optimize", command=run_optimizer,
+               style="info.TButton").pack(side=tk.LEFT)
+
+
+def show_trench_window():
+    if not project["feeders"]:
+        messagebox.showinfo("Trench Optimizer", "Add feeders in Project > Feeders first.")
+        return
+
+    trench_window = tk.Toplevel(root)
+    trench_window.title("Trench Grouping Optimizer")
+    trench_window.geometry("900x650")
+    trench_window.transient(root)
+
+    trench_frame = ttk.Frame(trench_window, padding=15)
+    trench_frame.pack(fill=tk.BOTH, expand=True)
+
+    ttk.Label(trench_frame, text="Candidate routes per feeder (feeder: trench=length km, ...):").pack(anchor=tk.W)
+    routes_text = tk.Text(trench_frame, height=8, font=("Consolas", 9), background="#1a1a1a",
+                          foreground="#ffffff", insertbackground="#ffffff")
+    routes_text.pack(fill=tk.X, pady=(5, 10))
+    for feeder in project["feeders"]:
+        routes = feeder.get("routes") or [[f"{feeder['name']} trench", feeder["inputs"]["length"]]]
+        routes_text.insert(tk.END, f"{feeder['name']}: " + ", ".join(f"{t}={l}" for t, l in routes) + "\n")
+
+    assign_columns = ("Feeder", "Trench", "Length (km)", "Cable", "Voltage", "Lifecycle Cost (TL)")
+    assign_tree = ttk.Treeview(trench_frame, columns=assign_columns, show="headings", height=10)
+    for col in assign_columns:
+        assign_tree.heading(col, text=col)
+        assign_tree.column(col, anchor="center", width=130)
+    assign_tree.pack(fill=tk.BOTH, expand=True)
+
+    loading_columns = ("Trench", "Feeders", "Cables in Trench", "Trench Factor")
+    loading_tree = ttk.Treeview(trench_frame, columns=loading_columns, show="headings", height=5)
+    for col in loading_columns:
+        loading_tree.heading(col, text=col)
+        loading_tree.column(col, anchor="center", width=180)
+    loading_tree.pack(fill=tk.X, pady=(10, 0))
+
+    trench_status = ttk.Label(trench_frame, text="")
+    trench_status.pack(anchor=tk.W, pady=(10, 0))
+
+    def run_optimizer():
+        by_name = {f["name"]: f for f in project["feeders"]}
+        try:
+            feeders = parse_trench_routes(routes_text.get("1.0", tk.END), by_name)
+        except ValueError as e:
+            messagebox.showerror("Invalid Routes", str(e), parent=trench_window)
+            return
+        if not feeders:
+            return
+        for feeder in feeders:
+            by_name[feeder["name"]]["routes"] = feeder["routes"]
+
+        started = time.perf_counter()
+        result = optimize_trench_grouping(feeders)
+        elapsed = time.perf_counter() - started
+
+        assign_tree.delete(*assign_tree.get_children())
+        for row in result["feeders"]:
+            cable = row["cable"]
+            assign_tree.insert("", tk.END, values=(
+                row["name"], row["trench"], row["length"], cable["code"] if cable else "NO CABLE",
+                cable["voltage"] if cable else "-", f"{row['cost']:,.0f}" if cable else "-"))
+        loading_tree.delete(*loading_tree.get_children())
+        for trench, loading in sorted(result["loadings"].items()):
+            loading_tree.insert("", tk.END, values=(trench, ", ".join(loading["feeders"]), loading["cables"],
+                                                    f"{loading['factor']:.2f}"))
+        text = (f"Total cost: {result['total_cost']:,.0f} TL | "
+                f"{result['passes']} improvement passes | {elapsed * 1000:.0f} ms")
+        if result["infeasible"]:
+            text += f" | no passing cable: {', '.join(result['infeasible'])}"
+        trench_status.config(text=text)
+
+    ttk.Button(trench_frame, text="Optimize", command=run_optimizer,
+               style="success.TButton").pack(anchor=tk.W, pady=(10, 0))
+
+
+# ui session record/replay
+def _widget_value(widget):
+    try:
+        return widget.get()
+    except (AttributeError, TypeError, tk.TclError):
+        return None
+
+
+def record_ui_event(kind, widget, **details):
+    ui_session["events"].append(dict(t=round(time.perf_counter() - ui_session["started"], 4), kind=kind,
+                                     widget=str(widget), **details))
+
+
+def on_record_key(event):
+    # KeyRelease, so the entry already holds the new text and root's Return binding cannot swallow it
+    if event.keysym in ("Return", "KP_Enter"):
+        record_ui_event("return", event.widget, keysym=event.keysym)
+    elif isinstance(event.widget, (ttk.Entry, ttk.Spinbox, tk.Entry)):
+        record_ui_event("key", event.widget, keysym=event.keysym, value=_widget_value(event.widget))
+
+
+def on_record_combobox(event):
+    record_ui_event("combobox", event.widget, value=event.widget.get())
+
+
+def on_record_spin(event, direction):
+    # the class binding changes the value after this one runs
+    root.after_idle(lambda: record_ui_event("spin", event.widget, direction=direction,
+                                            value=_widget_value(event.widget)))
+
+
+def on_record_tree(event):
+    children = event.widget.get_children("")
+    rows = [children.index(iid) for iid in event.widget.selection() if iid in children]
+    if rows:  # refilling the table clears the selection too; only user picks are replayed
+        record_ui_event("tree_select", event.widget, rows=rows)
+
+
+def on_record_click(event):
+    if isinstance(event.widget, ttk.Button):
+        record_ui_event("button", event.widget, text=event.widget.cget("text"))
+    elif isinstance(event.widget, ttk.Checkbutton):
+        record_ui_event("toggle", event.widget, text=event.widget.cget("text"))
+
+
+def start_recording():
+    ui_session["started"] = time.perf_counter()
+    root.bind_all("<KeyRelease>", on_record_key, add="+")
+    root.bind_all("<<ComboboxSelected>>", on_record_combobox, add="+")
+    root.bind_all("<<Increment>>", lambda e: on_record_spin(e, "Increment"), add="+")
+    root.bind_all("<<Decrement>>", lambda e: on_record_spin(e, "Decrement"), add="+")
+    root.bind_all("<<TreeviewSelect>>", on_record_tree, add="+")
+    root.bind_all("<ButtonRelease-1>", on_record_click, add="+")
+
+
+def save_recording():
+    with open(ui_session["path"], "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "events": ui_session["events"]}, f, indent=1)
+
+
+def ui_snapshot():
+    # everything a user waits for: the results table, the summary and the capacity panel
+    rows = tuple(tuple(tree.item(iid, "values")) for iid in tree.get_children(""))
+    labels = tuple(w.cget("text") for frame in (summary_frame, capacity_main_frame, selection_frame)
+                   for w in frame.winfo_children() if isinstance(w, ttk.Label))
+    return rows, tree.selection(), labels, bool(summary_frame.grid_info()), bool(capacity_main_frame.grid_info())
+
+
+def idle_callbacks_pending():
+    for callback in root.tk.splitlist(root.tk.call("after", "info")):
+        try:
+            if root.tk.splitlist(root.tk.call("after", "info", callback))[1] == "idle":
+                return True
+        except tk.TclError:
+            continue  # ran between the two calls
+    return False
+
+
+def wait_until_settled(started, timeout=10.0):
+    # settled = the idle queue is drained and nothing visible has changed for a quiet window longer
+    # than the app's debounce timers; recurring after() timers do not hold it up.
+    # Returns (ms to the last visible change, False if the UI was still changing at the timeout)
+    quiet = ui_session["quiet_ms"] / 1000
+    snapshot = ui_snapshot()
+    changed_at = time.perf_counter()
+    while True:
+        root.update()
+        current = ui_snapshot()
+        now = time.perf_counter()
+        if current != snapshot:
+            snapshot, changed_at = current, now
+        elif now - changed_at >= quiet and not idle_callbacks_pending():
+            return (changed_at - started) * 1000, True
+        if now - started > timeout:
+            return (changed_at - started) * 1000, False
+        time.sleep(0.001)
+
+
+def dispatch_ui_event(event, widget):
+    # keystrokes and spin steps go through the widgets' own class bindings, exactly one edit per event,
+    # so traces fire as they did while recording. Returns False when the widget ends up with a value
+    # other than the recorded one; the value is left alone, since patching it would time a different edit
+    kind = event["kind"]
+    if kind in ("key", "return"):
+        widget.focus_force()
+        widget.event_generate("<KeyPress>", keysym=event["keysym"], when="now")
+        widget.event_generate("<KeyRelease>", keysym=event["keysym"], when="now")
+    elif kind == "combobox":
+        widget.set(event["value"])  # what the listbox does on a pick, before it fires the event
+        widget.event_generate("<<ComboboxSelected>>")
+    elif kind == "spin":
+        widget.event_generate(f"<<{event['direction']}>>")
+    elif kind == "tree_select":
+        children = widget.get_children("")
+        widget.selection_set([children[i] for i in event["rows"] if i < len(children)])
+    elif kind in ("button", "toggle"):
+        widget.invoke()
+    return event.get("value") is None or _widget_value(widget) == event["value"]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+def replay_ui_session():
+    # each event is measured in isolation: dispatched, then waited on until the UI settles
+    with open(ui_session["path"], "r", encoding="utf-8") as f:
+        events = json.load(f)["events"]
+    wait_until_settled(time.perf_counter(), timeout=30.0)
+
+    latencies = {}
+    timeouts = {}
+    skipped = 0
+    diverged = 0
+    for event in events:
+        try:
+            widget = root.nametowidget(event["widget"])
+        except KeyError:
+            skipped += 1  # e.g. a dialog that is not open during replay
+            continue
+        started = time.perf_counter()
+        if not dispatch_ui_event(event, widget):
+            diverged += 1
+        latency, settled = wait_until_settled(started)
+        latencies.setdefault(event["kind"], [])
+        timeouts.setdefault(event["kind"], 0)
+        if settled:
+            latencies[event["kind"]].append(latency)
+        else:
+            timeouts[event["kind"]] += 1  # no latency to report: the UI never went quiet
+
+    report = {}
+    for kind, values in sorted(latencies.items()):
+        report[kind] = {"count": len(values), "timeouts": timeouts[kind],
+                        "p50_ms": percentile(values, 50) if values else None,
+                        "p99_ms": percentile(values, 99) if values else None,
+                        "max_ms": max(values) if values else None}
+
+    def ms(value):
+        return f"{'-':>10}" if value is None else f"{value:>10.1f}"
+
+    print(f"{'interaction':<14}{'count':>7}{'timeouts':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for kind, row in report.items():
+        print(f"{kind:<14}{row['count']:>7}{row['timeouts']:>10}{ms(row['p50_ms'])}{ms(row['p99_ms'])}"
+              f"{ms(row['max_ms'])}")
+    if skipped:
+        print(f"{skipped} events skipped (widget not present)")
+    if diverged:
+        print(f"{diverged} events left a widget value different from the recording")
+    timed_out = sum(timeouts.values())
+    if timed_out:
+        print(f"{timed_out} events did not settle within the timeout")
+    if ui_session["report"]:
+        with open(ui_session["report"], "w", encoding="utf-8") as f:
+            json.dump({"events": len(events), "skipped": skipped, "diverged": diverged, "timeouts": timed_out,
+                       "quiet_ms": ui_session["quiet_ms"], "interactions": report}, f, indent=1)
+    budget = ui_session["budget_ms"]
+    if budget is not None and any(row["p99_ms"] is not None and row["p99_ms"] > budget for row in report.values()):
+        print(f"p99 latency above the {budget:.0f} ms budget")
+        ui_session["exit_code"] = 1
+    if diverged or timed_out:
+        ui_session["exit_code"] = 1  # the timings are not of the recorded interaction, or are incomplete
+    on_close()
+
+
 def on_enter_key(event=None):
     if selected_cable["data"] is not None:
         calculate_losses_and_regulation()
@@ -1114,6 +2779,92 @@ def on_f1_key(event=None):
     return "break"
 
 
+# tools menu
+menubar = tk.Menu(root)
+tools_menu = tk.Menu(menubar, tearoff=0)
+tools_menu.add_command(label="Economic Settings...", command=show_economics_window)
+thermal_enabled_var = tk.BooleanVar(value=thermal_settings["enabled"])
+
+
+def on_thermal_toggle():
+    thermal_settings["enabled"] = thermal_enabled_var.get()
+    auto_filter_cables()
+
+
+tools_menu.add_checkbutton(label="Resistance at Operating Temperature", variable=thermal_enabled_var,
+                           command=on_thermal_toggle)
+sheath_menu = tk.Menu(tools_menu, tearoff=0)
+bonding_var = tk.StringVar(value=sheath_settings["bonding"])
+screen_materials = {"Copper screen": (1.7241e-8, 0.00393), "Aluminium screen": (2.8264e-8, 0.00403)}  # IEC 60287
+screen_material_var = tk.StringVar(value=next(
+    (name for name, values in screen_materials.items()
+     if values == (sheath_settings["screen_resistivity"], sheath_settings["screen_alpha"])), ""))
+
+
+def on_sheath_change():
+    sheath_settings["bonding"] = bonding_var.get()
+    if selected_cable["data"]:
+        update_cable_display()
+    auto_filter_cables()
+
+
+def on_screen_material_change():
+    sheath_settings["screen_resistivity"], sheath_settings["screen_alpha"] = screen_materials[
+        screen_material_var.get()]
+    on_sheath_change()
+
+
+def ask_flat_spacing():
+    spacing = simpledialog.askfloat("Flat Spacing", "Axial spacing of flat-laid single-core cables (mm), "
+                                                    "0 for two cable diameters:", parent=root,
+                                    initialvalue=sheath_settings["flat_spacing_mm"] or 0, minvalue=0)
+    if spacing is not None:
+        sheath_settings["flat_spacing_mm"] = spacing or None
+        on_sheath_change()
+
+
+for _bonding in ("Both ends", "Single point", "Cross-bonded"):
+    sheath_menu.add_radiobutton(label=_bonding, variable=bonding_var, value=_bonding, command=on_sheath_change)
+sheath_menu.add_separator()
+for _material in screen_materials:
+    sheath_menu.add_radiobutton(label=_material, variable=screen_material_var, value=_material,
+                                command=on_screen_material_change)
+sheath_menu.add_separator()
+sheath_menu.add_command(label="Flat Spacing...", command=ask_flat_spacing)
+tools_menu.add_cascade(label="Screen Bonding", menu=sheath_menu)
+exact_filter_var = tk.BooleanVar(value=voltage_settings["exact_filter"])
+
+
+def on_exact_filter_toggle():
+    voltage_settings["exact_filter"] = exact_filter_var.get()
+    auto_filter_cables()
+
+
+tools_menu.add_checkbutton(label="Exact Voltage Drop in Filter", variable=exact_filter_var,
+                           command=on_exact_filter_toggle)
+tools_menu.add_command(label="Transient Rating...", command=show_transient_window)
+tools_menu.add_command(label="Sweep Charts...", command=show_sweep_window)
+tools_menu.add_command(label="Pareto Frontier...", command=show_pareto_window)
+tools_menu.add_command(label="Result Store...", command=show_result_store_window)
+tools_menu.add_command(label="Result Cache...", command=show_cache_window)
+tools_menu.add_command(label="Sizing Atlas...", command=show_atlas_window)
+tools_menu.add_command(label="Load Aggregation...", command=show_load_window)
+tools_menu.add_command(label="Route Import...", command=show_route_window)
+tools_menu.add_command(label="Trench Optimizer...", command=show_trench_window)
+tools_menu.add_command(label="Tapered Collector Feeder...", command=show_collector_window)
+tools_menu.add_command(label="Mixed Parallel Circuits...", command=show_parallel_window)
+tools_menu.add_command(label="Motor Starting Batch...", command=show_motor_batch_window)
+menubar.add_cascade(label="Tools", menu=tools_menu)
+
+project_menu = tk.Menu(menubar, tearoff=0)
+project_menu.add_command(label="Feeders...", command=show_project_window)
+project_menu.add_separator()
+project_menu.add_command(label="Open Project...", command=lambda: open_project_dialog() is not None
+                         and auto_filter_cables())
+project_menu.add_command(label="Save Project", command=save_project_dialog)
+menubar.add_cascade(label="Project", menu=project_menu)
+root.config(menu=menubar)
+
 # key bindings
 root.bind('<Return>', on_enter_key)
 root.bind('<KP_Enter>', on_enter_key)
@@ -1124,9 +2875,28 @@ root.focus_set()
 
 def initialize_app():
     on_cable_type_change()
+    on_load_type_change()
     auto_filter_cables()
 
 
 root.after(1000, initialize_app)
+if ui_session["mode"] == "record":
+    root.after(1000, start_recording)
+elif ui_session["mode"] == "replay":
+    root.after(1100, replay_ui_session)
+
+
+def on_close():
+    if ui_session["mode"] == "record":
+        save_recording()
+    close_result_store()
+    close_result_cache()
+    root.destroy()
+
+
+root.protocol("WM_DELETE_WINDOW", on_close)
 
-root.mainloop()
\ No newline at end of file
+root.mainloop()
+if ui_session["xvfb"] is not None:
+    ui_session["xvfb"].terminate()
+sys.exit(ui_session["exit_code"])
\ No newline at end of file
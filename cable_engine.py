@@ -0,0 +1,2262 @@
+# calculation engine of the cable selector: catalog, derating and economic models, sizing,
+# batch tools and their stores. no GUI code, so it can be imported and tested headlessly
+
+import array
+import bisect
+import csv
+import hashlib
+import json
+import math
+import mmap
+import random
+import re
+import sqlite3
+import struct
+import sys
+import time
+
+# cable database
+cable_list = [
+    # 0.6/1kV single-core
+    {"id": 1, "code": "1x10 mm2", "voltage": "0.6/1 kV", "fcc": 81, "tcc": 69, "resistance": 1.83,
+     "inductance_flat": 0.34, "inductance_trefoil": 0.41, "capacitance": None, "price": 102300},
+    {"id": 2, "code": "1x16 mm2", "voltage": "0.6/1 kV", "fcc": 108, "tcc": 92, "resistance": 1.15,
+     "inductance_flat": 0.317, "inductance_trefoil": 0.387, "capacitance": None, "price": 156600},
+    {"id": 3, "code": "1x25 mm2", "voltage": "0.6/1 kV", "fcc": 146, "tcc": 124, "resistance": 0.727,
+     "inductance_flat": 0.304, "inductance_trefoil": 0.374, "capacitance": None, "price": 241400},
+    {"id": 4, "code": "1x35 mm2", "voltage": "0.6/1 kV", "fcc": 180, "tcc": 153, "resistance": 0.524,
+     "inductance_flat": 0.291, "inductance_trefoil": 0.36, "capacitance": None, "price": 328300},
+    {"id": 5, "code": "1x50 mm2", "voltage": "0.6/1 kV", "fcc": 220, "tcc": 187, "resistance": 0.387,
+     "inductance_flat": 0.281, "inductance_trefoil": 0.351, "capacitance": None, "price": 434000},
+    {"id": 6, "code": "1x70 mm2", "voltage": "0.6/1 kV", "fcc": 279, "tcc": 237, "resistance": 0.268,
+     "inductance_flat": 0.272, "inductance_trefoil": 0.341, "capacitance": None, "price": 623000},
+    {"id": 7, "code": "1x95 mm2", "voltage": "0.6/1 kV", "fcc": 347, "tcc": 294, "resistance": 0.193,
+     "inductance_flat": 0.264, "inductance_trefoil": 0.333, "capacitance": None, "price": 847000},
+    {"id": 8, "code": "1x120 mm2", "voltage": "0.6/1 kV", "fcc": 405, "tcc": 343, "resistance": 0.153,
+     "inductance_flat": 0.259, "inductance_trefoil": 0.329, "capacitance": None, "price": 1080000},
+
+    # 0.6/1kV three-core
+    {"id": 9, "code": "3x16+10 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 89, "resistance": 1.15,
+     "inductance_flat": None, "inductance_trefoil": 0.264, "capacitance": None, "price": 640000},
+    {"id": 10, "code": "3x25+16 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 120, "resistance": 0.727,
+     "inductance_flat": None, "inductance_trefoil": 0.265, "capacitance": None, "price": 990000},
+    {"id": 11, "code": "3x35+16 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 147, "resistance": 0.524,
+     "inductance_flat": None, "inductance_trefoil": 0.258, "capacitance": None, "price": 1300000},
+    {"id": 12, "code": "3x50+25 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 179, "resistance": 0.387,
+     "inductance_flat": None, "inductance_trefoil": 0.256, "capacitance": None, "price": 1750000},
+    {"id": 13, "code": "3x70+35 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 224, "resistance": 0.268,
+     "inductance_flat": None, "inductance_trefoil": 0.253, "capacitance": None, "price": 2520000},
+    {"id": 14, "code": "3x95+50 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 277, "resistance": 0.193,
+     "inductance_flat": None, "inductance_trefoil": 0.247, "capacitance": None, "price": 3400000},
+    {"id": 15, "code": "3x120+70 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 323, "resistance": 0.153,
+     "inductance_flat": None, "inductance_trefoil": 0.246, "capacitance": None, "price": 4400000},
+    {"id": 16, "code": "3x150+70 mm2", "voltage": "0.6/1 kV", "fcc": None, "tcc": 368, "resistance": 0.124,
+     "inductance_flat": None, "inductance_trefoil": 0.248, "capacitance": None, "price": 5200000},
+
+    # 3.6/6kV single-core
+    {"id": 17, "code": "1x25 mm2", "voltage": "3.6/6 kV", "fcc": 196, "tcc": 163, "resistance": 0.727,
+     "inductance_flat": 0.77, "inductance_trefoil": 0.43, "capacitance": 0.25, "price": 351000},
+    {"id": 18, "code": "1x35 mm2", "voltage": "3.6/6 kV", "fcc": 238, "tcc": 198, "resistance": 0.524,
+     "inductance_flat": 0.75, "inductance_trefoil": 0.41, "capacitance": 0.28, "price": 532000},
+    {"id": 19, "code": "1x50 mm2", "voltage": "3.6/6 kV", "fcc": 286, "tcc": 238, "resistance": 0.387,
+     "inductance_flat": 0.72, "inductance_trefoil": 0.39, "capacitance": 0.31, "price": 638000},
+    {"id": 20, "code": "1x70 mm2", "voltage": "3.6/6 kV", "fcc": 356, "tcc": 296, "resistance": 0.268,
+     "inductance_flat": 0.68, "inductance_trefoil": 0.37, "capacitance": 0.36, "price": 825000},
+    {"id": 21, "code": "1x95 mm2", "voltage": "3.6/6 kV", "fcc": 434, "tcc": 361, "resistance": 0.193,
+     "inductance_flat": 0.65, "inductance_trefoil": 0.36, "capacitance": 0.4, "price": 1070000},
+    {"id": 22, "code": "1x120 mm2", "voltage": "3.6/6 kV", "fcc": 600, "tcc": 417, "resistance": 0.153,
+     "inductance_flat": 0.63, "inductance_trefoil": 0.34, "capacitance": 0.44, "price": 1300000},
+    {"id": 23, "code": "1x150 mm2", "voltage": "3.6/6 kV", "fcc": 559, "tcc": 473, "resistance": 0.124,
+     "inductance_flat": 0.62, "inductance_trefoil": 0.33, "capacitance": 0.48, "price": 1640000},
+    {"id": 24, "code": "1x185 mm2", "voltage": "3.6/6 kV", "fcc": 637, "tcc": 543, "resistance": 0.0991,
+     "inductance_flat": 0.6, "inductance_trefoil": 0.32, "capacitance": 0.52, "price": 1950000},
+
+    # 3.6/6kV three-core
+    {"id": 25, "code": "3x25+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 143, "resistance": 0.727,
+     "inductance_flat": None, "inductance_trefoil": 0.37, "capacitance": 0.25, "price": 1647000},
+    {"id": 26, "code": "3x35+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 172, "resistance": 0.524,
+     "inductance_flat": None, "inductance_trefoil": 0.35, "capacitance": 0.28, "price": 2002000},
+    {"id": 27, "code": "3x50+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 205, "resistance": 0.387,
+     "inductance_flat": None, "inductance_trefoil": 0.34, "capacitance": 0.3, "price": 2594000},
+    {"id": 28, "code": "3x70+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 253, "resistance": 0.268,
+     "inductance_flat": None, "inductance_trefoil": 0.32, "capacitance": 0.35, "price": 3450000},
+    {"id": 29, "code": "3x95+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 307, "resistance": 0.193,
+     "inductance_flat": None, "inductance_trefoil": 0.31, "capacitance": 0.39, "price": 4727000},
+    {"id": 30, "code": "3x120+16 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 352, "resistance": 0.153,
+     "inductance_flat": None, "inductance_trefoil": 0.3, "capacitance": 0.43, "price": 5784000},
+    {"id": 31, "code": "3x150+25 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 397, "resistance": 0.124,
+     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.47, "price": 6963000},
+    {"id": 32, "code": "3x185+25 mm2", "voltage": "3.6/6 kV", "fcc": None, "tcc": 453, "resistance": 0.0991,
+     "inductance_flat": None, "inductance_trefoil": 0.28, "capacitance": 0.5, "price": 8481000},
+
+    # 6/10kV single-core
+    {"id": 33, "code": "1x35 mm2", "voltage": "6/10 kV", "fcc": 231, "tcc": 195, "resistance": 0.524,
+     "inductance_flat": 0.661, "inductance_trefoil": 0.383, "capacitance": 0.223, "price": 785100},
+    {"id": 34, "code": "1x50 mm2", "voltage": "6/10 kV", "fcc": 277, "tcc": 234, "resistance": 0.387,
+     "inductance_flat": 0.636, "inductance_trefoil": 0.366, "capacitance": 0.248, "price": 944900},
+    {"id": 35, "code": "1x70 mm2", "voltage": "6/10 kV", "fcc": 345, "tcc": 292, "resistance": 0.268,
+     "inductance_flat": 0.606, "inductance_trefoil": 0.349, "capacitance": 0.285, "price": 1226000},
+    {"id": 36, "code": "1x95 mm2", "voltage": "6/10 kV", "fcc": 418, "tcc": 354, "resistance": 0.193,
+     "inductance_flat": 0.582, "inductance_trefoil": 0.334, "capacitance": 0.32, "price": 1533000},
+    {"id": 37, "code": "1x120 mm2", "voltage": "6/10 kV", "fcc": 481, "tcc": 407, "resistance": 0.153,
+     "inductance_flat": 0.563, "inductance_trefoil": 0.323, "capacitance": 0.35, "price": 1872000},
+    {"id": 38, "code": "1x150 mm2", "voltage": "6/10 kV", "fcc": 537, "tcc": 460, "resistance": 0.124,
+     "inductance_flat": 0.546, "inductance_trefoil": 0.313, "capacitance": 0.382, "price": 2362000},
+    {"id": 39, "code": "1x185 mm2", "voltage": "6/10 kV", "fcc": 612, "tcc": 527, "resistance": 0.0991,
+     "inductance_flat": 0.529, "inductance_trefoil": 0.304, "capacitance": 0.415, "price": 2838000},
+
+    # 6/10kV three-core
+    {"id": 40, "code": "3x35 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 173, "resistance": 0.524,
+     "inductance_flat": None, "inductance_trefoil": 0.374, "capacitance": 0.189, "price": 2127000},
+    {"id": 41, "code": "3x50 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 206, "resistance": 0.387,
+     "inductance_flat": None, "inductance_trefoil": 0.355, "capacitance": 0.209, "price": 2716000},
+    {"id": 42, "code": "3x70 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 257, "resistance": 0.268,
+     "inductance_flat": None, "inductance_trefoil": 0.336, "capacitance": 0.236, "price": 3603000},
+    {"id": 43, "code": "3x95 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 313, "resistance": 0.193,
+     "inductance_flat": None, "inductance_trefoil": 0.32, "capacitance": 0.263, "price": 4901000},
+    {"id": 44, "code": "3x120 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 360, "resistance": 0.153,
+     "inductance_flat": None, "inductance_trefoil": 0.308, "capacitance": 0.291, "price": 5934000},
+    {"id": 45, "code": "3x150 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 410, "resistance": 0.124,
+     "inductance_flat": None, "inductance_trefoil": 0.299, "capacitance": 0.314, "price": 7125000},
+    {"id": 46, "code": "3x185 mm2", "voltage": "6/10 kV", "fcc": None, "tcc": 469, "resistance": 0.0991,
+     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.341, "price": 8659000},
+
+    # 12/20kV single-core
+    {"id": 47, "code": "1x95 mm2", "voltage": "12/20 kV", "fcc": 420, "tcc": 358, "resistance": 0.193,
+     "inductance_flat": 0.59, "inductance_trefoil": 0.36, "capacitance": 0.218, "price": 1560000},
+    {"id": 48, "code": "1x120 mm2", "voltage": "12/20 kV", "fcc": 483, "tcc": 412, "resistance": 0.153,
+     "inductance_flat": 0.571, "inductance_trefoil": 0.349, "capacitance": 0.238, "price": 1906000},
+    {"id": 49, "code": "1x150 mm2", "voltage": "12/20 kV", "fcc": 540, "tcc": 466, "resistance": 0.124,
+     "inductance_flat": 0.554, "inductance_trefoil": 0.338, "capacitance": 0.258, "price": 2393000},
+    {"id": 50, "code": "1x185 mm2", "voltage": "12/20 kV", "fcc": 614, "tcc": 534, "resistance": 0.0991,
+     "inductance_flat": 0.538, "inductance_trefoil": 0.329, "capacitance": 0.278, "price": 2877000},
+    {"id": 51, "code": "1x240 mm2", "voltage": "12/20 kV", "fcc": 718, "tcc": 627, "resistance": 0.0754,
+     "inductance_flat": 0.518, "inductance_trefoil": 0.317, "capacitance": 0.308, "price": 3543000},
+    {"id": 52, "code": "1x300 mm2", "voltage": "12/20 kV", "fcc": 813, "tcc": 715, "resistance": 0.0601,
+     "inductance_flat": 0.501, "inductance_trefoil": 0.308, "capacitance": 0.336, "price": 4455000},
+    {"id": 53, "code": "1x400 mm2", "voltage": "12/20 kV", "fcc": 904, "tcc": 819, "resistance": 0.047,
+     "inductance_flat": 0.48, "inductance_trefoil": 0.298, "capacitance": 0.377, "price": 5669000},
+
+    # 20.3/35kV single-core
+    {"id": 54, "code": "1x150 mm2", "voltage": "20.3/35 kV", "fcc": 559, "tcc": 473, "resistance": 0.124,
+     "inductance_flat": 0.64, "inductance_trefoil": 0.41, "capacitance": 0.17, "price": 1720000},
+    {"id": 55, "code": "1x185 mm2", "voltage": "20.3/35 kV", "fcc": 637, "tcc": 543, "resistance": 0.0991,
+     "inductance_flat": 0.63, "inductance_trefoil": 0.39, "capacitance": 0.18, "price": 2020000},
+    {"id": 56, "code": "1x240 mm2", "voltage": "20.3/35 kV", "fcc": 745, "tcc": 641, "resistance": 0.0754,
+     "inductance_flat": 0.6, "inductance_trefoil": 0.38, "capacitance": 0.2, "price": 2530000},
+    {"id": 57, "code": "1x300 mm2", "voltage": "20.3/35 kV", "fcc": 846, "tcc": 735, "resistance": 0.0601,
+     "inductance_flat": 0.59, "inductance_trefoil": 0.37, "capacitance": 0.21, "price": 3150000},
+    {"id": 58, "code": "1x400 mm2", "voltage": "20.3/35 kV", "fcc": 938, "tcc": 845, "resistance": 0.047,
+     "inductance_flat": 0.57, "inductance_trefoil": 0.35, "capacitance": 0.23, "price": 4100000},
+    {"id": 59, "code": "1x500 mm2", "voltage": "20.3/35 kV", "fcc": 1010, "tcc": 950, "resistance": 0.0366,
+     "inductance_flat": 0.55, "inductance_trefoil": 0.34, "capacitance": 0.26, "price": 5150000},
+    {"id": 60, "code": "1x630 mm2", "voltage": "20.3/35 kV", "fcc": 1120, "tcc": 1040, "resistance": 0.0283,
+     "inductance_flat": 0.52, "inductance_trefoil": 0.33, "capacitance": 0.29, "price": 6550000},
+
+    # 20.3/35kV three-core
+    {"id": 61, "code": "3x95 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 307, "resistance": 0.193,
+     "inductance_flat": None, "inductance_trefoil": 0.4, "capacitance": 0.15, "price": 4600000},
+    {"id": 62, "code": "3x120 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 352, "resistance": 0.153,
+     "inductance_flat": None, "inductance_trefoil": 0.39, "capacitance": 0.16, "price": 5500000},
+    {"id": 63, "code": "3x150 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 397, "resistance": 0.124,
+     "inductance_flat": None, "inductance_trefoil": 0.37, "capacitance": 0.17, "price": 6400000},
+    {"id": 64, "code": "3x185 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 453, "resistance": 0.0991,
+     "inductance_flat": None, "inductance_trefoil": 0.36, "capacitance": 0.18, "price": 7500000},
+    {"id": 65, "code": "3x240 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 529, "resistance": 0.0754,
+     "inductance_flat": None, "inductance_trefoil": 0.35, "capacitance": 0.2, "price": 9400000},
+    {"id": 66, "code": "3x300 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 626, "resistance": 0.0601,
+     "inductance_flat": None, "inductance_trefoil": 0.29, "capacitance": 0.22, "price": 11300000},
+    {"id": 67, "code": "3x400 mm2", "voltage": "20.3/35 kV", "fcc": None, "tcc": 720, "resistance": 0.047,
+     "inductance_flat": None, "inductance_trefoil": 0.28, "capacitance": 0.24, "price": 14300000},
+]
+
+
+def parse_voltage_kV(voltage_str):
+    # get max voltage from string like "6/10 kV"
+    if not voltage_str:
+        return 0.0
+    parts = voltage_str.replace('kV', '').strip().split('/')
+    try:
+        nums = [float(p) for p in parts]
+        return max(nums) if nums else 0.0
+    except:
+        return float(parts[-1]) if parts else 0.0
+
+
+# derating and economic model settings
+temp_factor_table = {5: 1.15, 10: 1.10, 15: 1.05, 20: 1.00, 25: 0.95, 30: 0.90, 35: 0.85, 40: 0.80}
+trench_factor_table = {1: 1.00, 2: 0.90, 3: 0.85, 4: 0.80, 5: 0.75, 6: 0.70}
+installation_factor_table = {"direct": 1.00, "ducted": 0.85}  # catalog ratings are for direct burial
+economic_settings = {
+    "electricity_price": 2500,  # TL/MWh
+    "hours_per_day": {"Industrial": 10, "Residential": 5, "Municipal": 12, "Commercial": 8},
+    # lifecycle model, rates as fractions per year
+    "years": 10,
+    "discount_rate": 0.0,
+    "load_growth": 0.0,
+    "price_escalation": 0.0,
+    "residual_value": 0.0,  # fraction of installation cost recovered at the end of the horizon
+}
+
+# conductor resistance correction to operating temperature (catalog values are at 20 degC)
+thermal_settings = {
+    "enabled": True,
+    "max_conductor_temp": 90.0,  # XLPE rated conductor temperature, degC
+    "reference_temp": 20.0,
+    "alpha": 0.00393,  # copper, 1/K
+    "runaway_temp": 250.0,  # iteration ceiling for overloaded cables with no fixed point
+}
+
+# two-node transient thermal model (conductor + insulation, surrounding soil) for cyclic and emergency ratings
+transient_settings = {
+    "use_cyclic_rating": False,  # capacity check against the cyclic instead of the continuous rating
+    "load_cycle": [0.45, 0.42, 0.40, 0.40, 0.42, 0.50, 0.65, 0.80, 0.92, 0.97, 1.00, 0.98,
+                   0.90, 0.95, 0.98, 0.96, 0.90, 0.82, 0.75, 0.70, 0.65, 0.58, 0.52, 0.48],  # hourly, p.u. of peak
+    "cable_share": 0.35,  # share of the total thermal resistance inside the cable
+    "insulation_heat_ratio": 1.0,  # insulation and sheath heat capacity relative to the conductor's
+    "soil_tau_hours": 8.0,
+    "cycle_step_minutes": 10,
+    "emergency_step_minutes": 1,
+    "emergency_hours": 24,
+}
+
+# exact phasor voltage drop: constant-power load behind the cable's pi model
+voltage_settings = {
+    "exact_filter": False,  # max lengths and the regulation limit use the exact drop
+    "tol": 1e-9,  # relative, on |Vr|^2
+    "max_iter": 50,
+}
+
+# metallic screen circulating currents of single-core MV cables (IEC 60287-1-1 loss factor lambda1')
+sheath_settings = {
+    "bonding": "Both ends",  # "Both ends", "Single point" or "Cross-bonded"
+    "flat_spacing_mm": None,  # axial spacing in flat formation; None = two cable diameters
+    "cross_bonded_residual": 0.03,  # IEC value for cross-bonded cables laid directly in the ground
+    "screen_mm2": [(300, 16), (float("inf"), 25)],  # copper wire screen by conductor section
+    "screen_resistivity": 1.7241e-8,  # ohm m at thermal_settings["reference_temp"]
+    "screen_alpha": 0.00393,  # 1/K
+    "insulation_mm": [(7.2, 2.5), (12, 3.4), (24, 5.5), (float("inf"), 8.8)],  # by U (kV)
+}
+
+
+def get_temp_factor(temp_c):
+    if temp_c <= 5:
+        return temp_factor_table[5]
+    if temp_c >= 40:
+        return temp_factor_table[40]
+    rounded_up = min(k for k in temp_factor_table if k >= temp_c)
+    return temp_factor_table[rounded_up]
+
+
+def get_trench_factor(num_circuits):
+    num_circuits = max(1, min(6, num_circuits))
+    return trench_factor_table[num_circuits]
+
+
+def get_line_params(cable, arrangement):
+    # R (ohm/km), L (mH/km), X (ohm/km at 50Hz) for the given arrangement
+    R = cable['resistance']
+    if cable['code'].startswith('1x'):
+        L = (cable['inductance_flat'] if arrangement == "Flat" and cable['inductance_flat']
+             else cable['inductance_trefoil']) or 0.3
+    else:
+        L = cable['inductance_trefoil'] or 0.3
+    X = 2 * math.pi * 50 * L / 1000
+    return R, L, X
+
+
+def solve_conductor_temperatures(resistances, loading_ratios, ambient, tol=1e-6, max_iter=100):
+    # conductor temperature rise scales with I^2 * R(theta), reaching the rated temperature
+    # at the derated capacity:
+    #   theta = ambient + (theta_max - ambient) * ratio^2 * R(theta) / R(theta_max)
+    # iterated as a fixed point for every candidate at once; each pass only touches the
+    # candidates that have not settled yet
+    ts = thermal_settings
+    alpha, t_ref, t_max, t_cap = ts["alpha"], ts["reference_temp"], ts["max_conductor_temp"], ts["runaway_temp"]
+    rise_max = t_max - ambient
+    r_max_factor = 1 + alpha * (t_max - t_ref)
+    gains = [rise_max * ratio ** 2 / r_max_factor for ratio in loading_ratios]
+
+    temps = [ambient for _ in resistances]
+    converged = [False for _ in resistances]
+    active = list(range(len(resistances)))
+    iterations = 0
+    while active and iterations < max_iter:
+        iterations += 1
+        still_active = []
+        for k in active:
+            new_temp = min(t_cap, ambient + gains[k] * (1 + alpha * (temps[k] - t_ref)))
+            settled = abs(new_temp - temps[k]) < tol
+            temps[k] = new_temp
+            if new_temp >= t_cap:
+                continue  # ratios far above 1 have no fixed point (thermal runaway): stays unconverged
+            if settled:
+                converged[k] = True
+            else:
+                still_active.append(k)
+        active = still_active
+    op_resistances = [R * (1 + alpha * (t - t_ref)) for R, t in zip(resistances, temps)]
+    return temps, op_resistances, converged, iterations
+
+
+def get_operating_resistance(R, I_per_circuit, derated_capacity, ambient):
+    if not thermal_settings["enabled"] or derated_capacity <= 0:
+        return R, thermal_settings["reference_temp"], True, 0
+    temps, rs, converged, iterations = solve_conductor_temperatures([R], [I_per_circuit / derated_capacity],
+                                                                    ambient)
+    return rs[0], temps[0], converged[0], iterations
+
+
+def conductor_area_mm2(code):
+    # total copper area of one cable: "3x95+50 mm2" -> 335, "1x240 mm2" -> 240
+    match = re.match(r"\s*(\d+)x(\d+(?:\.\d+)?)(?:\+(\d+(?:\.\d+)?))?", code)
+    if not match:
+        return 0.0
+    return int(match.group(1)) * float(match.group(2)) + float(match.group(3) or 0)
+
+
+def build_thermal_networks(cables, derated_capacities, ambient):
+    # per cable: the exact one-step transition x' = M x + q w of the RC ladder for a step of
+    # constant loss w (p.u. of the loss at the continuous rating); x = rises over ambient
+    settings = transient_settings
+    t_max = thermal_settings["max_conductor_temp"]
+    r_max_factor = 1 + thermal_settings["alpha"] * (t_max - thermal_settings["reference_temp"])
+    networks = []
+    for cable, derated in zip(cables, derated_capacities):
+        loaded_conductors = 1 if cable["code"].startswith("1x") else 3
+        W_rated = loaded_conductors * derated ** 2 * cable["resistance"] * r_max_factor / 1000  # W/m at max temp
+        if W_rated <= 0 or t_max <= ambient:
+            networks.append(None)
+            continue
+        T = (t_max - ambient) / W_rated  # K.m/W
+        T1, T2 = settings["cable_share"] * T, (1 - settings["cable_share"]) * T
+        C1 = 3.45e6 * conductor_area_mm2(cable["code"]) * 1e-6 * (1 + settings["insulation_heat_ratio"])  # J/(m.K)
+        C2 = settings["soil_tau_hours"] * 3600 / T2
+        networks.append({"W": W_rated, "T1": T1, "T2": T2, "C1": C1, "C2": C2, "limit": t_max - ambient})
+    return networks
+
+
+def _thermal_transition(network, dt):
+    # exp(A dt) of the 2x2 ladder by its two real eigenvalues (Sylvester's formula)
+    g1, g2, C1, C2 = 1 / network["T1"], 1 / network["T2"], network["C1"], network["C2"]
+    a11, a12, a21, a22 = -g1 / C1, g1 / C1, g1 / C2, -(g1 + g2) / C2
+    tr, det = a11 + a22, a11 * a22 - a12 * a21
+    disc = math.sqrt(max(tr * tr / 4 - det, 0.0))
+    l1, l2 = tr / 2 + disc, tr / 2 - disc
+    e1, e2 = math.exp(l1 * dt), math.exp(l2 * dt)
+    if l1 - l2 < 1e-15:
+        c0, c1 = e1 * (1 - l1 * dt), e1 * dt
+    else:
+        c0, c1 = (l1 * e2 - l2 * e1) / (l1 - l2), (e1 - e2) / (l1 - l2)
+    m11, m12, m21, m22 = c0 + c1 * a11, c1 * a12, c1 * a21, c0 + c1 * a22
+    # steady rises under the rated loss W: conductor W*(T1+T2), soil node W*T2
+    ss1, ss2 = network["W"] * (network["T1"] + network["T2"]), network["W"] * network["T2"]
+    q1, q2 = ss1 - (m11 * ss1 + m12 * ss2), ss2 - (m21 * ss1 + m22 * ss2)
+    return m11, m12, m21, m22, q1, q2
+
+
+def calc_cyclic_factors(networks, cycle=None):
+    # resistance is taken at the maximum temperature, so the peak rise scales with the square
+    # of the peak current and one simulated cycle gives the factor M = sqrt(limit / peak rise)
+    cycle = cycle or transient_settings["load_cycle"]
+    peak = max(cycle)
+    steps_per_hour = max(1, round(60 / transient_settings["cycle_step_minutes"]))
+    losses = [(v / peak) ** 2 for v in cycle for _ in range(steps_per_hour)]
+    mean_loss = sum(losses) / len(losses)
+    dt = 3600 / steps_per_hour
+
+    live = [i for i, n in enumerate(networks) if n is not None]
+    trans = [_thermal_transition(networks[i], dt) for i in live]
+    # start from the steady state of the mean loss, then run two days and keep the second
+    x1 = [mean_loss * networks[i]["W"] * (networks[i]["T1"] + networks[i]["T2"]) for i in live]
+    x2 = [mean_loss * networks[i]["W"] * networks[i]["T2"] for i in live]
+    peaks = [0.0 for _ in live]
+    for day in range(2):
+        for w in losses:
+            x1, x2 = ([m11 * a + m12 * b + q1 * w for (m11, m12, _, _, q1, _), a, b in zip(trans, x1, x2)],
+                      [m21 * a + m22 * b + q2 * w for (_, _, m21, m22, _, q2), a, b in zip(trans, x1, x2)])
+            if day:
+                peaks = [max(p, a) for p, a in zip(peaks, x1)]
+
+    factors = [None for _ in networks]
+    for i, peak_rise in zip(live, peaks):
+        factors[i] = math.sqrt(networks[i]["limit"] / peak_rise) if peak_rise > 0 else None
+    return factors
+
+
+def calc_emergency_times(networks, pre_loads, overloads):
+    # hours from steady state at pre_loads until the conductor reaches its maximum temperature
+    # under overloads (both p.u. of the continuous rating); None if not reached within the horizon
+    step = transient_settings["emergency_step_minutes"] * 60
+    horizon = int(transient_settings["emergency_hours"] * 3600 / step)
+    times = [None for _ in networks]
+    live = [i for i, n in enumerate(networks) if n is not None and overloads[i] > 1]
+    trans = [_thermal_transition(networks[i], step) for i in live]
+    w_em = [overloads[i] ** 2 for i in live]
+    x1 = [pre_loads[i] ** 2 * networks[i]["W"] * (networks[i]["T1"] + networks[i]["T2"]) for i in live]
+    x2 = [pre_loads[i] ** 2 * networks[i]["W"] * networks[i]["T2"] for i in live]
+    limits = [networks[i]["limit"] for i in live]
+    for k, (i, a, limit) in enumerate(zip(live, x1, limits)):
+        if a >= limit:
+            times[i] = 0.0
+    for n in range(1, horizon + 1):
+        if all(times[i] is not None for i in live):
+            break
+        new1 = [m11 * a + m12 * b + q1 * w for (m11, m12, _, _, q1, _), a, b, w in zip(trans, x1, x2, w_em)]
+        x2 = [m21 * a + m22 * b + q2 * w for (_, _, m21, m22, _, q2), a, b, w in zip(trans, x1, x2, w_em)]
+        for i, before, after, limit in zip(live, x1, new1, limits):
+            if times[i] is None and after >= limit:
+                times[i] = (n - 1 + (limit - before) / (after - before)) * step / 3600
+        x1 = new1
+    return times
+
+
+_cyclic_factor_cache = {}
+
+
+def get_cyclic_factors(cables, derated_capacities, ambient):
+    # memoized on everything the factor depends on, so the filter and batch modes can call it freely
+    key_base = (tuple(transient_settings["load_cycle"]), transient_settings["cable_share"],
+                transient_settings["insulation_heat_ratio"], transient_settings["soil_tau_hours"],
+                transient_settings["cycle_step_minutes"], thermal_settings["max_conductor_temp"],
+                thermal_settings["alpha"], ambient)
+    keys = [(cable["code"], cable["resistance"], round(derated, 6), key_base)
+            for cable, derated in zip(cables, derated_capacities)]
+    missing = [k for k, key in enumerate(keys) if key not in _cyclic_factor_cache]
+    if missing:
+        if len(_cyclic_factor_cache) > 20000:
+            _cyclic_factor_cache.clear()
+        networks = build_thermal_networks([cables[k] for k in missing], [derated_capacities[k] for k in missing],
+                                          ambient)
+        for k, factor in zip(missing, calc_cyclic_factors(networks)):
+            _cyclic_factor_cache[keys[k]] = factor
+    return [_cyclic_factor_cache[key] for key in keys]
+
+
+def get_rated_capacities(cables, derated_capacities, ambient):
+    # what the capacity check compares against: the derated continuous rating, or the cyclic one when enabled
+    if not transient_settings["use_cyclic_rating"]:
+        return list(derated_capacities)
+    factors = get_cyclic_factors(cables, derated_capacities, ambient)
+    return [d * (m or 1.0) for d, m in zip(derated_capacities, factors)]
+
+
+def calc_max_lengths(cables, P, Q, V, N, arrangement, ambient, reg_limit, grouping=0, installation="direct"):
+    # inverse of the regulation formula: VR = I*(R*cos + X*sin)*L / VLN*100
+    # solved for L, for every cable at once
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    if S_MVA <= 0 or V <= 0 or reg_limit <= 0:
+        return [None for _ in cables]
+    I_per_circuit = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) / N
+    cos_phi = P / S_MVA
+    sin_phi = Q / S_MVA
+    VLN_volts = V * 1000 / math.sqrt(3)
+    allowed_drop = reg_limit / 100 * VLN_volts
+
+    params = [get_line_params(c, arrangement) for c in cables]
+    resistances = [R for R, _, _ in params]
+    if thermal_settings["enabled"]:
+        temp_factor = get_temp_factor(ambient) * installation_factor_table[installation]
+        ratios = []
+        for cable in cables:
+            cables_in_trench = N * 3 if cable["code"].startswith("1x") else N
+            derated = get_base_capacity(cable, arrangement) * temp_factor * get_trench_factor(
+                min(cables_in_trench + grouping, 6))
+            ratios.append(I_per_circuit / derated)
+        _, resistances, _, _ = solve_conductor_temperatures(resistances, ratios, ambient)
+
+    if voltage_settings["exact_filter"]:
+        return calc_exact_max_lengths(cables, P, Q, V, N, arrangement, resistances, reg_limit)
+    drops_per_km = [I_per_circuit * (R * cos_phi + X * sin_phi) for R, (_, _, X) in zip(resistances, params)]
+    return [allowed_drop / d if d > 0 else None for d in drops_per_km]
+
+
+def calc_max_length_table(cables, P, Q, V, max_circuits, arrangement, ambient, reg_limit, grouping=0,
+                          installation="direct"):
+    # max lengths for every circuit count 1..max_circuits: rows[k][N - 1] for cables[k].
+    # The drop per km scales with 1/N (the cooler conductor aside), so each count is one more
+    # closed-form pass; None where the cable cannot carry the load with that many circuits
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
+    temp_factor = get_temp_factor(ambient) * installation_factor_table[installation]
+    columns = []
+    for N in range(1, max_circuits + 1):
+        lengths = calc_max_lengths(cables, P, Q, V, N, arrangement, ambient, reg_limit, grouping, installation)
+        derated = [get_base_capacity(c, arrangement) * temp_factor * get_trench_factor(
+            min((N * 3 if c["code"].startswith("1x") else N) + grouping, 6)) for c in cables]
+        rated = get_rated_capacities(cables, derated, ambient)
+        columns.append([L if r >= I_total / N else None for L, r in zip(lengths, rated)])
+    return [list(row) for row in zip(*columns)] if cables else []
+
+
+def solve_receiving_voltages(lines, P, Q, V):
+    # lines: per-phase (Z, Y) of each feeder with parallel circuits combined; sending end held at V.
+    # With A = 1 + ZY/2, B = Z and Ir = conj(S / Vr), Vs = A Vr + B Ir gives a quadratic in u = |Vr|^2:
+    #     g(u) = |A|^2 u^2 + (2 Re(A conj(B) S) - |Vs|^2) u + |B|^2 |S|^2 = 0
+    # The operating point is the larger root. Newton starts above it at the sum of the roots and
+    # descends monotonically; a positive minimum of g means the load is past the collapse point.
+    Vs2 = (V * 1000 / math.sqrt(3)) ** 2
+    S = complex(P, Q) * 1e6 / 3
+    coeffs = []
+    for Z, Y in lines:
+        A = 1 + Z * Y / 2
+        a = abs(A) ** 2
+        b = 2 * (A * Z.conjugate() * S).real - Vs2
+        c = abs(Z) ** 2 * abs(S) ** 2
+        coeffs.append((a, b, c))
+
+    u = [-b / a for a, b, c in coeffs]
+    collapsed = [c - b * b / (4 * a) > 0 for a, b, c in coeffs]
+    converged = [False for _ in coeffs]
+    active = [k for k in range(len(coeffs)) if not collapsed[k]]
+    iterations = 0
+    while active and iterations < voltage_settings["max_iter"]:
+        iterations += 1
+        still_active = []
+        for k in active:
+            a, b, c = coeffs[k]
+            slope = 2 * a * u[k] + b
+            step = (a * u[k] * u[k] + b * u[k] + c) / slope if slope > 0 else 0.0
+            u[k] -= step
+            if abs(step) <= voltage_settings["tol"] * max(u[k], 1.0):
+                converged[k] = True
+            else:
+                still_active.append(k)
+        active = still_active
+
+    results = []
+    for k in range(len(coeffs)):
+        if collapsed[k]:
+            results.append(None)
+            continue
+        Vr = math.sqrt(max(u[k], 0.0))
+        results.append({"V_ll": Vr * math.sqrt(3), "regulation": (1 - Vr / math.sqrt(Vs2)) * 100,
+                        "converged": converged[k]})
+    return results
+
+
+def get_feeder_phasors(cable, arrangement, N, length, R_op):
+    # per-phase series impedance and shunt admittance of N parallel circuits, ohm and S
+    _, _, X = get_line_params(cable, arrangement)
+    Z = complex(R_op, X) * length / N
+    Y = complex(0, 2 * math.pi * 50 * (cable["capacitance"] or 0) * 1e-6 * length * N)
+    return Z, Y
+
+
+def calc_exact_max_lengths(cables, P, Q, V, N, arrangement, resistances, reg_limit, iterations=40, step=1.1):
+    # shortest length at which the exact drop exceeds reg_limit (collapse counts as exceeding), for all
+    # cables together. Cable charging lifts the receiving end as the length grows (Ferranti rise), so
+    # the drop rises, peaks and falls again: a bracket grown by doubling can step over a short window
+    # above the limit. The bracket is therefore the first exceeding step of a geometric scan from 1 m
+    # in `step` ratios, and the bisection only assumes the drop is monotonic within that one step
+    if P <= 0 and Q <= 0:
+        return [None for _ in cables]
+
+    def exceeds(indices, lengths):
+        sols = solve_receiving_voltages([get_feeder_phasors(cables[k], arrangement, N, L, resistances[k])
+                                         for k, L in zip(indices, lengths)], P, Q, V)
+        return [sol is None or sol["regulation"] > reg_limit for sol in sols]
+
+    low = [0.0 for _ in cables]
+    high = [None for _ in cables]
+    length = 0.001
+    while length < 2 ** 20:  # km
+        scanning = [k for k in range(len(cables)) if high[k] is None]
+        if not scanning:
+            break
+        for k, over in zip(scanning, exceeds(scanning, [length] * len(scanning))):
+            if over:
+                high[k] = length
+            else:
+                low[k] = length
+        length *= step
+    bounded = [k for k in range(len(cables)) if high[k] is not None]
+    for _ in range(iterations):
+        mid = [(low[k] + high[k]) / 2 for k in bounded]
+        for k, m, over in zip(bounded, mid, exceeds(bounded, mid)):
+            if over:
+                high[k] = m
+            else:
+                low[k] = m
+    return [low[k] if high[k] is not None else None for k in range(len(cables))]
+
+
+def lifecycle_year_factors():
+    # present-value multiplier of the first-year loss cost for each year of the horizon.
+    # losses grow with the square of the load, energy cost with the price escalation
+    es = economic_settings
+    growth = (1 + es["load_growth"]) ** 2 * (1 + es["price_escalation"])
+    return [growth ** (t - 1) / (1 + es["discount_rate"]) ** t for t in range(1, es["years"] + 1)]
+
+
+def calc_lifecycle_costs(annual_loss_costs, installation_costs):
+    # the (years x candidates) table of discounted loss costs is the outer product of the
+    # year factors and the first-year costs, so summing over years is one factor sum
+    # applied to every candidate
+    es = economic_settings
+    pv_factor = sum(lifecycle_year_factors())
+    residual_factor = es["residual_value"] / (1 + es["discount_rate"]) ** es["years"]
+    loss_pv = [a * pv_factor for a in annual_loss_costs]
+    residual_pv = [c * residual_factor for c in installation_costs]
+    lifecycle = [c + lp - rp for c, lp, rp in zip(installation_costs, loss_pv, residual_pv)]
+    return loss_pv, residual_pv, lifecycle
+
+
+def calc_sheath_loss_factors(cables, arrangement):
+    # lambda1' of every cable in one pass: (worst phase, mean of the three phases)
+    omega = 2 * math.pi * 50
+    t_max = thermal_settings["max_conductor_temp"]
+    t_ref = thermal_settings["reference_temp"]
+    bonding = sheath_settings["bonding"]
+    factors = []
+    for cable in cables:
+        U = parse_voltage_kV(cable["voltage"])
+        if not cable["code"].startswith("1x") or U <= 1 or bonding == "Single point":
+            factors.append((0.0, 0.0))  # LV cables carry no metallic screen
+            continue
+        section = conductor_area_mm2(cable["code"])
+        screen = next(a for limit, a in sheath_settings["screen_mm2"] if section <= limit)
+        insulation = next(t for limit, t in sheath_settings["insulation_mm"] if U <= limit)
+        R = cable["resistance"] / 1000 * (1 + thermal_settings["alpha"] * (t_max - t_ref))  # ohm/m at max temp
+        Rs = sheath_settings["screen_resistivity"] / (screen * 1e-6) * (
+            1 + sheath_settings["screen_alpha"] * (t_max - 10 - t_ref))  # screen runs ~10 K cooler
+        d = 1.13 * math.sqrt(section) + 2 * (insulation + 1.6) + 1.0  # mean screen diameter, mm
+        De = d + 6.0  # over the oversheath
+        if arrangement == "Flat":
+            spacing = sheath_settings["flat_spacing_mm"] or 2 * De
+        else:
+            spacing = De
+        X = 2 * omega * 1e-7 * math.log(2 * spacing / d)
+        if arrangement == "Flat":
+            # unequal outer/centre phases of an untransposed flat formation
+            Xm = 2 * omega * 1e-7 * math.log(2)
+            P_, Q_ = X + Xm, X - Xm / 3
+            common = 0.25 * Q_ ** 2 / (Rs ** 2 + Q_ ** 2) + 0.75 * P_ ** 2 / (Rs ** 2 + P_ ** 2)
+            skew = 2 * Rs * P_ * Q_ * Xm / (math.sqrt(3) * (Rs ** 2 + P_ ** 2) * (Rs ** 2 + Q_ ** 2))
+            phases = [Rs / R * (common + skew), Rs / R * Q_ ** 2 / (Rs ** 2 + Q_ ** 2), Rs / R * (common - skew)]
+        else:
+            phases = [Rs / R / (1 + (Rs / X) ** 2)] * 3
+        if bonding == "Cross-bonded":
+            phases = [min(lam, sheath_settings["cross_bonded_residual"]) for lam in phases]
+        factors.append((max(phases), sum(phases) / 3))
+    return factors
+
+
+_sheath_factor_cache = {}
+
+
+def get_sheath_loss_factors(cable, arrangement):
+    # the whole catalog is evaluated per arrangement and settings, so switching is a lookup
+    key = (arrangement, sheath_settings["bonding"], sheath_settings["flat_spacing_mm"],
+           sheath_settings["cross_bonded_residual"], tuple(map(tuple, sheath_settings["screen_mm2"])),
+           tuple(map(tuple, sheath_settings["insulation_mm"])), sheath_settings["screen_resistivity"],
+           sheath_settings["screen_alpha"], thermal_settings["max_conductor_temp"], thermal_settings["alpha"],
+           thermal_settings["reference_temp"])
+    table = _sheath_factor_cache.get(key)
+    if table is None:
+        if len(_sheath_factor_cache) > 64:
+            _sheath_factor_cache.clear()
+        table = dict(zip(((c["code"], c["voltage"], c["resistance"]) for c in cable_list),
+                         calc_sheath_loss_factors(cable_list, arrangement)))
+        _sheath_factor_cache[key] = table
+    factors = table.get((cable["code"], cable["voltage"], cable["resistance"]))
+    if factors is None:
+        factors = calc_sheath_loss_factors([cable], arrangement)[0]
+    return factors
+
+
+def get_base_capacity(cable, arrangement):
+    if cable['code'].startswith('1x'):
+        base = cable['fcc'] if arrangement == "Flat" else cable['tcc']
+        if base is None:
+            return None
+        # screen losses add to the conductor's heat; the hottest phase sets the rating
+        return base / math.sqrt(1 + get_sheath_loss_factors(cable, arrangement)[0])
+    return cable['tcc']
+
+
+def calc_performance(cable, P, Q, V, N, arrangement, length, ambient, load_type, grouping=0, installation="direct"):
+    # full steady-state analysis of one cable, shared by the GUI and batch modes
+    # grouping: other cables in the same trench; installation: key of installation_factor_table
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
+    I_per_circuit = I_total / N
+
+    cos_phi = P / S_MVA if S_MVA > 0 else 1.0
+    sin_phi = Q / S_MVA if S_MVA > 0 else 0.0
+
+    R, L, X = get_line_params(cable, arrangement)
+
+    # capacity check
+    base_capacity = get_base_capacity(cable, arrangement)
+    temp_factor = get_temp_factor(ambient)
+    cables_in_trench = N * 3 if cable['code'].startswith('1x') else N
+    trench_factor = get_trench_factor(min(cables_in_trench + grouping, 6))
+    installation_factor = installation_factor_table[installation]
+    derated_capacity = base_capacity * temp_factor * trench_factor * installation_factor
+    cyclic_factor = None
+    rated_capacity = derated_capacity
+    if transient_settings["use_cyclic_rating"]:
+        cyclic_factor = get_cyclic_factors([cable], [derated_capacity], ambient)[0]
+        rated_capacity = derated_capacity * (cyclic_factor or 1.0)
+
+    capacity_check = "PASS" if I_per_circuit <= rated_capacity else "FAIL"
+    capacity_margin = ((rated_capacity - I_per_circuit) / rated_capacity * 100) if rated_capacity > 0 else 0
+
+    # resistance at the conductor operating temperature
+    R_op, conductor_temp, thermal_converged, thermal_iterations = get_operating_resistance(
+        R, I_per_circuit, derated_capacity, ambient)
+
+    # power losses (3 phase conductors per circuit for both cable types), plus screen losses
+    sheath_loss_factor = get_sheath_loss_factors(cable, arrangement)[1]
+    P_loss_total_kW = 3 * (I_per_circuit ** 2) * R_op * (1 + sheath_loss_factor) * length / 1000 * N
+    Q_loss_total_kVar = 3 * (I_per_circuit ** 2) * X * length / 1000 * N
+
+    # voltage regulation
+    VLN_volts = V * 1000 / math.sqrt(3)
+    voltage_drop_volts = (I_per_circuit * R_op * cos_phi + I_per_circuit * X * sin_phi) * length
+    voltage_regulation_percent = voltage_drop_volts / VLN_volts * 100 if VLN_volts > 0 else 0
+    terminal_voltage_ll = V * 1000 - voltage_drop_volts * math.sqrt(3)
+    exact = solve_receiving_voltages([get_feeder_phasors(cable, arrangement, N, length, R_op)], P, Q, V)[0] \
+        if V > 0 else None
+
+    # economics
+    electricity_price = economic_settings["electricity_price"]
+    daily_hours = economic_settings["hours_per_day"].get(load_type, 8)
+    annual_hours = daily_hours * 365
+
+    annual_energy_loss_MWh = P_loss_total_kW / 1000 * annual_hours
+    annual_loss_cost = annual_energy_loss_MWh * electricity_price
+    energy_loss_cost_10yr = annual_loss_cost * 10
+
+    # single core: 3 cables per circuit, three core: 1 cable per circuit
+    total_cable_length = length * N * 3 if cable['code'].startswith('1x') else length * N
+    cable_installation_cost = cable['price'] * total_cable_length
+
+    loss_pv, residual_pv, lifecycle = calc_lifecycle_costs([annual_loss_cost], [cable_installation_cost])
+
+    return {
+        "S_MVA": S_MVA, "I_total": I_total, "I_per_circuit": I_per_circuit,
+        "cos_phi": cos_phi, "sin_phi": sin_phi, "theta": math.acos(cos_phi),
+        "R": R, "L": L, "X": X, "R_op": R_op, "conductor_temp": conductor_temp,
+        "thermal_converged": thermal_converged, "thermal_iterations": thermal_iterations,
+        "base_capacity": base_capacity, "sheath_loss_factor": sheath_loss_factor,
+        "temp_factor": temp_factor, "trench_factor": trench_factor, "installation_factor": installation_factor,
+        "derated_capacity": derated_capacity, "cyclic_factor": cyclic_factor, "rated_capacity": rated_capacity,
+        "capacity_check": capacity_check,
+        "capacity_margin": capacity_margin,
+        "P_loss_total_kW": P_loss_total_kW, "Q_loss_total_kVar": Q_loss_total_kVar,
+        "voltage_drop_volts": voltage_drop_volts, "voltage_regulation_percent": voltage_regulation_percent,
+        "terminal_voltage_ll": terminal_voltage_ll,
+        "exact_terminal_voltage_ll": exact["V_ll"] if exact else None,
+        "exact_regulation_percent": exact["regulation"] if exact else None,
+        "regulation_error_percent": voltage_regulation_percent - exact["regulation"] if exact else None,
+        "electricity_price": electricity_price, "daily_hours": daily_hours, "annual_hours": annual_hours,
+        "annual_energy_loss_MWh": annual_energy_loss_MWh, "energy_loss_cost_10yr": energy_loss_cost_10yr,
+        "cable_installation_cost": cable_installation_cost,
+        "total_cost_10yr": energy_loss_cost_10yr + cable_installation_cost,
+        "annual_loss_cost": annual_loss_cost, "energy_loss_cost_pv": loss_pv[0],
+        "residual_value_pv": residual_pv[0], "lifecycle_cost": lifecycle[0],
+    }
+
+
+def filter_cables(P, Q, V, N, ambient, ctype, arrangement, grouping=0, installation="direct"):
+    # cables of the given type that carry the load, restricted to the lowest passing voltage class
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
+    I_per_circuit = I_total / N
+
+    results = []
+    for cable in cable_list:
+        code = cable["code"]
+        is_single_core = code.startswith("1x")
+
+        # filter by type
+        if (ctype == "Single-core" and not is_single_core) or (ctype == "Three-core" and is_single_core):
+            continue
+
+        # filter by voltage
+        if parse_voltage_kV(cable["voltage"]) < V:
+            continue
+
+        # check capacity
+        base_capacity = get_base_capacity(cable, arrangement)
+        if base_capacity is None:
+            continue
+
+        # apply derating
+        temp_factor = get_temp_factor(ambient)
+        cables_in_trench = N * 3 if is_single_core else N
+        trench_factor = get_trench_factor(min(cables_in_trench + grouping, 6))
+        results.append((cable, base_capacity * temp_factor * trench_factor * installation_factor_table[installation]))
+
+    # all candidates stepped through the load cycle together when the cyclic rating is used
+    rated = get_rated_capacities([c for c, _ in results], [d for _, d in results], ambient)
+    results = [c for (c, _), r in zip(results, rated) if r >= I_per_circuit]
+
+    if results:
+        min_rating = min(parse_voltage_kV(c["voltage"]) for c in results)
+        results = [c for c in results if parse_voltage_kV(c["voltage"]) == min_rating]
+    return results
+
+
+def enumerate_configurations(P, Q, V, length, ambient, load_type):
+    # every catalog x arrangement x circuit-count combination that passes voltage and capacity
+    configs = []
+    for cable in cable_list:
+        if parse_voltage_kV(cable["voltage"]) < V:
+            continue
+        is_single_core = cable["code"].startswith("1x")
+        arrangements = ["Flat", "Trefoil"] if is_single_core else ["Trefoil"]
+        max_c = 2 if is_single_core else 6
+        for arrangement in arrangements:
+            if get_base_capacity(cable, arrangement) is None:
+                continue
+            for N in range(1, max_c + 1):
+                r = calc_performance(cable, P, Q, V, N, arrangement, length, ambient, load_type)
+                if r["capacity_check"] == "PASS":
+                    configs.append({"cable": cable, "arrangement": arrangement, "N": N, "result": r})
+    return configs
+
+
+def pareto_front(points):
+    # non-dominated set of 3-objective points (all minimized), returns indices.
+    # sort on the first objective, then sweep keeping a staircase of the
+    # (obj2, obj3) projections seen so far: obj2 ascending, obj3 descending.
+    # a point is dominated iff the staircase entry with the largest obj2 <= its
+    # obj2 also has obj3 <= its obj3, so each query is a bisect.
+    unique = {}
+    for idx, pt in enumerate(points):
+        unique.setdefault(tuple(pt), []).append(idx)
+
+    stair_f2 = []
+    stair_f3 = []
+    front = []
+    for pt in sorted(unique):
+        f1, f2, f3 = pt
+        pos = bisect.bisect_right(stair_f2, f2)
+        if pos > 0 and stair_f3[pos - 1] <= f3:
+            continue
+        front.extend(unique[pt])
+
+        # drop staircase entries the new point covers (obj2 >= f2 and obj3 >= f3)
+        lo = bisect.bisect_left(stair_f2, f2)
+        hi = lo
+        while hi < len(stair_f2) and stair_f3[hi] >= f3:
+            hi += 1
+        stair_f2[lo:hi] = [f2]
+        stair_f3[lo:hi] = [f3]
+    return sorted(front)
+
+
+def calc_pareto_frontier(P, Q, V, length, ambient, load_type):
+    configs = enumerate_configurations(P, Q, V, length, ambient, load_type)
+    points = [(c["result"]["cable_installation_cost"], c["result"]["voltage_regulation_percent"],
+               c["result"]["P_loss_total_kW"]) for c in configs]
+    return [configs[i] for i in pareto_front(points)]
+
+
+# optional sqlite store of every calculation result, written in batches
+result_store = {"enabled": False, "path": "cable_results.db", "conn": None, "pending": [], "batch_size": 500}
+
+_result_columns = ("created_at", "source", "feeder", "load_type", "cable_type", "arrangement", "P", "Q", "V", "N",
+                   "length", "ambient", "cable_id", "cable_code", "voltage_class", "regulation_pct", "loss_kw",
+                   "installation_cost", "energy_cost", "total_cost", "capacity_check", "energy_loss_cost_pv",
+                   "lifecycle_cost")
+# columns added after the first schema; stores created earlier are migrated on open
+_result_migrations = (("energy_loss_cost_pv", "REAL"), ("lifecycle_cost", "REAL"))
+
+
+def open_result_store(path):
+    close_result_store()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY,
+            created_at REAL, source TEXT, feeder TEXT,
+            load_type TEXT, cable_type TEXT, arrangement TEXT,
+            P REAL, Q REAL, V REAL, N INTEGER, length REAL, ambient REAL,
+            cable_id INTEGER, cable_code TEXT, voltage_class TEXT,
+            regulation_pct REAL, loss_kw REAL, installation_cost REAL, energy_cost REAL, total_cost REAL,
+            capacity_check TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_results_regulation ON results (regulation_pct);
+        CREATE INDEX IF NOT EXISTS idx_results_voltage_cost ON results (voltage_class, total_cost);
+        CREATE INDEX IF NOT EXISTS idx_results_cable ON results (cable_id);
+        CREATE INDEX IF NOT EXISTS idx_results_feeder ON results (feeder);
+        CREATE INDEX IF NOT EXISTS idx_results_created ON results (created_at);
+    """)
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+    with conn:
+        for column, column_type in _result_migrations:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE results ADD COLUMN {column} {column_type}")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_results_voltage_lifecycle ON results (voltage_class, "
+                     "lifecycle_cost)")
+    result_store["conn"] = conn
+    result_store["path"] = path
+    result_store["enabled"] = True
+
+
+def close_result_store():
+    if result_store["conn"] is not None:
+        flush_result_store()
+        result_store["conn"].close()
+    result_store["conn"] = None
+    result_store["enabled"] = False
+
+
+def record_result(source, feeder, inputs, result):
+    if not result_store["enabled"] or result.get("cable_id") is None:
+        return
+    cable = next((c for c in cable_list if c["id"] == result["cable_id"]), None)
+    result_store["pending"].append((
+        time.time(), source, feeder, inputs["load_type"], inputs["cable_type"], inputs["arrangement"],
+        inputs["P"], inputs["Q"], inputs["V"], inputs["N"], inputs["length"], inputs["ambient"],
+        result["cable_id"], cable["code"] if cable else None, cable["voltage"] if cable else None,
+        result["voltage_regulation_percent"], result["P_loss_total_kW"], result["cable_installation_cost"],
+        result["energy_loss_cost_10yr"], result["total_cost_10yr"], result["capacity_check"],
+        result["energy_loss_cost_pv"], result["lifecycle_cost"],
+    ))
+    if len(result_store["pending"]) >= result_store["batch_size"]:
+        flush_result_store()
+
+
+def flush_result_store():
+    conn = result_store["conn"]
+    if conn is None or not result_store["pending"]:
+        return
+    placeholders = ", ".join("?" for _ in _result_columns)
+    with conn:  # one transaction per batch
+        conn.executemany(f"INSERT INTO results ({', '.join(_result_columns)}) VALUES ({placeholders})",
+                         result_store["pending"])
+    result_store["pending"] = []
+
+
+def query_result_store(sql, params=()):
+    flush_result_store()
+    cursor = result_store["conn"].execute(sql, params)
+    columns = [d[0] for d in cursor.description] if cursor.description else []
+    return columns, cursor.fetchall()
+
+
+result_store_queries = {
+    "Feeders above regulation limit":
+        "SELECT feeder, cable_code, voltage_class, regulation_pct, lifecycle_cost FROM results "
+        "WHERE regulation_pct > 3 ORDER BY regulation_pct DESC LIMIT 1000",
+    "Total lifecycle cost by voltage class":
+        "SELECT voltage_class, COUNT(*) AS results, SUM(lifecycle_cost) AS lifecycle_cost FROM results "
+        "GROUP BY voltage_class ORDER BY voltage_class",
+    "Most used cables":
+        "SELECT cable_id, cable_code, voltage_class, COUNT(*) AS uses FROM results "
+        "GROUP BY cable_id ORDER BY uses DESC LIMIT 50",
+    "Latest results":
+        "SELECT datetime(created_at, 'unixepoch', 'localtime') AS time, source, feeder, cable_code, "
+        "regulation_pct, loss_kw, lifecycle_cost FROM results ORDER BY created_at DESC LIMIT 200",
+}
+
+
+# result cache: content-addressed feeder results shared across sessions and processes
+result_cache = {"enabled": False, "path": "cable_cache.db", "conn": None, "max_bytes": 256 << 20,
+                "pending": [], "touched": [], "batch_size": 2000, "hits": 0, "misses": 0,
+                "session_hits": 0, "session_misses": 0}
+
+
+def open_result_cache(path):
+    close_result_cache()
+    conn = sqlite3.connect(path, timeout=30)  # WAL plus busy timeout lets concurrent runs share the file
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, size INTEGER, last_used REAL);
+        CREATE INDEX IF NOT EXISTS idx_cache_last_used ON cache (last_used);
+        CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER);
+        INSERT OR IGNORE INTO stats VALUES ('hits', 0), ('misses', 0), ('evictions', 0);
+    """)
+    result_cache["conn"] = conn
+    result_cache["path"] = path
+    result_cache["enabled"] = True
+    result_cache["hits"] = result_cache["misses"] = 0
+    result_cache["session_hits"] = result_cache["session_misses"] = 0
+
+
+def close_result_cache():
+    if result_cache["conn"] is not None:
+        flush_result_cache()
+        result_cache["conn"].close()
+    result_cache["conn"] = None
+    result_cache["enabled"] = False
+
+
+def _normalize_inputs(inputs):
+    # 1.0 and 1, or values differing only in float noise, must hash alike
+    return {k: float(f"{v:.9g}") if isinstance(v, (int, float)) and not isinstance(v, bool) else v
+            for k, v in inputs.items()}
+
+
+def feeder_cache_key(feeder, cable_key, model_key):
+    return _fingerprint([1, _normalize_inputs(feeder["inputs"]), feeder["cable_id"], cable_key, model_key])
+
+
+def cache_get_many(keys):
+    conn = result_cache["conn"]
+    found = {}
+    if conn is None:
+        return found
+    keys = list(keys)
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i + 500]
+        rows = conn.execute(f"SELECT key, value FROM cache WHERE key IN ({', '.join('?' for _ in chunk)})",
+                            chunk).fetchall()
+        found.update((key, json.loads(value)) for key, value in rows)
+    now = time.time()
+    result_cache["touched"].extend((now, key) for key in found)
+    result_cache["hits"] += len(found)
+    result_cache["misses"] += len(keys) - len(found)
+    return found
+
+
+def cache_put(key, result):
+    if result_cache["conn"] is None:
+        return
+    value = json.dumps(result)
+    result_cache["pending"].append((key, value, len(value), time.time()))
+    if len(result_cache["pending"]) >= result_cache["batch_size"]:
+        flush_result_cache()
+
+
+def flush_result_cache():
+    conn = result_cache["conn"]
+    if conn is None:
+        return
+    with conn:  # one transaction per batch
+        conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", result_cache["pending"])
+        conn.executemany("UPDATE cache SET last_used = ? WHERE key = ?", result_cache["touched"])
+        conn.execute("UPDATE stats SET value = value + ? WHERE name = 'hits'", (result_cache["hits"],))
+        conn.execute("UPDATE stats SET value = value + ? WHERE name = 'misses'", (result_cache["misses"],))
+    result_cache["pending"] = []
+    result_cache["touched"] = []
+    result_cache["session_hits"] += result_cache["hits"]
+    result_cache["session_misses"] += result_cache["misses"]
+    result_cache["hits"] = result_cache["misses"] = 0
+    evict_result_cache()
+
+
+def evict_result_cache():
+    # least recently used entries go until the cache is back under 90% of its budget
+    conn = result_cache["conn"]
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+    if total <= result_cache["max_bytes"]:
+        return 0
+    excess = total - int(result_cache["max_bytes"] * 0.9)
+    victims = []
+    for key, size in conn.execute("SELECT key, size FROM cache ORDER BY last_used"):
+        victims.append((key,))
+        excess -= size
+        if excess <= 0:
+            break
+    with conn:
+        conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+        conn.execute("UPDATE stats SET value = value + ? WHERE name = 'evictions'", (len(victims),))
+    return len(victims)
+
+
+def result_cache_stats():
+    flush_result_cache()
+    conn = result_cache["conn"]
+    stats = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+    stats["entries"], stats["bytes"] = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+    stats["session_hits"] = result_cache["session_hits"]
+    stats["session_misses"] = result_cache["session_misses"]
+    return stats
+
+
+def clear_result_cache():
+    with result_cache["conn"] as conn:
+        conn.execute("DELETE FROM cache")
+        conn.execute("UPDATE stats SET value = 0")
+    result_cache["session_hits"] = result_cache["session_misses"] = 0
+
+
+# project sessions: many feeders, each result tagged with the hashes of what it depends on
+project = {"path": None, "feeders": [], "price_overrides": {}}
+base_prices = {c["id"]: c["price"] for c in cable_list}
+
+
+def _fingerprint(obj):
+    return hashlib.sha1(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def model_fingerprint():
+    return _fingerprint([temp_factor_table, trench_factor_table, installation_factor_table, economic_settings,
+                         thermal_settings, transient_settings, sheath_settings, voltage_settings])
+
+
+def set_cable_price(cable_id, price):
+    cable = next((c for c in cable_list if c["id"] == cable_id), None)
+    if cable is None:
+        raise ValueError(f"Unknown cable id: {cable_id}")
+    cable["price"] = price
+    invalidate_search_index()
+    if price == base_prices[cable_id]:
+        project["price_overrides"].pop(str(cable_id), None)
+    else:
+        project["price_overrides"][str(cable_id)] = price
+
+
+def compute_feeder(feeder):
+    inputs = feeder["inputs"]
+    candidate_ids = None
+    if feeder["cable_id"] is not None:
+        cable = next((c for c in cable_list if c["id"] == feeder["cable_id"]), None)
+    else:
+        candidates = filter_cables(inputs["P"], inputs["Q"], inputs["V"], inputs["N"], inputs["ambient"],
+                                   inputs["cable_type"], inputs["arrangement"])
+        cable = min(candidates, key=lambda c: c["price"]) if candidates else None
+        candidate_ids = [c["id"] for c in candidates]
+    if cable is None:
+        return {"cable_id": None, "candidate_ids": candidate_ids}
+    result = calc_performance(cable, inputs["P"], inputs["Q"], inputs["V"], inputs["N"], inputs["arrangement"],
+                              inputs["length"], inputs["ambient"], inputs["load_type"])
+    result["cable_id"] = cable["id"]
+    result["candidate_ids"] = candidate_ids
+    return result
+
+
+def recompute_project(feeders):
+    # recalculates only feeders whose inputs, catalog entry or model settings changed
+    model_key = model_fingerprint()
+    cable_keys = {c["id"]: _fingerprint(c) for c in cable_list}
+    # which cables pass the filter never depends on price, so auto-selected feeders
+    # track the price-free catalog plus the prices of their own candidates
+    ratings_key = _fingerprint([{k: v for k, v in c.items() if k != "price"} for c in cable_list])
+    prices = {c["id"]: c["price"] for c in cable_list}
+
+    def dependencies(feeder, result):
+        if feeder["cable_id"] is not None:
+            cable_key = cable_keys.get(feeder["cable_id"])
+        elif result is not None:
+            cable_key = _fingerprint([ratings_key, [prices.get(cid) for cid in result["candidate_ids"]]])
+        else:
+            cable_key = None
+        return {"inputs": _fingerprint(feeder["inputs"]), "cable": cable_key, "model": model_key}
+
+    stale = [feeder for feeder in feeders
+             if feeder.get("result") is None or feeder.get("deps") != dependencies(feeder, feeder["result"])]
+
+    # the disk cache serves results computed by earlier sessions; auto-selected feeders key on the whole catalog
+    cached = {}
+    if result_cache["enabled"] and stale:
+        catalog_key = _fingerprint(sorted(cable_keys.values()))
+        cache_keys = [feeder_cache_key(feeder, cable_keys.get(feeder["cable_id"]) if feeder["cable_id"] is not None
+                                       else catalog_key, model_key) for feeder in stale]
+        cached = cache_get_many(set(cache_keys))
+    else:
+        cache_keys = [None for _ in stale]
+
+    for feeder, key in zip(stale, cache_keys):
+        if key in cached:
+            feeder["result"] = cached[key]
+        else:
+            feeder["result"] = compute_feeder(feeder)
+            if key is not None:
+                cache_put(key, feeder["result"])
+        feeder["deps"] = dependencies(feeder, feeder["result"])
+        record_result("project", feeder["name"], feeder["inputs"], feeder["result"])
+    flush_result_store()
+    flush_result_cache()
+    return len(stale)
+
+
+def save_project(path):
+    data = {"version": 1, "price_overrides": project["price_overrides"], "feeders": project["feeders"]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    project["path"] = path
+
+
+def load_project(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    for cable in cable_list:
+        cable["price"] = base_prices[cable["id"]]
+    invalidate_search_index()
+    project["price_overrides"] = {}
+    for cid, price in data.get("price_overrides", {}).items():
+        set_cable_price(int(cid), price)
+
+    project["feeders"] = data.get("feeders", [])
+    project["path"] = path
+    return recompute_project(project["feeders"])
+
+
+# heterogeneous parallel circuits: current shares by complex admittance instead of I_total / N
+def solve_parallel_circuits(circuits, P, Q, V, ambient, load_type, max_iter=20):
+    # circuits: [{"cable", "arrangement", "length"}], all connected between the same two busbars
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    I_total = S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) if V > 0 else 0
+    cos_phi = P / S_MVA if S_MVA > 0 else 1.0
+    sin_phi = Q / S_MVA if S_MVA > 0 else 0.0
+    I_phasor = I_total * complex(cos_phi, -sin_phi)
+
+    cables_in_trench = sum(3 if c["cable"]["code"].startswith("1x") else 1 for c in circuits)
+    trench_factor = get_trench_factor(min(cables_in_trench, 6))
+    temp_factor = get_temp_factor(ambient)
+    derated = [get_base_capacity(c["cable"], c["arrangement"]) * temp_factor * trench_factor for c in circuits]
+    params = [get_line_params(c["cable"], c["arrangement"]) for c in circuits]
+    resistances = [R for R, _, _ in params]
+
+    # sharing depends on R, and R on each circuit's temperature, so alternate the two
+    currents = []
+    temps = [thermal_settings["reference_temp"] for _ in circuits]
+    for _ in range(max_iter):
+        admittances = [1 / complex(R * c["length"], X * c["length"]) for R, (_, _, X), c
+                       in zip(resistances, params, circuits)]
+        y_total = sum(admittances)
+        new_currents = [I_phasor * y / y_total for y in admittances]
+        done = currents and all(abs(n - o) <= 1e-6 * max(I_total, 1) for n, o in zip(new_currents, currents))
+        currents = new_currents
+        if done or not thermal_settings["enabled"]:
+            break
+        temps, resistances, _, _ = solve_conductor_temperatures(
+            [R for R, _, _ in params], [abs(i) / d for i, d in zip(currents, derated)], ambient)
+
+    z_eq = 1 / y_total
+    voltage_drop_volts = (z_eq * I_phasor).real
+    VLN_volts = V * 1000 / math.sqrt(3)
+
+    rows = []
+    for c, i, d, R_op, t in zip(circuits, currents, derated, resistances, temps):
+        magnitude = abs(i)
+        rows.append({
+            "cable": c["cable"], "arrangement": c["arrangement"], "length": c["length"],
+            "current": magnitude, "share": magnitude / I_total * 100 if I_total > 0 else 0,
+            "derated_capacity": d, "loading": magnitude / d * 100 if d > 0 else float("inf"),
+            "capacity_check": "PASS" if magnitude <= d else "FAIL",
+            "R_op": R_op, "conductor_temp": t,
+            "P_loss_kW": 3 * magnitude ** 2 * R_op * (1 + get_sheath_loss_factors(c["cable"], c["arrangement"])[1])
+            * c["length"] / 1000,
+        })
+    P_loss_total_kW = sum(r["P_loss_kW"] for r in rows)
+    annual_hours = economic_settings["hours_per_day"].get(load_type, 8) * 365
+    return {
+        "circuits": rows, "I_total": I_total, "trench_factor": trench_factor, "temp_factor": temp_factor,
+        "P_loss_total_kW": P_loss_total_kW,
+        "annual_loss_cost": P_loss_total_kW / 1000 * annual_hours * economic_settings["electricity_price"],
+        "voltage_drop_volts": voltage_drop_volts,
+        "voltage_regulation_percent": voltage_drop_volts / VLN_volts * 100 if VLN_volts > 0 else 0,
+        "capacity_check": "PASS" if all(r["capacity_check"] == "PASS" for r in rows) else "FAIL",
+        "max_loading": max(r["loading"] for r in rows),
+    }
+
+
+def rank_parallel_additions(existing, P, Q, V, ambient, load_type, arrangement, length):
+    # try every catalog cable as the next parallel circuit and rank by lifecycle cost,
+    # counting the new cable's installation and the losses of the whole reinforced feeder
+    candidates = [c for c in cable_list if parse_voltage_kV(c["voltage"]) >= V
+                  and get_base_capacity(c, arrangement) is not None]
+    solutions = [solve_parallel_circuits(existing + [{"cable": c, "arrangement": arrangement, "length": length}],
+                                         P, Q, V, ambient, load_type) for c in candidates]
+    installation = [c["price"] * length * (3 if c["code"].startswith("1x") else 1) for c in candidates]
+    _, _, lifecycle = calc_lifecycle_costs([sol["annual_loss_cost"] for sol in solutions], installation)
+
+    ranked = [{"cable": c, "solution": sol, "installation_cost": inst, "lifecycle_cost": life}
+              for c, sol, inst, life in zip(candidates, solutions, installation, lifecycle)]
+    ranked.sort(key=lambda item: (item["solution"]["capacity_check"] != "PASS", item["lifecycle_cost"]))
+    return ranked
+
+
+# sweep curves: regulation, losses and lifecycle cost of many cables over a swept length or load
+sweep_metrics = {"Regulation (%)": "regulation", "Losses (kW)": "losses", "Lifecycle Cost (TL)": "lifecycle"}
+
+
+def calc_sweep_curves(cables, inputs, variable, x_values):
+    # evaluates every (cable, sweep point) pair in one batch. length sweeps are linear in L;
+    # load sweeps scale the current with P at a constant power factor and solve all
+    # conductor temperatures together
+    P, Q, V, N = inputs["P"], inputs["Q"], inputs["V"], inputs["N"]
+    arrangement, ambient, length = inputs["arrangement"], inputs["ambient"], inputs["length"]
+    S_MVA = math.sqrt(P ** 2 + Q ** 2)
+    cos_phi = P / S_MVA if S_MVA > 0 else 1.0
+    sin_phi = Q / S_MVA if S_MVA > 0 else 0.0
+    VLN_volts = V * 1000 / math.sqrt(3)
+    annual_hours = economic_settings["hours_per_day"].get(inputs["load_type"], 8) * 365
+    temp_factor = get_temp_factor(ambient)
+
+    n_points = len(x_values)
+    pairs_ratio, pairs_R = [], []
+    per_cable = []
+    for cable in cables:
+        R, _, X = get_line_params(cable, arrangement)
+        cables_in_trench = N * 3 if cable["code"].startswith("1x") else N
+        derated = get_base_capacity(cable, arrangement) * temp_factor * get_trench_factor(min(cables_in_trench, 6))
+        install_per_km = cable["price"] * N * (3 if cable["code"].startswith("1x") else 1)
+        sheath = 1 + get_sheath_loss_factors(cable, arrangement)[1]
+        if variable == "length":
+            currents = [S_MVA * 1e6 / (math.sqrt(3) * V * 1e3) / N] * n_points
+            lengths = list(x_values)
+        else:
+            currents = [math.sqrt(x ** 2 + (x * sin_phi / cos_phi) ** 2) * 1e6 / (math.sqrt(3) * V * 1e3) / N
+                        if cos_phi > 0 else 0.0 for x in x_values]
+            lengths = [length] * n_points
+        per_cable.append((R, X, derated, install_per_km, sheath, currents, lengths))
+        pairs_R.extend([R] * n_points)
+        pairs_ratio.extend(i / derated for i in currents)
+
+    if thermal_settings["enabled"]:
+        # length sweeps repeat the same loading along each curve, so solve each distinct pair once
+        unique_pairs = list(dict.fromkeys(zip(pairs_R, pairs_ratio)))
+        _, unique_r_ops, _, _ = solve_conductor_temperatures([R for R, _ in unique_pairs],
+                                                             [ratio for _, ratio in unique_pairs], ambient)
+        r_op_lookup = dict(zip(unique_pairs, unique_r_ops))
+        op_resistances = [r_op_lookup[pair] for pair in zip(pairs_R, pairs_ratio)]
+    else:
+        op_resistances = pairs_R
+
+    curves = {"regulation": [], "losses": [], "lifecycle": [], "feasible": []}
+    for k, (R, X, derated, install_per_km, sheath, currents, lengths) in enumerate(per_cable):
+        r_ops = op_resistances[k * n_points:(k + 1) * n_points]
+        losses = [3 * i ** 2 * r * sheath * L / 1000 * N for i, r, L in zip(currents, r_ops, lengths)]
+        curves["regulation"].append([i * (r * cos_phi + X * sin_phi) * L / VLN_volts * 100
+                                     for i, r, L in zip(currents, r_ops, lengths)])
+        curves["losses"].append(losses)
+        # the same lifecycle model as calc_performance(): kW of losses -> annual cost -> NPV
+        curves["lifecycle"].append(calc_lifecycle_costs(
+            [loss / 1000 * annual_hours * economic_settings["electricity_price"] for loss in losses],
+            [install_per_km * L for L in lengths])[2])
+        curves["feasible"].append([i <= derated for i in currents])
+    return curves
+
+
+def build_extrema_table(low_values, high_values):
+    # sparse table: index of the lowest / highest value in every power-of-two run, so any index
+    # range's extremes are two lookups. gaps are +inf in low_values and -inf in high_values;
+    # also the next and previous non-gap index from every position
+    n = len(low_values)
+    lows = [list(range(n))]
+    highs = [lows[0]]
+    span = 1
+    while 2 * span <= n:
+        lo, hi = lows[-1], highs[-1]
+        lows.append([a if low_values[a] <= low_values[b] else b for a, b in zip(lo, lo[span:])])
+        highs.append([a if high_values[a] >= high_values[b] else b for a, b in zip(hi, hi[span:])])
+        span *= 2
+    next_value = [n] * n
+    previous_value = [-1] * n
+    found = n
+    for k in range(n - 1, -1, -1):
+        if low_values[k] != float("inf"):
+            found = k
+        next_value[k] = found
+    found = -1
+    for k in range(n):
+        if low_values[k] != float("inf"):
+            found = k
+        previous_value[k] = found
+    return lows, highs, next_value, previous_value
+
+
+def range_extrema(table, low_values, high_values, start, stop):
+    # (index of the lowest, index of the highest) value in [start, stop), which must not be empty
+    lows, highs = table[:2]
+    level = (stop - start).bit_length() - 1
+    a, b = lows[level][start], lows[level][stop - (1 << level)]
+    c, d = highs[level][start], highs[level][stop - (1 << level)]
+    return (a if low_values[a] <= low_values[b] else b), (c if high_values[c] >= high_values[d] else d)
+
+
+def decimate_columns(table, low_values, high_values, bounds):
+    # min/max decimation per pixel column: bounds[c]:bounds[c + 1] are the indices falling in column c.
+    # yields the first, lowest, highest and last non-gap index of each column, so the drawn shape
+    # is unchanged; None ends a segment at a column holding only gaps
+    next_value, previous_value = table[2:]
+    for start, stop in zip(bounds, bounds[1:]):
+        if stop <= start:
+            continue
+        first = next_value[start]
+        if first >= stop:
+            yield None
+            continue
+        lo, hi = range_extrema(table, low_values, high_values, first, stop)
+        yield sorted({first, lo, hi, previous_value[stop - 1]})
+
+
+# route import: polylines from GeoJSON or CSV, each section with its own installation conditions
+def geodesic_distance_m(lat1, lon1, lat2, lon2):
+    # Vincenty inverse formula on the WGS84 ellipsoid; haversine when it does not converge
+    # (nearly antipodal points, never the case for cable routes)
+    a = 6378137.0
+    f = 1 / 298.257223563
+    b = a * (1 - f)
+    if lat1 == lat2 and lon1 == lon2:
+        return 0.0
+    L = math.radians(lon2 - lon1)
+    U1 = math.atan((1 - f) * math.tan(math.radians(lat1)))
+    U2 = math.atan((1 - f) * math.tan(math.radians(lat2)))
+    sin_u1, cos_u1 = math.sin(U1), math.cos(U1)
+    sin_u2, cos_u2 = math.sin(U2), math.cos(U2)
+
+    lam = L
+    for _ in range(100):
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        sin_sigma = math.sqrt((cos_u2 * sin_lam) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam) ** 2)
+        if sin_sigma == 0:
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lam / sin_sigma
+        cos2_alpha = 1 - sin_alpha ** 2
+        cos_2sm = cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha if cos2_alpha != 0 else 0.0
+        C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        lam_prev = lam
+        lam = L + (1 - C) * f * sin_alpha * (sigma + C * sin_sigma * (cos_2sm + C * cos_sigma *
+                                                                      (-1 + 2 * cos_2sm ** 2)))
+        if abs(lam - lam_prev) < 1e-12:
+            break
+    else:
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        h = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(L / 2) ** 2
+        return 2 * 6371008.8 * math.asin(math.sqrt(h))
+
+    u2 = cos2_alpha * (a ** 2 - b ** 2) / b ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (cos_2sm + B / 4 * (cos_sigma * (-1 + 2 * cos_2sm ** 2) - B / 6 * cos_2sm *
+                                                      (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2)))
+    return b * A * (sigma - delta_sigma)
+
+
+def polyline_length_km(lonlats):
+    return sum(geodesic_distance_m(lat1, lon1, lat2, lon2)
+               for (lon1, lat1), (lon2, lat2) in zip(lonlats, lonlats[1:])) / 1000
+
+
+def iter_geojson_features(path, chunk_size=1 << 20, max_buffer=64 << 20):
+    # streams the "features" array of a FeatureCollection. The top-level object is walked key by key
+    # (other values are decoded and dropped), and only the feature being parsed is held in memory,
+    # each one decoded with json's C raw_decode as soon as it is complete. A value still incomplete
+    # after max_buffer characters fails instead of pulling the rest of the file in
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer, pos, eof = "", 0, False
+
+        def read_more():
+            # appends a chunk, dropping what has been consumed; False at the end of the file
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            if len(buffer) > max_buffer:
+                raise ValueError(f"GeoJSON value longer than {max_buffer} characters")
+            return not eof
+
+        def peek(separators=""):
+            # next character after whitespace and separators, "" at the end of the file
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n" + separators:
+                    pos += 1
+                if pos < len(buffer) or not read_more():
+                    return buffer[pos:pos + 1]
+
+        def decode(what):
+            nonlocal pos
+            while True:
+                try:
+                    value, pos = decoder.raw_decode(buffer, pos)
+                    return value
+                except json.JSONDecodeError as e:
+                    # an error well before the end of the buffer is bad input, not a chunk boundary
+                    if e.pos < len(buffer) - 16 and not e.msg.startswith("Unterminated string"):
+                        raise ValueError(f"Malformed GeoJSON in {what}: {e.msg}")
+                    if not read_more():
+                        raise ValueError(f"Truncated GeoJSON in {what}")
+
+        if peek() != "{":
+            raise ValueError("GeoJSON must be a JSON object")
+        pos += 1
+        while True:
+            char = peek(",")
+            if char in ("}", ""):
+                raise ValueError("No 'features' array found")
+            if char != '"':
+                raise ValueError("Malformed GeoJSON: expected a top-level key")
+            key = decode("a top-level key")
+            if peek() != ":":
+                raise ValueError(f"Malformed GeoJSON: expected ':' after '{key}'")
+            pos += 1
+            peek()
+            if key != "features":
+                decode(f"'{key}'")
+                continue
+            if peek() != "[":
+                raise ValueError("'features' is not an array")
+            pos += 1
+            count = 0
+            while True:
+                char = peek(",")
+                if char == "]":
+                    return
+                if char == "":
+                    raise ValueError("Truncated GeoJSON in the features array")
+                count += 1
+                yield decode(f"feature {count}")
+
+
+def _section_from_properties(props, length_km):
+    # null or missing properties fall back to the defaults
+    ambient = props.get("ambient")
+    grouping = props.get("grouping")
+    installation = str(props.get("installation") or "direct").lower()
+    return {
+        "section": props.get("section"),
+        "length": length_km,
+        "ambient": 20.0 if ambient is None else float(ambient),
+        "grouping": 0 if grouping is None else int(grouping),  # other cables sharing this section's trench
+        "installation": "ducted" if installation.startswith("duct") else "direct",
+    }
+
+
+def read_routes(path):
+    # returns {route: [section, ...]}; coordinates are reduced to lengths as they stream past
+    routes = {}
+    if path.lower().endswith(".csv"):
+        # one vertex per row: route, section, lat, lon[, ambient, grouping, installation]
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            current_key = None
+            props = None
+            last = None
+            length_m = 0.0
+
+            def close_section():
+                if current_key is not None:
+                    try:
+                        section = _section_from_properties(dict(props, section=current_key[1]), length_m / 1000)
+                    except ValueError as e:
+                        raise ValueError(f"Route {current_key[0]}, section {current_key[1]}: {e}")
+                    routes.setdefault(current_key[0], []).append(section)
+
+            for line_no, row in enumerate(csv.DictReader(f), 2):
+                try:
+                    key = (row["route"], row.get("section") or "1")
+                    lat, lon = float(row["lat"]), float(row["lon"])
+                except (KeyError, ValueError) as e:
+                    raise ValueError(f"Line {line_no}: {e}")
+                if key != current_key:
+                    close_section()
+                    current_key = key
+                    props = {k: v for k, v in row.items() if k in ("ambient", "grouping", "installation") and v}
+                    last = None
+                    length_m = 0.0
+                if last is not None:
+                    length_m += geodesic_distance_m(last[0], last[1], lat, lon)
+                last = (lat, lon)
+            close_section()
+        return routes
+
+    for idx, feature in enumerate(iter_geojson_features(path)):
+        geometry = feature.get("geometry") or {}
+        props = feature.get("properties") or {}
+        if geometry.get("type") == "LineString":
+            length_km = polyline_length_km(geometry["coordinates"])
+        elif geometry.get("type") == "MultiLineString":
+            length_km = sum(polyline_length_km(line) for line in geometry["coordinates"])
+        else:
+            continue
+        route = str(props.get("route", props.get("name", f"Route {idx + 1}")))
+        try:
+            section = _section_from_properties(props, length_km)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Feature {idx + 1} ({route}): {e}")
+        routes.setdefault(route, []).append(section)
+    return routes
+
+
+def size_route(sections, inputs, reg_limit=0.0):
+    # sized against the worst section's derating, losses and drop over the summed length;
+    # a positive reg_limit also screens the candidates on the drop over the whole route
+    P, Q, V, N = inputs["P"], inputs["Q"], inputs["V"], inputs["N"]
+    own_cables = N * 3 if inputs["cable_type"] == "Single-core" else N
+    deratings = [get_temp_factor(sec["ambient"]) * get_trench_factor(min(own_cables + sec["grouping"], 6)) *
+                 installation_factor_table[sec["installation"]] for sec in sections]
+    worst_idx = min(range(len(sections)), key=lambda i: deratings[i])
+    worst = sections[worst_idx]
+    total_length = sum(sec["length"] for sec in sections)
+    derating = {"grouping": worst["grouping"], "installation": worst["installation"]}
+
+    candidates = filter_cables(P, Q, V, N, worst["ambient"], inputs["cable_type"], inputs["arrangement"], **derating)
+    if reg_limit > 0:
+        max_lengths = calc_max_lengths(candidates, P, Q, V, N, inputs["arrangement"], worst["ambient"], reg_limit,
+                                       **derating)
+        candidates = [c for c, m in zip(candidates, max_lengths) if m is not None and m >= total_length]
+    summary = {"sections": len(sections), "length": total_length, "worst_section": worst["section"],
+               "worst_derating": deratings[worst_idx], "cable": None, "result": None}
+    if not candidates:
+        return summary
+    cable = min(candidates, key=lambda c: c["price"])
+    summary["cable"] = cable
+    summary["result"] = calc_performance(cable, P, Q, V, N, inputs["arrangement"], total_length, worst["ambient"],
+                                         inputs["load_type"], **derating)
+    return summary
+
+
+# motor starting: voltage dip at the motor terminals while the locked-rotor current flows
+def calc_motor_start_dips(cables, N, arrangement, length, V, lrc, start_pf, source_r, source_x, load_P=0.0,
+                          load_Q=0.0):
+    # same approximation as the regulation formula, with the source impedance in series
+    # and the N parallel circuits dividing the cable impedance; one pass over all cables.
+    # load_P/load_Q (MW/Mvar) is the load already running on the feeder, whose current adds
+    # to the starting current phasor
+    VLN_volts = V * 1000 / math.sqrt(3)
+    if VLN_volts <= 0 or lrc <= 0:
+        return [0.0 for _ in cables]
+    sin_pf = math.sqrt(max(0.0, 1 - start_pf ** 2))
+    I_active = lrc * start_pf + load_P * 1e6 / (3 * VLN_volts)
+    I_reactive = lrc * sin_pf + load_Q * 1e6 / (3 * VLN_volts)
+    params = [get_line_params(c, arrangement) for c in cables]
+    return [((source_r + R * length / N) * I_active + (source_x + X * length / N) * I_reactive) / VLN_volts * 100
+            for R, _, X in params]
+
+
+def size_motor_feeder(motor):
+    # cheapest cable and circuit count that carries the running load and keeps the starting dip in limit
+    single = motor["cable_type"] == "Single-core"
+    best = None
+    for N in range(1, (2 if single else 6) + 1):
+        candidates = filter_cables(motor["P"], motor["Q"], motor["V"], N, motor["ambient"], motor["cable_type"],
+                                   motor["arrangement"])
+        dips = calc_motor_start_dips(candidates, N, motor["arrangement"], motor["length"], motor["V"],
+                                     motor["lrc"], motor["start_pf"], motor["source_r"], motor["source_x"],
+                                     motor.get("load_P", 0.0), motor.get("load_Q", 0.0))
+        for cable, dip in zip(candidates, dips):
+            if dip > motor["max_dip"]:
+                continue
+            cost = cable["price"] * motor["length"] * N * (3 if single else 1)
+            if best is None or cost < best["cost"]:
+                best = {"cable": cable, "N": N, "dip": dip, "cost": cost}
+    return best
+
+
+motor_csv_fields = ("name", "P", "Q", "V", "length", "lrc", "start_pf", "source_r", "source_x", "max_dip")
+
+
+def read_motor_list(path, defaults):
+    # csv with a header row; ambient, load_P, load_Q (load already running on a shared feeder),
+    # cable_type and arrangement columns are optional
+    motors = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), 2):
+            try:
+                motor = dict(defaults)
+                motor["name"] = row["name"]
+                for key in motor_csv_fields[1:] + ("ambient", "load_P", "load_Q"):
+                    if row.get(key) not in (None, ""):
+                        motor[key] = float(row[key].replace(',', '.'))
+                for key in ("cable_type", "arrangement"):
+                    if row.get(key):
+                        motor[key] = row[key]
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Line {line_no}: {e}")
+            motors.append(motor)
+    return motors
+
+
+# load aggregation: connected-load lists reduced to feeder P and Q per category
+load_categories = {
+    # demand: maximum demand / connected load; diversity: sum of maximum demands / coincident demand
+    "Lighting": {"demand": 0.90, "diversity": 1.10},
+    "Socket": {"demand": 0.50, "diversity": 2.00},
+    "Motor": {"demand": 0.75, "diversity": 1.30},
+    "HVAC": {"demand": 0.80, "diversity": 1.20},
+    "Heating": {"demand": 1.00, "diversity": 1.10},
+    "Other": {"demand": 1.00, "diversity": 1.00},
+}
+
+
+def load_category(load):
+    return load["category"] if load["category"] in load_categories else "Other"
+
+
+def load_contribution(load):
+    # connected load in integer mW / mvar, so adding and removing lines never drifts
+    P_kW = load["kw"] * load["quantity"]
+    if load.get("kvar") is not None:
+        Q_kVAr = load["kvar"] * load["quantity"]
+    else:
+        Q_kVAr = P_kW * math.tan(math.acos(max(0.05, min(1.0, load["pf"]))))
+    return round(P_kW * 1e6), round(Q_kVAr * 1e6)
+
+
+def new_load_aggregation():
+    return {"loads": [], "contributions": [], "sums": {name: [0, 0, 0] for name in load_categories}}
+
+
+def add_load(aggregation, load):
+    contribution = load_contribution(load)
+    sums = aggregation["sums"][load_category(load)]
+    sums[0] += contribution[0]
+    sums[1] += contribution[1]
+    sums[2] += 1
+    aggregation["loads"].append(load)
+    aggregation["contributions"].append(contribution)
+
+
+def update_load(aggregation, index, load):
+    # swaps one line's contribution in and out of its category sums
+    old_load, old = aggregation["loads"][index], aggregation["contributions"][index]
+    sums = aggregation["sums"][load_category(old_load)]
+    sums[0] -= old[0]
+    sums[1] -= old[1]
+    sums[2] -= 1
+    new = load_contribution(load)
+    sums = aggregation["sums"][load_category(load)]
+    sums[0] += new[0]
+    sums[1] += new[1]
+    sums[2] += 1
+    aggregation["loads"][index] = load
+    aggregation["contributions"][index] = new
+
+
+def aggregation_totals(aggregation):
+    # demand and diversity apply per category, so factor edits are as cheap as load edits
+    categories = {}
+    for name, (P_mW, Q_mvar, count) in aggregation["sums"].items():
+        factors = load_categories[name]
+        scale = factors["demand"] / factors["diversity"] / 1e9  # mW -> MW
+        categories[name] = {"count": count, "connected_P": P_mW / 1e9, "connected_Q": Q_mvar / 1e9,
+                            "P": P_mW * scale, "Q": Q_mvar * scale}
+    P = sum(c["P"] for c in categories.values())
+    Q = sum(c["Q"] for c in categories.values())
+    return P, Q, categories
+
+
+def read_load_list(path):
+    # csv with a header row: name, category, kw[, quantity, pf, kvar]
+    aggregation = new_load_aggregation()
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), 2):
+            try:
+                load = {
+                    "name": row["name"],
+                    "category": (row.get("category") or "Other").strip(),
+                    "kw": float(row["kw"].replace(',', '.')),
+                    "quantity": int(row.get("quantity") or 1),
+                    "pf": float((row.get("pf") or "0.9").replace(',', '.')),
+                    "kvar": float(row["kvar"].replace(',', '.')) if row.get("kvar") else None,
+                }
+            except (KeyError, ValueError, AttributeError) as e:
+                raise ValueError(f"Line {line_no}: {e}")
+            add_load(aggregation, load)
+    return aggregation
+
+
+# catalog search: sorted token and attribute arrays answered with bisect
+search_index = {"stale": True, "token_keys": [], "token_ids": [], "fields": {}, "terms": {}}
+search_fields = {"mm2": "section", "s": "section", "section": "section", "cores": "cores", "kv": "kv",
+                 "price": "price"}
+
+
+def parse_cable_code(code):
+    # "3x95+50 mm2" -> (4 cores, 95 mm2 phase section, "3x95+50"); "1x240 mm2" -> (1, 240, "1x240")
+    match = re.match(r"\s*(\d+)x(\d+(?:\.\d+)?)(?:\+(\d+(?:\.\d+)?))?", code)
+    if not match:
+        return None, None, code.split()[0].lower() if code.split() else ""
+    cores = int(match.group(1)) + (1 if match.group(3) else 0)
+    return cores, float(match.group(2)), match.group(0).strip().lower()
+
+
+def build_search_index(cables):
+    tokens = []
+    fields = {name: [] for name in ("section", "cores", "kv", "price")}
+    for cable in cables:
+        cores, section, config = parse_cable_code(cable["code"])
+        words = set(re.split(r"[\s/+x]+", (cable["code"] + " " + cable["voltage"]).lower()))
+        words.update((config, config.split("+")[0], cable["voltage"].lower().replace(" ", "")))
+        tokens.extend((word, cable["id"]) for word in words if word)
+        for name, value in (("section", section), ("cores", cores), ("kv", parse_voltage_kV(cable["voltage"])),
+                            ("price", cable["price"])):
+            if value is not None:
+                fields[name].append((value, cable["id"]))
+
+    tokens.sort()
+    search_index["token_keys"] = [t for t, _ in tokens]
+    search_index["token_ids"] = [cid for _, cid in tokens]
+    search_index["terms"] = {}
+    for name, pairs in fields.items():
+        pairs.sort()
+        search_index["fields"][name] = ([v for v, _ in pairs], [cid for _, cid in pairs])
+    search_index["stale"] = False
+
+
+def invalidate_search_index():
+    search_index["stale"] = True
+
+
+def _parse_search_number(text):
+    text = text.strip().lower().replace(",", ".")
+    scale = 1
+    if text.endswith("k"):
+        text, scale = text[:-1], 1e3
+    elif text.endswith("m"):
+        text, scale = text[:-1], 1e6
+    return float(text) * scale
+
+
+def search_catalog(query):
+    # terms are AND-ed: token prefixes ("3x9", "mm2", "6/10") and attribute ranges
+    # ("mm2:95", "kv>=10", "price<500k", "mm2:50..150"); returns None for an empty query
+    if search_index["stale"]:
+        build_search_index(cable_list)
+    result = None
+    for term in re.findall(r"\w+\s*(?:>=|<=|[:=<>])\s*[^\s]*|[^\s]+", query.lower()):
+        # earlier terms repeat on every keystroke while the next one is typed
+        matched = search_index["terms"].get(term)
+        if matched is not None:
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+            continue
+        match = re.match(r"(\w+)\s*(>=|<=|[:=<>])\s*(.*)$", term)
+        if match and match.group(1) in search_fields:
+            values, ids = search_index["fields"][search_fields[match.group(1)]]
+            op, arg = match.group(2), match.group(3)
+            try:
+                if op in (":", "=") and ".." in arg:
+                    low_text, high_text = arg.split("..", 1)
+                    lo = bisect.bisect_left(values, _parse_search_number(low_text)) if low_text else 0
+                    hi = bisect.bisect_right(values, _parse_search_number(high_text)) if high_text else len(values)
+                else:
+                    x = _parse_search_number(arg)
+                    lo = {">": bisect.bisect_right(values, x), ">=": bisect.bisect_left(values, x),
+                          ":": bisect.bisect_left(values, x), "=": bisect.bisect_left(values, x)}.get(op, 0)
+                    hi = {"<": bisect.bisect_left(values, x), "<=": bisect.bisect_right(values, x),
+                          ":": bisect.bisect_right(values, x), "=": bisect.bisect_right(values, x)}.get(op, len(values))
+            except ValueError:
+                continue  # incomplete term while typing, e.g. "price<"
+            matched = set(ids[lo:hi])
+        else:
+            keys = search_index["token_keys"]
+            lo = bisect.bisect_left(keys, term)
+            hi = bisect.bisect_left(keys, term + "\uffff", lo)
+            matched = set(search_index["token_ids"][lo:hi])
+        if len(search_index["terms"]) > 256:
+            search_index["terms"].clear()
+        search_index["terms"][term] = matched
+        result = matched if result is None else result & matched
+        if not result:
+            return set()
+    return result
+
+
+# tapered collector feeders: one cable per section of a daisy chain, sized by dynamic programming
+def read_collector_chain(path):
+    # csv with a header row, sections from the substation outward: name, length, P[, Q]
+    # P and Q are injected at the far node of each section
+    sections = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), 2):
+            try:
+                sections.append({"name": row["name"], "length": float(row["length"].replace(',', '.')),
+                                 "P": float(row["P"].replace(',', '.')),
+                                 "Q": float((row.get("Q") or "0").replace(',', '.'))})
+            except (KeyError, ValueError, AttributeError) as e:
+                raise ValueError(f"Line {line_no}: {e}")
+    return sections
+
+
+def optimize_tapered_chain(sections, inputs, reg_limit, resolution=1000):
+    # minimizes installed plus lifecycle loss cost subject to the summed regulation of all sections
+    # staying within reg_limit; each option's drop is rounded up to budget units so every answer is feasible
+    P_down = Q_down = 0.0
+    flows = []
+    for section in reversed(sections):
+        P_down += section["P"]
+        Q_down += section["Q"]
+        flows.append((P_down, Q_down))
+    flows.reverse()
+
+    options = []
+    for section, (P, Q) in zip(sections, flows):
+        candidates = filter_cables(P, Q, inputs["V"], inputs["N"], inputs["ambient"], inputs["cable_type"],
+                                   inputs["arrangement"])
+        section_options = []
+        for cable in candidates:
+            r = calc_performance(cable, P, Q, inputs["V"], inputs["N"], inputs["arrangement"], section["length"],
+                                 inputs["ambient"], inputs["load_type"])
+            drop = r["voltage_regulation_percent"]
+            section_options.append({"cable": cable, "cost": r["lifecycle_cost"], "drop": drop,
+                                    "units": math.ceil(drop / reg_limit * resolution - 1e-9),
+                                    "current": r["I_per_circuit"], "loss_kW": r["P_loss_total_kW"]})
+        # dominated options (costlier and no smaller drop) can never be chosen
+        section_options.sort(key=lambda o: (o["cost"], o["units"]))
+        kept = []
+        for option in section_options:
+            if not kept or option["units"] < kept[-1]["units"]:
+                kept.append(option)
+        if not kept:
+            return {"feasible": False, "reason": f"No cable carries section {section['name']}"}
+        options.append(kept)
+
+    # best[b]: cheapest cost of the sections so far with their drops summing to at most b units
+    inf = float("inf")
+    best = [0.0] * (resolution + 1)
+    tables = []
+    for section_options in options:
+        shifted = [[inf] * min(o["units"], resolution + 1) +
+                   [x + o["cost"] for x in best[:max(resolution + 1 - o["units"], 0)]] for o in section_options]
+        best = list(map(min, *shifted)) if len(shifted) > 1 else shifted[0]
+        tables.append(best)
+    if best[resolution] == inf:
+        return {"feasible": False, "reason": f"The chain cannot stay within {reg_limit:.2f}% with any cable choice"}
+
+    # walk back through the tables to recover each section's choice
+    chosen = []
+    b = resolution
+    for k in range(len(options) - 1, -1, -1):
+        previous = tables[k - 1] if k > 0 else [0.0] * (resolution + 1)
+        target = tables[k][b]
+        option = min((o for o in options[k]
+                      if o["units"] <= b and previous[b - o["units"]] + o["cost"] <= target + 1e-6),
+                     key=lambda o: o["cost"])
+        chosen.append(option)
+        b -= option["units"]
+    chosen.reverse()
+
+    rows = []
+    cumulative = 0.0
+    for section, (P, Q), option in zip(sections, flows, chosen):
+        cumulative += option["drop"]
+        rows.append(dict(option, name=section["name"], length=section["length"], P=P, Q=Q, cumulative=cumulative))
+
+    # reference: one cable for the whole chain, as the main filter would size it for the substation
+    # section's load - the cheapest of filter_cables() that keeps the whole chain within the budget
+    uniform = None
+    head_candidates = filter_cables(flows[0][0], flows[0][1], inputs["V"], inputs["N"], inputs["ambient"],
+                                    inputs["cable_type"], inputs["arrangement"])
+    for head in sorted(head_candidates, key=lambda c: c["price"]):
+        uniform_cost = uniform_drop = 0.0
+        for section, (P, Q) in zip(sections, flows):
+            r = calc_performance(head, P, Q, inputs["V"], inputs["N"], inputs["arrangement"], section["length"],
+                                 inputs["ambient"], inputs["load_type"])
+            uniform_cost += r["lifecycle_cost"]
+            uniform_drop += r["voltage_regulation_percent"]
+        if uniform_drop <= reg_limit:
+            uniform = {"cable": head, "cost": uniform_cost, "drop": uniform_drop}
+            break
+
+    return {"feasible": True, "sections": rows, "cost": sum(o["cost"] for o in chosen), "drop": cumulative,
+            "uniform": uniform}
+
+
+# trench grouping: feeders sharing a trench derate each other through get_trench_factor()
+_infeasible_cost = 1e15
+
+
+def parse_trench_routes(text, feeders_by_name):
+    # one line per feeder: "Feeder name: T1=0.40, T2=0.55"
+    feeders = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        name, _, routes_txt = line.rpartition(":")
+        name = name.strip()
+        if name not in feeders_by_name:
+            raise ValueError(f"Line {line_no}: unknown feeder '{name}'")
+        routes = []
+        for part in routes_txt.split(","):
+            trench, sep, length = part.partition("=")
+            if not sep or not trench.strip():
+                raise ValueError(f"Line {line_no}: expected 'name: trench=length, ...', got '{part.strip()}'")
+            try:
+                routes.append((trench.strip(), float(length)))
+            except ValueError:
+                raise ValueError(f"Line {line_no}: invalid length '{length.strip()}' for trench '{trench.strip()}'")
+        feeders.append({"name": name, "inputs": feeders_by_name[name]["inputs"], "routes": routes})
+    return feeders
+
+
+def optimize_trench_grouping(feeders, max_passes=50):
+    # feeders: [{"name", "inputs", "routes": [(trench, length_km), ...]}]
+    # greedy placement (largest currents first) followed by single-feeder moves
+    # between candidate routes while the total installed + lifecycle loss cost drops
+    cable_counts = []
+    options = []  # per feeder, per route: [(lifecycle cost, temp-derated capacity, cable)] sorted by cost
+    currents = []
+    for feeder in feeders:
+        inputs = feeder["inputs"]
+        single = inputs["cable_type"] == "Single-core"
+        cable_counts.append(inputs["N"] * 3 if single else inputs["N"])
+        S_MVA = math.sqrt(inputs["P"] ** 2 + inputs["Q"] ** 2)
+        currents.append(S_MVA * 1e6 / (math.sqrt(3) * inputs["V"] * 1e3) / inputs["N"] if inputs["V"] > 0 else 0)
+        temp_factor = get_temp_factor(inputs["ambient"])
+        route_options = []
+        for _, length in feeder["routes"]:
+            cands = []
+            for cable in cable_list:
+                if cable["code"].startswith("1x") != single or parse_voltage_kV(cable["voltage"]) < inputs["V"]:
+                    continue
+                base_capacity = get_base_capacity(cable, inputs["arrangement"])
+                if base_capacity is None:
+                    continue
+                r = calc_performance(cable, inputs["P"], inputs["Q"], inputs["V"], inputs["N"],
+                                     inputs["arrangement"], length, inputs["ambient"], inputs["load_type"])
+                cands.append((r["lifecycle_cost"], base_capacity * temp_factor, cable))
+            cands.sort(key=lambda item: item[0])
+            route_options.append(cands)
+        options.append(route_options)
+
+    cost_cache = {}
+
+    def feeder_cost(fi, ri, cables_in_trench):
+        key = (fi, ri, min(cables_in_trench, 6))
+        if key not in cost_cache:
+            trench_factor = get_trench_factor(key[2])
+            cands = options[fi][ri]
+            # the same continuous-or-cyclic rating as filter_cables()
+            rated = get_rated_capacities([cable for _, _, cable in cands],
+                                         [capacity * trench_factor for _, capacity, _ in cands],
+                                         feeders[fi]["inputs"]["ambient"])
+            cost_cache[key] = next(((cost, cable) for (cost, _, cable), r in zip(cands, rated)
+                                    if r >= currents[fi]), (_infeasible_cost, None))
+        return cost_cache[key]
+
+    assignment = [None] * len(feeders)
+    members = {}  # trench -> set of feeder indices
+    population = {}  # trench -> cables in trench
+
+    def trench_cost(trench, extra_fi=None, extra_ri=None, removed_fi=None):
+        fis = [fi for fi in members.get(trench, ()) if fi != removed_fi]
+        count = sum(cable_counts[fi] for fi in fis)
+        if extra_fi is not None:
+            count += cable_counts[extra_fi]
+        total = sum(feeder_cost(fi, assignment[fi], count)[0] for fi in fis)
+        if extra_fi is not None:
+            total += feeder_cost(extra_fi, extra_ri, count)[0]
+        return total
+
+    def place(fi, ri):
+        trench = feeders[fi]["routes"][ri][0]
+        assignment[fi] = ri
+        members.setdefault(trench, set()).add(fi)
+        population[trench] = population.get(trench, 0) + cable_counts[fi]
+
+    def unplace(fi):
+        trench = feeders[fi]["routes"][assignment[fi]][0]
+        members[trench].discard(fi)
+        population[trench] -= cable_counts[fi]
+        assignment[fi] = None
+
+    # greedy: hardest feeders first, each to the route with the smallest cost increase
+    for fi in sorted(range(len(feeders)), key=lambda i: -currents[i] * cable_counts[i]):
+        best = None
+        for ri, (trench, _) in enumerate(feeders[fi]["routes"]):
+            delta = trench_cost(trench, fi, ri) - trench_cost(trench)
+            if best is None or delta < best[0]:
+                best = (delta, ri)
+        place(fi, best[1])
+
+    # local improvement: move one feeder at a time to another candidate route
+    passes = 0
+    improved = True
+    while improved and passes < max_passes:
+        improved = False
+        passes += 1
+        for fi in range(len(feeders)):
+            current_ri = assignment[fi]
+            current_trench = feeders[fi]["routes"][current_ri][0]
+            leave_gain = trench_cost(current_trench) - trench_cost(current_trench, removed_fi=fi)
+            best = (0.0, None)
+            for ri, (trench, _) in enumerate(feeders[fi]["routes"]):
+                if ri == current_ri:
+                    continue
+                if trench == current_trench:
+                    delta = trench_cost(trench, fi, ri, removed_fi=fi) - trench_cost(trench)
+                else:
+                    delta = trench_cost(trench, fi, ri) - trench_cost(trench) - leave_gain
+                if delta < best[0] - 1e-6:
+                    best = (delta, ri)
+            if best[1] is not None:
+                unplace(fi)
+                place(fi, best[1])
+                improved = True
+
+    # total_cost covers the feeders that got a cable; the rest are listed as infeasible
+    result = {"feeders": [], "loadings": {}, "total_cost": 0.0, "infeasible": [], "passes": passes}
+    for fi, feeder in enumerate(feeders):
+        trench, length = feeder["routes"][assignment[fi]]
+        cost, cable = feeder_cost(fi, assignment[fi], population[trench])
+        result["feeders"].append({"name": feeder["name"], "trench": trench, "length": length,
+                                  "cable": cable, "cost": cost if cable else None})
+        if cable is None:
+            result["infeasible"].append(feeder["name"])
+        else:
+            result["total_cost"] += cost
+    for trench, fis in members.items():
+        if fis:
+            result["loadings"][trench] = {"feeders": sorted(feeders[fi]["name"] for fi in fis),
+                                          "cables": population[trench],
+                                          "factor": get_trench_factor(min(population[trench], 6))}
+    return result
+
+
+# sizing atlas: cheapest passing cable precomputed over a grid of (V, N, ambient, S)
+# and stored as flat int32 id / float32 margin blocks that are memory-mapped on open
+_atlas_magic = b"CABLEATLAS1\n"
+atlas_default_ambients = [5, 10, 15, 20, 25, 30, 35, 40]  # temp factors step every 5 degC
+
+
+def build_sizing_atlas(path, cable_type, arrangement, voltages, s_step, s_count, ambients=None):
+    ambients = ambients or atlas_default_ambients
+    max_c = 2 if cable_type == "Single-core" else 6
+    voltages = sorted(voltages)
+    ids = array.array("i")
+    margins = array.array("f")
+
+    for V in voltages:
+        for N in range(1, max_c + 1):
+            for ambient in ambients:
+                # largest apparent power (MVA) each candidate carries; same checks as filter_cables()
+                cables = []
+                derated = []
+                for cable in cable_list:
+                    is_single_core = cable["code"].startswith("1x")
+                    if (cable_type == "Single-core") != is_single_core:
+                        continue
+                    if parse_voltage_kV(cable["voltage"]) < V:
+                        continue
+                    base_capacity = get_base_capacity(cable, arrangement)
+                    if base_capacity is None:
+                        continue
+                    cables_in_trench = N * 3 if is_single_core else N
+                    cables.append(cable)
+                    derated.append(base_capacity * get_temp_factor(ambient) *
+                                   get_trench_factor(min(cables_in_trench, 6)))
+                limits = [(rated * N * math.sqrt(3) * V * 1e3 / 1e6, cable)
+                          for rated, cable in zip(get_rated_capacities(cables, derated, ambient), cables)]
+
+                # the passing set only shrinks as S grows, so the answer is piecewise constant
+                # between candidate limits: sweep the limits instead of filtering every node
+                limits.sort(key=lambda item: item[0])
+                k = 0
+                for i, (s_limit, _) in enumerate(limits):
+                    k_end = min(s_count, int(s_limit / s_step))  # nodes S = (k + 1) * s_step <= s_limit
+                    if k_end <= k:
+                        continue
+                    passing = [c for _, c in limits[i:]]
+                    min_rating = min(parse_voltage_kV(c["voltage"]) for c in passing)
+                    best = min((c for c in passing if parse_voltage_kV(c["voltage"]) == min_rating),
+                               key=lambda c: c["price"])
+                    best_limit = next(lim for lim, c in limits if c is best)
+                    ids.extend([best["id"]] * (k_end - k))
+                    margins.extend([(1 - (j + 1) * s_step / best_limit) * 100 for j in range(k, k_end)])
+                    k = k_end
+                ids.extend([0] * (s_count - k))
+                margins.extend([0.0] * (s_count - k))
+
+    header = json.dumps({
+        "cable_type": cable_type, "arrangement": arrangement, "voltages": voltages, "max_circuits": max_c,
+        "ambients": ambients, "s_step": s_step, "s_count": s_count, "byteorder": sys.byteorder,
+        "catalog": _fingerprint(cable_list), "model": model_fingerprint(),
+    }).encode("utf-8")
+    header += b" " * (-(len(_atlas_magic) + 4 + len(header)) % 4)  # keep the blocks 4-byte aligned
+    with open(path, "wb") as f:
+        f.write(_atlas_magic)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        ids.tofile(f)
+        margins.tofile(f)
+    return len(ids)
+
+
+def open_sizing_atlas(path):
+    f = open(path, "rb")
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        f.close()
+        raise
+    if mm[:len(_atlas_magic)] != _atlas_magic:
+        mm.close()
+        f.close()
+        raise ValueError("Not a sizing atlas file")
+    offset = len(_atlas_magic)
+    (header_len,) = struct.unpack("<I", mm[offset:offset + 4])
+    header = json.loads(mm[offset + 4:offset + 4 + header_len].decode("utf-8"))
+    if header["byteorder"] != sys.byteorder:
+        mm.close()
+        f.close()
+        raise ValueError("Atlas was built on a machine with a different byte order")
+
+    count = len(header["voltages"]) * header["max_circuits"] * len(header["ambients"]) * header["s_count"]
+    start = offset + 4 + header_len
+    view = memoryview(mm)
+    return {
+        "header": header, "file": f, "mm": mm, "path": path,
+        "voltage_index": {v: i for i, v in enumerate(header["voltages"])},
+        "ids": view[start:start + 4 * count].cast("i"),
+        "margins": view[start + 4 * count:start + 8 * count].cast("f"),
+    }
+
+
+def sizing_atlas_stale(atlas):
+    # the stored answers depend on the catalog and on every derating, thermal and screen setting,
+    # which can change while the atlas is open
+    header = atlas["header"]
+    return header["catalog"] != _fingerprint(cable_list) or header.get("model") != model_fingerprint()
+
+
+def close_sizing_atlas(atlas):
+    atlas["ids"].release()
+    atlas["margins"].release()
+    atlas["mm"].close()
+    atlas["file"].close()
+
+
+def atlas_lookup(atlas, S_MVA, V, N, ambient):
+    # returns (cable_id or 0, margin %) or None when the point is outside the atlas.
+    # S and ambient are rounded up to the next grid node, so answers are never optimistic
+    header = atlas["header"]
+    vi = atlas["voltage_index"].get(V)
+    if vi is None or not 1 <= N <= header["max_circuits"]:
+        return None
+    ambients = header["ambients"]
+    if ambient > ambients[-1]:
+        return None  # hotter than any node: there is none to round up to
+    ai = bisect.bisect_left(ambients, ambient)
+    si = max(0, math.ceil(S_MVA / header["s_step"] - 1e-9) - 1)
+    if si >= header["s_count"]:
+        return None
+    idx = ((vi * header["max_circuits"] + (N - 1)) * len(ambients) + ai) * header["s_count"] + si
+    return atlas["ids"][idx], atlas["margins"][idx]
+
+
+def validate_sizing_atlas(atlas, samples=1000):
+    # spot-check random points against the exact filter_cables() engine
+    header = atlas["header"]
+    s_max = header["s_step"] * header["s_count"]
+    stats = {"samples": samples, "exact": 0, "conservative": 0, "unsafe": 0, "mismatches": []}
+    for _ in range(samples):
+        V = random.choice(header["voltages"])
+        N = random.randint(1, header["max_circuits"])
+        ambient = random.uniform(header["ambients"][0], header["ambients"][-1])
+        S_MVA = random.uniform(0, s_max)
+        atlas_id, _ = atlas_lookup(atlas, S_MVA, V, N, ambient)
+        candidates = filter_cables(S_MVA, 0.0, V, N, ambient, header["cable_type"], header["arrangement"])
+        exact = min(candidates, key=lambda c: c["price"]) if candidates else None
+        atlas_cable = next((c for c in cable_list if c["id"] == atlas_id), None)
+        if (exact["id"] if exact else 0) == atlas_id:
+            stats["exact"] += 1
+        elif atlas_cable is None and exact is not None or atlas_cable is not None and calc_performance(
+                atlas_cable, S_MVA, 0.0, V, N, header["arrangement"], 1.0, ambient, "Industrial"
+        )["capacity_check"] == "PASS":
+            stats["conservative"] += 1  # grid rounding picked a larger (still passing) cable or none
+        else:
+            stats["unsafe"] += 1
+            stats["mismatches"].append((S_MVA, V, N, ambient, atlas_id, exact["id"] if exact else 0))
+    return stats
@@ -0,0 +1,34 @@
+import copy
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cable_engine  # noqa: E402
+
+_settings = ("temp_factor_table", "trench_factor_table", "installation_factor_table", "economic_settings",
+             "thermal_settings", "transient_settings", "voltage_settings", "sheath_settings")
+
+
+@pytest.fixture(autouse=True)
+def restore_engine_state():
+    # the engine keeps its models in module-level dicts; tests may change them freely
+    saved = {name: copy.deepcopy(getattr(cable_engine, name)) for name in _settings}
+    prices = [cable["price"] for cable in cable_engine.cable_list]
+    yield
+    for name, value in saved.items():
+        current = getattr(cable_engine, name)
+        current.clear()
+        current.update(value)
+    for cable, price in zip(cable_engine.cable_list, prices):
+        cable["price"] = price
+    cable_engine.project.update({"path": None, "feeders": [], "price_overrides": {}})
+    cable_engine.invalidate_search_index()
+
+
+@pytest.fixture
+def feeder_inputs():
+    return {"load_type": "Industrial", "cable_type": "Single-core", "arrangement": "Flat", "P": 2.0, "Q": 1.0,
+            "V": 10.0, "N": 1, "length": 2.0, "ambient": 20.0}
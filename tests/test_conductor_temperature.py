@@ -0,0 +1,33 @@
+import pytest
+
+from cable_engine import get_operating_resistance, solve_conductor_temperatures, thermal_settings
+
+
+def closed_form_temperature(ratio, ambient):
+    # theta = ambient + g * (1 + alpha * (theta - t_ref)) is linear in theta
+    alpha, t_ref, t_max = thermal_settings["alpha"], thermal_settings["reference_temp"], \
+        thermal_settings["max_conductor_temp"]
+    g = (t_max - ambient) * ratio ** 2 / (1 + alpha * (t_max - t_ref))
+    return (ambient + g * (1 - alpha * t_ref)) / (1 - g * alpha)
+
+
+def test_fixed_point_matches_the_closed_form():
+    ratios = [0.0, 0.3, 0.6, 0.9, 1.0, 1.2]
+    temps, resistances, converged, _ = solve_conductor_temperatures([0.1] * len(ratios), ratios, 25.0)
+    assert all(converged)
+    assert temps == pytest.approx([closed_form_temperature(r, 25.0) for r in ratios], abs=1e-4)
+    assert temps[0] == pytest.approx(25.0)
+    assert temps[4] == pytest.approx(thermal_settings["max_conductor_temp"], abs=1e-4)  # rated current
+    alpha, t_ref = thermal_settings["alpha"], thermal_settings["reference_temp"]
+    assert resistances == pytest.approx([0.1 * (1 + alpha * (t - t_ref)) for t in temps])
+
+
+def test_runaway_is_capped_and_unconverged():
+    temps, _, converged, _ = solve_conductor_temperatures([0.1, 0.1], [0.5, 20.0], 20.0)
+    assert converged == [True, False]
+    assert temps[1] == thermal_settings["runaway_temp"]
+
+
+def test_disabled_model_keeps_the_catalog_resistance():
+    thermal_settings["enabled"] = False
+    assert get_operating_resistance(0.2, 100.0, 120.0, 30.0) == (0.2, thermal_settings["reference_temp"], True, 0)
@@ -0,0 +1,91 @@
+import math
+
+import pytest
+
+from cable_engine import (cable_list, calc_exact_max_lengths, calc_max_lengths, get_feeder_phasors, get_line_params,
+                          solve_receiving_voltages, thermal_settings, voltage_settings)
+
+mv_cables = [c for c in cable_list if c["voltage"] == "6/10 kV" and c["code"].startswith("1x")]
+
+
+def fixed_point_regulation(Z, Y, P, Q, V, iterations=2000):
+    # Vr = (Vs - Z conj(S / Vr)) / A, sending phasor held at angle zero
+    Vs = V * 1000 / math.sqrt(3)
+    S = complex(P, Q) * 1e6 / 3
+    A = 1 + Z * Y / 2
+    Vr = complex(Vs, 0)
+    for _ in range(iterations):
+        Vr = (Vs - Z * (S / Vr).conjugate()) / A
+    return (1 - abs(Vr) / Vs) * 100
+
+
+def test_light_load_matches_the_approximation():
+    P, Q, V = 0.05, 0.02, 10.0
+    for cable in mv_cables:
+        R, _, X = get_line_params(cable, "Flat")
+        Z = complex(R, X) * 2.0
+        sol = solve_receiving_voltages([(Z, 0j)], P, Q, V)[0]
+        approx = (Z.real * P + Z.imag * Q) / V ** 2 * 100  # VR = (R P + X Q) / V^2
+        assert sol["converged"]
+        assert sol["regulation"] == pytest.approx(approx, rel=1e-3)
+
+
+@pytest.mark.parametrize("P, Q", [(1.0, 0.5), (4.0, 2.0), (8.0, -1.0), (3.0, 0.0)])
+def test_matches_complex_fixed_point(P, Q):
+    lines = [get_feeder_phasors(c, "Trefoil", 1, 5.0, c["resistance"]) for c in mv_cables]
+    for (Z, Y), sol in zip(lines, solve_receiving_voltages(lines, P, Q, 10.0)):
+        if sol is None:
+            continue
+        assert sol["converged"]
+        assert sol["regulation"] == pytest.approx(fixed_point_regulation(Z, Y, P, Q, 10.0), abs=1e-7)
+
+
+def test_collapse_returns_none():
+    Z, Y = get_feeder_phasors(mv_cables[0], "Flat", 1, 20.0, mv_cables[0]["resistance"])
+    sols = solve_receiving_voltages([(Z, Y), (Z / 100, Y / 100)], 20.0, 10.0, 10.0)
+    assert sols[0] is None
+    assert sols[1] is not None and sols[1]["converged"]
+
+
+def test_capacitance_raises_the_receiving_voltage():
+    cable = next(c for c in mv_cables if c["capacitance"])
+    Z, Y = get_feeder_phasors(cable, "Flat", 1, 20.0, cable["resistance"])
+    with_y, without_y = solve_receiving_voltages([(Z, Y), (Z, 0j)], 0.5, 0.0, 10.0)
+    assert with_y["regulation"] < without_y["regulation"]
+
+
+def test_exact_max_lengths_reach_the_limit():
+    P, Q, V, N, limit = 3.0, 1.5, 10.0, 1, 3.0
+    resistances = [c["resistance"] for c in mv_cables]
+    lengths = calc_exact_max_lengths(mv_cables, P, Q, V, N, "Flat", resistances, limit)
+    for cable, L, R in zip(mv_cables, lengths, resistances):
+        at, beyond = solve_receiving_voltages([get_feeder_phasors(cable, "Flat", N, L, R),
+                                               get_feeder_phasors(cable, "Flat", N, L * 1.001, R)], P, Q, V)
+        assert at["regulation"] == pytest.approx(limit, abs=1e-6)
+        assert beyond is None or beyond["regulation"] > limit
+
+
+def test_exact_filter_uses_the_exact_lengths():
+    thermal_settings["enabled"] = False
+    voltage_settings["exact_filter"] = True
+    resistances = [get_line_params(c, "Flat")[0] for c in mv_cables]
+    assert calc_max_lengths(mv_cables, 0.5, 0.2, 10.0, 1, "Flat", 20.0, 1.0) == calc_exact_max_lengths(
+        mv_cables, 0.5, 0.2, 10.0, 1, "Flat", resistances, 1.0)
+
+
+def test_exact_max_length_is_the_first_crossing_under_ferranti_rise():
+    # a lightly loaded cable with high charging: the drop peaks within the first kilometre and then
+    # turns into a voltage rise, so only a short window of lengths exceeds a limit just below the peak
+    cable = max((c for c in cable_list if c["capacitance"]), key=lambda c: c["capacitance"])
+
+    def regulation(L):
+        return solve_receiving_voltages([get_feeder_phasors(cable, "Trefoil", 1, L, cable["resistance"])],
+                                        0.01, 0.0, 10.0)[0]["regulation"]
+
+    grid = [0.01 * 1.02 ** k for k in range(400)]
+    peak = max(map(regulation, grid))
+    assert regulation(grid[-1]) < 0 < peak
+    limit = 0.99 * peak
+    L = calc_exact_max_lengths([cable], 0.01, 0.0, 10.0, 1, "Trefoil", [cable["resistance"]], limit)[0]
+    assert regulation(L) == pytest.approx(limit, rel=1e-6)
+    assert all(regulation(x) <= limit for x in grid if x < L)
@@ -0,0 +1,40 @@
+import pytest
+
+from cable_engine import (calc_lifecycle_costs, calc_performance, cable_list, economic_settings,
+                          lifecycle_year_factors)
+
+
+def test_no_discounting_sums_the_annual_cost():
+    economic_settings.update(years=10, discount_rate=0.0, load_growth=0.0, price_escalation=0.0, residual_value=0.0)
+    loss_pv, residual_pv, lifecycle = calc_lifecycle_costs([1000.0, 250.0], [5e5, 1e6])
+    assert loss_pv == pytest.approx([10000.0, 2500.0])
+    assert residual_pv == [0.0, 0.0]
+    assert lifecycle == pytest.approx([510000.0, 1002500.0])
+
+
+def test_discounting_matches_the_annuity_factor():
+    economic_settings.update(years=25, discount_rate=0.08, load_growth=0.0, price_escalation=0.0)
+    annuity = (1 - 1.08 ** -25) / 0.08
+    assert sum(lifecycle_year_factors()) == pytest.approx(annuity)
+
+
+def test_growth_escalation_and_residual_value():
+    economic_settings.update(years=15, discount_rate=0.06, load_growth=0.02, price_escalation=0.03,
+                             residual_value=0.2)
+    annual, installation = 1234.0, 56789.0
+    expected_loss = sum(annual * 1.02 ** (2 * (t - 1)) * 1.03 ** (t - 1) / 1.06 ** t for t in range(1, 16))
+    expected_residual = 0.2 * installation / 1.06 ** 15
+    loss_pv, residual_pv, lifecycle = calc_lifecycle_costs([annual], [installation])
+    assert loss_pv[0] == pytest.approx(expected_loss)
+    assert residual_pv[0] == pytest.approx(expected_residual)
+    assert lifecycle[0] == pytest.approx(installation + expected_loss - expected_residual)
+
+
+def test_performance_reports_the_lifecycle_cost():
+    economic_settings.update(years=20, discount_rate=0.05, load_growth=0.01)
+    cable = next(c for c in cable_list if c["code"].startswith("3x"))
+    r = calc_performance(cable, 1.0, 0.5, 10.0, 1, "Trefoil", 2.0, 20.0, "Industrial")
+    loss_pv, _, lifecycle = calc_lifecycle_costs([r["annual_loss_cost"]], [r["cable_installation_cost"]])
+    assert r["energy_loss_cost_pv"] == pytest.approx(loss_pv[0])
+    assert r["lifecycle_cost"] == pytest.approx(lifecycle[0])
+    assert r["energy_loss_cost_10yr"] == pytest.approx(10 * r["annual_loss_cost"])
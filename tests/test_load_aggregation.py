@@ -0,0 +1,81 @@
+import math
+import random
+
+import pytest
+
+from cable_engine import (add_load, aggregation_totals, load_categories, new_load_aggregation, read_load_list,
+                          update_load)
+
+
+def random_load(rng):
+    return {"name": "L", "category": rng.choice(list(load_categories) + ["Unknown"]),
+            "kw": round(rng.uniform(0.1, 200), 3), "quantity": rng.randint(1, 20),
+            "pf": round(rng.uniform(0.6, 1.0), 2), "kvar": rng.choice([None, round(rng.uniform(0, 50), 3)])}
+
+
+def full_resum(loads):
+    P = Q = 0.0
+    for load in loads:
+        factors = load_categories.get(load["category"], load_categories["Other"])
+        scale = factors["demand"] / factors["diversity"] / 1e3
+        P_kW = load["kw"] * load["quantity"]
+        if load["kvar"] is not None:
+            Q_kVAr = load["kvar"] * load["quantity"]
+        else:
+            Q_kVAr = P_kW * math.tan(math.acos(load["pf"]))
+        P += P_kW * scale
+        Q += Q_kVAr * scale
+    return P, Q
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_totals_match_full_resum(seed):
+    rng = random.Random(seed)
+    aggregation = new_load_aggregation()
+    loads = []
+    for _ in range(200):
+        if loads and rng.random() < 0.5:
+            index = rng.randrange(len(loads))
+            loads[index] = random_load(rng)
+            update_load(aggregation, index, loads[index])
+        else:
+            loads.append(random_load(rng))
+            add_load(aggregation, loads[-1])
+    P, Q, categories = aggregation_totals(aggregation)
+    expected_P, expected_Q = full_resum(loads)
+    assert P == pytest.approx(expected_P, rel=1e-9)
+    assert Q == pytest.approx(expected_Q, rel=1e-9)
+    assert sum(c["count"] for c in categories.values()) == len(loads)
+
+
+def test_update_back_to_original_restores_exact_sums():
+    rng = random.Random(1)
+    aggregation = new_load_aggregation()
+    original = random_load(rng)
+    add_load(aggregation, original)
+    before = {name: list(sums) for name, sums in aggregation["sums"].items()}
+    for _ in range(1000):
+        update_load(aggregation, 0, random_load(rng))
+    update_load(aggregation, 0, original)
+    assert aggregation["sums"] == before
+
+
+def test_read_load_list(tmp_path):
+    path = tmp_path / "loads.csv"
+    path.write_text("name,category,kw,quantity,pf,kvar\n"
+                    "Lights,Lighting,\"1,5\",10,,\n"
+                    "Pump,Motor,55,2,0.85,\n"
+                    "Chiller,HVAC,100,,,30\n", encoding="utf-8")
+    aggregation = read_load_list(str(path))
+    assert [load["name"] for load in aggregation["loads"]] == ["Lights", "Pump", "Chiller"]
+    assert aggregation["loads"][0]["kw"] == 1.5 and aggregation["loads"][0]["pf"] == 0.9
+    P, _, categories = aggregation_totals(aggregation)
+    assert categories["Motor"]["connected_P"] == pytest.approx(0.110)
+    assert P == pytest.approx(full_resum(aggregation["loads"])[0])
+
+
+def test_read_load_list_reports_line(tmp_path):
+    path = tmp_path / "loads.csv"
+    path.write_text("name,category,kw\nA,Lighting,1\nB,Motor,abc\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Line 3"):
+        read_load_list(str(path))
@@ -0,0 +1,46 @@
+import pytest
+
+from cable_engine import (cable_list, calc_max_length_table, calc_max_lengths, calc_performance, filter_cables,
+                          thermal_settings)
+
+
+@pytest.mark.parametrize("thermal", [False, True])
+def test_regulation_at_max_length_equals_limit(thermal):
+    thermal_settings["enabled"] = thermal
+    P, Q, V, N, ambient, reg_limit = 2.0, 1.0, 10.0, 1, 20.0, 3.0
+    cables = filter_cables(P, Q, V, N, ambient, "Single-core", "Flat")
+    assert cables
+    for cable, max_length in zip(cables, calc_max_lengths(cables, P, Q, V, N, "Flat", ambient, reg_limit)):
+        r = calc_performance(cable, P, Q, V, N, "Flat", max_length, ambient, "Industrial")
+        assert r["voltage_regulation_percent"] == pytest.approx(reg_limit, rel=1e-9)
+
+
+def test_max_length_scales_inversely_with_current():
+    cables = filter_cables(1.0, 0.5, 10.0, 1, 20.0, "Three-core", "Flat")
+    thermal_settings["enabled"] = False
+    single = calc_max_lengths(cables, 1.0, 0.5, 10.0, 1, "Flat", 20.0, 5.0)
+    double = calc_max_lengths(cables, 2.0, 1.0, 10.0, 1, "Flat", 20.0, 5.0)
+    for a, b in zip(single, double):
+        assert a == pytest.approx(2 * b)
+
+
+def test_no_limit_gives_no_lengths():
+    cables = filter_cables(1.0, 0.5, 10.0, 1, 20.0, "Three-core", "Flat")
+    assert calc_max_lengths(cables, 1.0, 0.5, 10.0, 1, "Flat", 20.0, 0.0) == [None] * len(cables)
+
+
+def test_length_table_covers_every_circuit_count():
+    thermal_settings["enabled"] = False
+    three_core = [c for c in cable_list if not c["code"].startswith("1x")]
+    table = calc_max_length_table(three_core, 6.0, 3.0, 10.0, 6, "Flat", 20.0, 5.0)
+    single = calc_max_lengths(three_core, 6.0, 3.0, 10.0, 1, "Flat", 20.0, 5.0)
+    for N in range(1, 7):
+        passing = {c["id"] for c in filter_cables(6.0, 3.0, 10.0, N, 20.0, "Three-core", "Flat")}
+        for cable, row, length in zip(three_core, table, single):
+            if cable["id"] in passing:
+                assert row[N - 1] is not None
+            if row[N - 1] is not None:
+                # with the temperature model off the drop per km falls as 1/N
+                assert row[N - 1] == pytest.approx(N * length)
+    # small cables only qualify once the load is split over enough circuits
+    assert any(row[0] is None and row[-1] is not None for row in table)
@@ -0,0 +1,63 @@
+import pytest
+
+from cable_engine import (calc_motor_start_dips, calc_performance, filter_cables, read_motor_list,
+                          size_motor_feeder, thermal_settings)
+
+
+def test_dip_without_source_matches_the_regulation_formula():
+    thermal_settings["enabled"] = False
+    P, Q, V, N = 1.2, 0.9, 10.0, 2
+    cables = filter_cables(P, Q, V, N, 20.0, "Three-core", "Trefoil")
+    perf = [calc_performance(c, P, Q, V, N, "Trefoil", 1.5, 20.0, "Industrial") for c in cables]
+    # the running current of all circuits drawn at the running power factor
+    lrc = perf[0]["I_total"]
+    dips = calc_motor_start_dips(cables, N, "Trefoil", 1.5, V, lrc, perf[0]["cos_phi"], 0.0, 0.0)
+    assert dips == pytest.approx([r["voltage_regulation_percent"] for r in perf])
+
+
+def test_source_impedance_adds_to_every_dip():
+    cables = filter_cables(1.0, 0.5, 10.0, 1, 20.0, "Three-core", "Trefoil")
+    base = calc_motor_start_dips(cables, 1, "Trefoil", 1.0, 10.0, 400.0, 0.3, 0.0, 0.0)
+    with_source = calc_motor_start_dips(cables, 1, "Trefoil", 1.0, 10.0, 400.0, 0.3, 0.05, 0.5)
+    extra = 400.0 * (0.05 * 0.3 + 0.5 * (1 - 0.3 ** 2) ** 0.5) / (10000 / 3 ** 0.5) * 100
+    assert [w - b for w, b in zip(with_source, base)] == pytest.approx([extra] * len(cables))
+
+
+def test_batch_sizing_picks_the_cheapest_compliant_option():
+    motor = {"name": "M1", "P": 1.5, "Q": 1.0, "V": 6.3, "length": 1.2, "lrc": 900.0, "start_pf": 0.25,
+             "source_r": 0.02, "source_x": 0.3, "max_dip": 12.0, "ambient": 30.0, "cable_type": "Three-core",
+             "arrangement": "Trefoil"}
+    options = []
+    for N in range(1, 7):
+        cables = filter_cables(motor["P"], motor["Q"], motor["V"], N, motor["ambient"], "Three-core", "Trefoil")
+        dips = calc_motor_start_dips(cables, N, "Trefoil", motor["length"], motor["V"], motor["lrc"],
+                                     motor["start_pf"], motor["source_r"], motor["source_x"])
+        options += [c["price"] * motor["length"] * N for c, d in zip(cables, dips) if d <= motor["max_dip"]]
+    best = size_motor_feeder(motor)
+    assert best is not None and best["dip"] <= motor["max_dip"]
+    assert best["cost"] == pytest.approx(min(options))
+
+
+def test_motor_list_fills_defaults_and_reports_bad_lines(tmp_path):
+    path = tmp_path / "motors.csv"
+    path.write_text("name,P,Q,V,length,lrc,start_pf,source_r,source_x,max_dip\n"
+                    "M1,1.5,1,\"6,3\",1.2,900,0.25,0.02,0.3,12\n", encoding="utf-8")
+    defaults = {"ambient": 25.0, "cable_type": "Three-core", "arrangement": "Trefoil"}
+    motors = read_motor_list(str(path), defaults)
+    assert motors[0]["V"] == 6.3 and motors[0]["ambient"] == 25.0 and motors[0]["cable_type"] == "Three-core"
+
+    path.write_text("name,P\nM1,abc\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Line 2"):
+        read_motor_list(str(path), defaults)
+
+
+def test_running_load_current_adds_to_the_starting_phasor():
+    thermal_settings["enabled"] = False
+    P, Q, V, N = 1.2, 0.9, 10.0, 1
+    cables = filter_cables(P, Q, V, N, 20.0, "Three-core", "Trefoil")
+    motor_only = calc_motor_start_dips(cables, N, "Trefoil", 1.5, V, 300.0, 0.3, 0.0, 0.0)
+    load_only = [calc_performance(c, P, Q, V, N, "Trefoil", 1.5, 20.0, "Industrial")["voltage_regulation_percent"]
+                 for c in cables]
+    # the approximate drop is linear in the current phasor, so the two contributions add
+    both = calc_motor_start_dips(cables, N, "Trefoil", 1.5, V, 300.0, 0.3, 0.0, 0.0, P, Q)
+    assert both == pytest.approx([m + r for m, r in zip(motor_only, load_only)])
@@ -0,0 +1,44 @@
+import pytest
+
+from cable_engine import (cable_list, calc_performance, get_line_params, rank_parallel_additions,
+                          solve_parallel_circuits, thermal_settings)
+
+
+def cable(code, voltage="6/10 kV"):
+    return next(c for c in cable_list if c["code"] == code and c["voltage"] == voltage)
+
+
+@pytest.mark.parametrize("thermal", [False, True])
+def test_identical_circuits_match_the_equal_split(thermal):
+    thermal_settings["enabled"] = thermal
+    circuit = {"cable": cable("3x95 mm2"), "arrangement": "Trefoil", "length": 2.0}
+    sol = solve_parallel_circuits([dict(circuit), dict(circuit)], 3.0, 1.5, 10.0, 25.0, "Industrial")
+    equal = calc_performance(circuit["cable"], 3.0, 1.5, 10.0, 2, "Trefoil", 2.0, 25.0, "Industrial")
+    assert [row["share"] for row in sol["circuits"]] == pytest.approx([50.0, 50.0])
+    assert sol["circuits"][0]["current"] == pytest.approx(equal["I_per_circuit"])
+    assert sol["P_loss_total_kW"] == pytest.approx(equal["P_loss_total_kW"], rel=1e-6)
+    assert sol["voltage_regulation_percent"] == pytest.approx(equal["voltage_regulation_percent"], rel=1e-6)
+
+
+def test_mixed_sizes_share_by_admittance():
+    thermal_settings["enabled"] = False
+    circuits = [{"cable": cable("3x50 mm2"), "arrangement": "Trefoil", "length": 1.5},
+                {"cable": cable("3x150 mm2"), "arrangement": "Trefoil", "length": 2.5}]
+    sol = solve_parallel_circuits(circuits, 4.0, 2.0, 10.0, 20.0, "Industrial")
+    admittances = []
+    for c in circuits:
+        R, _, X = get_line_params(c["cable"], c["arrangement"])
+        admittances.append(1 / complex(R * c["length"], X * c["length"]))
+    expected = [abs(y / sum(admittances)) * sol["I_total"] for y in admittances]
+    assert [row["current"] for row in sol["circuits"]] == pytest.approx(expected)
+    assert sol["circuits"][1]["current"] > sol["circuits"][0]["current"]
+
+
+def test_reinforcement_ranking_puts_passing_options_first():
+    existing = [{"cable": cable("3x50 mm2"), "arrangement": "Trefoil", "length": 2.0}]
+    ranked = rank_parallel_additions(existing, 6.0, 3.0, 10.0, 25.0, "Industrial", "Trefoil", 2.0)
+    checks = [item["solution"]["capacity_check"] for item in ranked]
+    assert "PASS" in checks
+    assert checks == sorted(checks, key=lambda check: check != "PASS")
+    passing = [item["lifecycle_cost"] for item in ranked if item["solution"]["capacity_check"] == "PASS"]
+    assert passing == sorted(passing)
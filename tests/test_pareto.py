@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from cable_engine import calc_pareto_frontier, enumerate_configurations, pareto_front
+
+
+def brute_force_front(points):
+    def dominates(a, b):
+        return all(x <= y for x, y in zip(a, b)) and a != b
+    return [i for i, p in enumerate(points) if not any(dominates(q, p) for q in points)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pareto_front_matches_brute_force(seed):
+    rng = random.Random(seed)
+    # small integer ranges give plenty of ties and duplicate points
+    points = [(rng.randint(0, 8), rng.randint(0, 8), rng.randint(0, 8)) for _ in range(rng.randint(1, 150))]
+    assert pareto_front(points) == brute_force_front(points)
+
+
+def test_frontier_configurations_are_mutually_non_dominated():
+    front = calc_pareto_frontier(2.0, 1.0, 10.0, 2.0, 20.0, "Industrial")
+    configs = enumerate_configurations(2.0, 1.0, 10.0, 2.0, 20.0, "Industrial")
+    assert front and len(front) < len(configs)
+
+    def objectives(config):
+        r = config["result"]
+        return r["cable_installation_cost"], r["voltage_regulation_percent"], r["P_loss_total_kW"]
+
+    all_points = [objectives(c) for c in configs]
+    assert sorted(map(objectives, front)) == sorted(all_points[i] for i in brute_force_front(all_points))
@@ -0,0 +1,55 @@
+import copy
+
+from cable_engine import (cable_list, compute_feeder, economic_settings, load_project, project, recompute_project,
+                          save_project, set_cable_price)
+
+
+def make_feeders(inputs):
+    feeders = []
+    for k, P in enumerate((0.5, 1.0, 2.0, 3.0)):
+        feeders.append({"name": f"F{k}", "cable_id": None, "inputs": dict(inputs, P=P)})
+    feeders[0]["cable_id"] = compute_feeder(feeders[0])["cable_id"]  # one pinned feeder
+    return feeders
+
+
+def test_only_changed_feeders_are_recomputed(feeder_inputs):
+    feeders = make_feeders(feeder_inputs)
+    assert recompute_project(feeders) == 4
+    assert recompute_project(feeders) == 0
+
+    feeders[2]["inputs"]["length"] = 3.5
+    assert recompute_project(feeders) == 1
+
+    # a price change reaches the pinned feeder and the feeders choosing among that cable's rivals only
+    pinned = feeders[0]["cable_id"]
+    affected = 1 + sum(pinned in f["result"]["candidate_ids"] for f in feeders[1:])
+    set_cable_price(pinned, next(c for c in cable_list if c["id"] == pinned)["price"] + 1000)
+    assert recompute_project(feeders) == affected
+    assert recompute_project(feeders) == 0
+
+    economic_settings["electricity_price"] *= 2
+    assert recompute_project(feeders) == 4
+
+
+def test_incremental_results_match_a_full_recompute(feeder_inputs):
+    feeders = make_feeders(feeder_inputs)
+    recompute_project(feeders)
+    feeders[1]["inputs"]["ambient"] = 35.0
+    feeders[3]["inputs"]["N"] = 2
+    recompute_project(feeders)
+
+    fresh = copy.deepcopy(feeders)
+    for feeder in fresh:
+        feeder.pop("result")
+        feeder.pop("deps")
+    recompute_project(fresh)
+    assert [f["result"] for f in fresh] == [f["result"] for f in feeders]
+
+
+def test_saved_project_reloads_without_recomputing(feeder_inputs, tmp_path):
+    project["feeders"] = make_feeders(feeder_inputs)
+    recompute_project(project["feeders"])
+    path = str(tmp_path / "project.json")
+    save_project(path)
+    assert load_project(path) == 0
+    assert project["path"] == path
@@ -0,0 +1,96 @@
+import copy
+import json
+
+import pytest
+
+import cable_engine
+from cable_engine import (cache_get_many, cache_put, close_result_cache, flush_result_cache, open_result_cache,
+                          recompute_project, result_cache, result_cache_stats)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    open_result_cache(str(tmp_path / "cache.db"))
+    saved = result_cache["max_bytes"]
+    yield result_cache
+    close_result_cache()
+    result_cache["max_bytes"] = saved
+
+
+def make_feeders(inputs):
+    return [{"name": f"F{k}", "cable_id": None, "inputs": dict(inputs, P=P)} for k, P in enumerate((0.5, 1, 2, 3))]
+
+
+def test_second_session_is_served_from_the_cache(cache, feeder_inputs, monkeypatch):
+    feeders = make_feeders(feeder_inputs)
+    recompute_project(feeders)
+    assert result_cache_stats()["misses"] == 4
+
+    # a later session starts without results; nothing may be recomputed
+    calls = []
+    monkeypatch.setattr(cable_engine, "compute_feeder", lambda feeder: calls.append(feeder) or {})
+    fresh = copy.deepcopy(feeders)
+    for feeder in fresh:
+        del feeder["result"], feeder["deps"]
+    recompute_project(fresh)
+    assert calls == []
+    assert [f["result"] for f in fresh] == json.loads(json.dumps([f["result"] for f in feeders]))
+    stats = result_cache_stats()
+    assert (stats["hits"], stats["session_hits"], stats["entries"]) == (4, 4, 4)
+
+
+def test_only_changed_feeders_miss(cache, feeder_inputs):
+    feeders = make_feeders(feeder_inputs)
+    recompute_project(feeders)
+    fresh = copy.deepcopy(feeders)
+    for feeder in fresh:
+        del feeder["result"], feeder["deps"]
+    fresh[1]["inputs"]["length"] = 7.0
+    recompute_project(fresh)
+    stats = result_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (3, 5, 5)
+
+
+def test_equivalent_inputs_share_a_key(cache, feeder_inputs):
+    feeders = make_feeders(feeder_inputs)
+    recompute_project(feeders)
+    fresh = copy.deepcopy(feeders)
+    for feeder in fresh:
+        del feeder["result"], feeder["deps"]
+        feeder["inputs"]["length"] += 1e-13  # float noise from a text round trip
+    recompute_project(fresh)
+    assert result_cache_stats()["hits"] == 4
+
+
+def test_model_change_misses(cache, feeder_inputs):
+    feeders = make_feeders(feeder_inputs)
+    recompute_project(feeders)
+    cable_engine.economic_settings["electricity_price"] *= 2
+    recompute_project(feeders)
+    stats = result_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (0, 8, 8)
+
+
+def test_eviction_keeps_recently_used_entries_under_budget(cache):
+    value = {"payload": "x" * 980}
+    for k in range(100):
+        cache_put(f"key{k}", value)
+    flush_result_cache()
+    entry_size = len(json.dumps(value))
+
+    cache["max_bytes"] = 50 * entry_size
+    cache_get_many([f"key{k}" for k in range(10)])  # the oldest entries are used again
+    flush_result_cache()
+    stats = result_cache_stats()
+    assert stats["bytes"] <= 0.9 * cache["max_bytes"]
+    assert stats["evictions"] == 100 - stats["entries"]
+    kept = cache_get_many([f"key{k}" for k in range(100)])
+    assert all(f"key{k}" in kept for k in range(10))
+    assert "key10" not in kept
+
+
+def test_disabled_cache_is_a_no_op():
+    assert result_cache["conn"] is None
+    cache_put("key", {"a": 1})
+    assert cache_get_many(["key"]) == {}
+    assert result_cache["pending"] == []
@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+
+from cable_engine import (close_result_store, compute_feeder, open_result_store, query_result_store, record_result,
+                          result_store, result_store_queries)
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = str(tmp_path / "results.db")
+    open_result_store(path)
+    yield path
+    close_result_store()
+
+
+def test_recorded_results_are_queryable(store, feeder_inputs):
+    result = compute_feeder({"cable_id": None, "inputs": feeder_inputs})
+    for k in range(3):
+        record_result("test", f"F{k}", feeder_inputs, result)
+    assert len(result_store["pending"]) == 3  # batched until a flush or query
+
+    columns, rows = query_result_store("SELECT feeder, lifecycle_cost, energy_loss_cost_pv, total_cost FROM results "
+                                       "ORDER BY feeder")
+    assert columns == ["feeder", "lifecycle_cost", "energy_loss_cost_pv", "total_cost"]
+    assert [row[0] for row in rows] == ["F0", "F1", "F2"]
+    assert rows[0][1:] == pytest.approx((result["lifecycle_cost"], result["energy_loss_cost_pv"],
+                                         result["total_cost_10yr"]))
+    for sql in result_store_queries.values():
+        query_result_store(sql)
+
+
+def test_old_stores_gain_the_lifecycle_columns(tmp_path, feeder_inputs):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY, created_at REAL, source TEXT, feeder TEXT, "
+                 "load_type TEXT, cable_type TEXT, arrangement TEXT, P REAL, Q REAL, V REAL, N INTEGER, "
+                 "length REAL, ambient REAL, cable_id INTEGER, cable_code TEXT, voltage_class TEXT, "
+                 "regulation_pct REAL, loss_kw REAL, installation_cost REAL, energy_cost REAL, total_cost REAL, "
+                 "capacity_check TEXT)")
+    conn.execute("INSERT INTO results (feeder, total_cost) VALUES ('old', 1.0)")
+    conn.commit()
+    conn.close()
+
+    open_result_store(path)
+    try:
+        record_result("test", "new", feeder_inputs, compute_feeder({"cable_id": None, "inputs": feeder_inputs}))
+        _, rows = query_result_store("SELECT feeder, lifecycle_cost FROM results ORDER BY id")
+    finally:
+        close_result_store()
+    assert rows[0] == ("old", None)
+    assert rows[1][0] == "new" and rows[1][1] > 0
+
+    open_result_store(path)  # migrating twice is a no-op
+    close_result_store()
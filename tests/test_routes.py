@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from cable_engine import (geodesic_distance_m, iter_geojson_features, polyline_length_km, read_routes, size_route,
+                          transient_settings)
+
+
+def dms(degrees, minutes, seconds):
+    return degrees + minutes / 60 + seconds / 3600
+
+
+def test_vincenty_reference_distance():
+    # Flinders Peak to Buninyong, the reference example of Vincenty's paper
+    distance = geodesic_distance_m(-dms(37, 57, 3.72030), dms(144, 25, 29.52440),
+                                   -dms(37, 39, 10.15610), dms(143, 55, 35.38390))
+    assert distance == pytest.approx(54972.271, abs=1e-3)
+
+
+def test_nearly_antipodal_points_fall_back_to_a_finite_distance():
+    distance = geodesic_distance_m(0.0, 0.0, 0.5, 179.7)
+    assert 19.9e6 < distance < 20.1e6
+
+
+def test_polyline_length_sums_the_legs():
+    line = [[30.0, 40.0], [30.01, 40.0], [30.01, 40.01]]
+    expected = (geodesic_distance_m(40.0, 30.0, 40.0, 30.01) + geodesic_distance_m(40.0, 30.01, 40.01, 30.01)) / 1000
+    assert polyline_length_km(line) == pytest.approx(expected)
+
+
+def write_collection(path, features):
+    path.write_text(json.dumps({"type": "FeatureCollection", "name": "routes", "features": features}),
+                    encoding="utf-8")
+
+
+def line_feature(properties, coordinates):
+    return {"type": "Feature", "properties": properties, "geometry": {"type": "LineString",
+                                                                     "coordinates": coordinates}}
+
+
+def test_streaming_reader_yields_every_feature_across_chunks(tmp_path):
+    features = [line_feature({"route": f"R{k}", "note": "x" * k}, [[30.0, 40.0], [30.0 + k / 1000, 40.0]])
+                for k in range(1, 60)]
+    path = tmp_path / "routes.geojson"
+    write_collection(path, features)
+    assert list(iter_geojson_features(str(path), chunk_size=64)) == features
+
+
+def test_features_key_is_found_by_structure(tmp_path):
+    features = [line_feature({"route": "R1"}, [[30.0, 40.0], [30.01, 40.0]])]
+    decoy = [line_feature({"route": "decoy"}, [[0.0, 0.0], [1.0, 1.0]])]
+    path = tmp_path / "routes.geojson"
+    # the key text inside a string and a nested "features" array come before the real one
+    path.write_text(json.dumps({"name": 'has "features": [ in it', "meta": {"features": decoy},
+                                "type": "FeatureCollection", "features": features}), encoding="utf-8")
+    for chunk_size in (7, 64, 1 << 20):
+        assert list(iter_geojson_features(str(path), chunk_size=chunk_size)) == features
+
+
+def test_malformed_feature_fails_without_reading_on(tmp_path):
+    good = line_feature({"route": "R"}, [[30.0, 40.0], [30.01, 40.0]])
+    path = tmp_path / "routes.geojson"
+    path.write_text('{"type": "FeatureCollection", "features": [' + json.dumps(good) + ', {"type": "Feature", '
+                    '"properties": {"route": oops}}, ' + ", ".join([json.dumps(good)] * 2000) + "]}",
+                    encoding="utf-8")
+    features = iter_geojson_features(str(path), chunk_size=256, max_buffer=4096)
+    assert next(features) == good
+    with pytest.raises(ValueError, match="Malformed GeoJSON in feature 2"):
+        next(features)
+
+
+def test_oversized_or_truncated_values_fail(tmp_path):
+    path = tmp_path / "routes.geojson"
+    write_collection(path, [line_feature({"route": "R", "note": "x" * 10000}, [[30.0, 40.0], [30.01, 40.0]])])
+    with pytest.raises(ValueError, match="longer than 4096"):
+        list(iter_geojson_features(str(path), chunk_size=256, max_buffer=4096))
+    path.write_text(path.read_text(encoding="utf-8")[:-20], encoding="utf-8")
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_geojson_features(str(path), chunk_size=256))
+    path.write_text('{"type": "FeatureCollection"}', encoding="utf-8")
+    with pytest.raises(ValueError, match="No 'features'"):
+        list(iter_geojson_features(str(path)))
+
+
+def test_null_properties_take_the_defaults(tmp_path):
+    path = tmp_path / "routes.geojson"
+    write_collection(path, [
+        line_feature({"route": "R1", "ambient": None, "grouping": None, "installation": None},
+                     [[30.0, 40.0], [30.01, 40.0]]),
+        line_feature({"route": "R1", "section": "b", "ambient": 0, "grouping": 2, "installation": "Ducted"},
+                     [[30.01, 40.0], [30.02, 40.0]]),
+    ])
+    sections = read_routes(str(path))["R1"]
+    assert [(s["ambient"], s["grouping"], s["installation"]) for s in sections] == [(20.0, 0, "direct"),
+                                                                                   (0.0, 2, "ducted")]
+
+
+def test_bad_properties_name_the_feature(tmp_path):
+    path = tmp_path / "routes.geojson"
+    write_collection(path, [line_feature({"route": "R1"}, [[30.0, 40.0], [30.01, 40.0]]),
+                            line_feature({"route": "R2", "ambient": "hot"}, [[30.0, 40.0], [30.01, 40.0]])])
+    with pytest.raises(ValueError, match="Feature 2"):
+        read_routes(str(path))
+
+
+def test_csv_vertices_are_grouped_into_sections(tmp_path):
+    path = tmp_path / "routes.csv"
+    path.write_text("route,section,lat,lon,ambient,grouping,installation\n"
+                    "A,1,40.0,30.0,25,,\nA,1,40.0,30.01,25,,\nA,2,40.0,30.01,35,3,ducted\nA,2,40.01,30.01,35,3,\n",
+                    encoding="utf-8")
+    sections = read_routes(str(path))["A"]
+    assert [s["section"] for s in sections] == ["1", "2"]
+    assert sections[0]["length"] == pytest.approx(geodesic_distance_m(40.0, 30.0, 40.0, 30.01) / 1000)
+    assert (sections[1]["ambient"], sections[1]["grouping"], sections[1]["installation"]) == (35.0, 3, "ducted")
+
+
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_route_result_uses_the_worst_section_derating(feeder_inputs, cyclic):
+    transient_settings["use_cyclic_rating"] = cyclic
+    sections = [{"section": "a", "length": 1.0, "ambient": 20.0, "grouping": 0, "installation": "direct"},
+                {"section": "b", "length": 0.5, "ambient": 30.0, "grouping": 3, "installation": "ducted"}]
+    summary = size_route(sections, feeder_inputs)
+    r = summary["result"]
+    assert summary["worst_section"] == "b"
+    assert summary["length"] == pytest.approx(1.5)
+    assert r["derated_capacity"] == pytest.approx(r["base_capacity"] * summary["worst_derating"])
+    assert r["capacity_check"] == "PASS"
+
+    limited = size_route(sections, feeder_inputs, reg_limit=1.0)
+    assert limited["result"]["voltage_regulation_percent"] <= 1.0 + 1e-9
@@ -0,0 +1,53 @@
+import re
+
+import pytest
+
+from cable_engine import cable_list, invalidate_search_index, parse_cable_code, parse_voltage_kV, search_catalog
+
+
+def brute_force_search(predicate):
+    return {cable["id"] for cable in cable_list if predicate(cable)}
+
+
+def test_parse_cable_code():
+    assert parse_cable_code("3x95+50 mm2") == (4, 95.0, "3x95+50")
+    assert parse_cable_code("1x240 mm2") == (1, 240.0, "1x240")
+    assert parse_cable_code("3x2.5 mm2") == (3, 2.5, "3x2.5")
+    assert parse_cable_code("unknown cable") == (None, None, "unknown")
+
+
+def test_empty_query_returns_none():
+    assert search_catalog("") is None
+    assert search_catalog("   ") is None
+
+
+@pytest.mark.parametrize("query, predicate", [
+    ("mm2:95", lambda c: parse_cable_code(c["code"])[1] == 95),
+    ("mm2:50..150", lambda c: 50 <= parse_cable_code(c["code"])[1] <= 150),
+    ("kv>=10", lambda c: parse_voltage_kV(c["voltage"]) >= 10),
+    ("kv<10", lambda c: parse_voltage_kV(c["voltage"]) < 10),
+    ("price<500k", lambda c: c["price"] < 500e3),
+    ("cores:1 price>=1m", lambda c: parse_cable_code(c["code"])[0] == 1 and c["price"] >= 1e6),
+])
+def test_attribute_ranges_match_brute_force(query, predicate):
+    assert search_catalog(query) == brute_force_search(predicate)
+
+
+def test_token_prefix_matches_brute_force():
+    def has_prefix(cable, prefix):
+        words = re.split(r"[\s/+x]+", (cable["code"] + " " + cable["voltage"]).lower())
+        return any(word.startswith(prefix) for word in words) or cable["code"].lower().startswith(prefix)
+    for prefix in ("1x", "3x9", "240"):
+        assert search_catalog(prefix) == brute_force_search(lambda c: has_prefix(c, prefix))
+
+
+def test_incomplete_term_is_ignored():
+    assert search_catalog("mm2:95 price<") == search_catalog("mm2:95")
+
+
+def test_price_change_needs_invalidation():
+    cheapest = min(cable_list, key=lambda c: c["price"])
+    assert cheapest["id"] in search_catalog("price<=%g" % cheapest["price"])
+    cheapest["price"] *= 1000
+    invalidate_search_index()
+    assert cheapest["id"] not in search_catalog("price<=%g" % (cheapest["price"] / 1000))
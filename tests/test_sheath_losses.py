@@ -0,0 +1,83 @@
+import math
+
+import pytest
+
+from cable_engine import (cable_list, calc_sheath_loss_factors, get_base_capacity, get_sheath_loss_factors,
+                          parse_voltage_kV, sheath_settings, thermal_settings)
+
+mv_single_core = [c for c in cable_list if c["code"].startswith("1x") and parse_voltage_kV(c["voltage"]) > 1]
+
+
+def trefoil_closed_form(cable, screen_resistivity=1.7241e-8, screen_alpha=0.00393):
+    # IEC 60287-1-1 2.3.1 with the screen and insulation dimensions of the settings
+    section = float(cable["code"][2:].split()[0])
+    U = parse_voltage_kV(cable["voltage"])
+    screen = next(a for limit, a in sheath_settings["screen_mm2"] if section <= limit)
+    insulation = next(t for limit, t in sheath_settings["insulation_mm"] if U <= limit)
+    t_max, t_ref, alpha = (thermal_settings[k] for k in ("max_conductor_temp", "reference_temp", "alpha"))
+    R = cable["resistance"] / 1000 * (1 + alpha * (t_max - t_ref))
+    Rs = screen_resistivity / (screen * 1e-6) * (1 + screen_alpha * (t_max - 10 - t_ref))
+    d = 1.13 * math.sqrt(section) + 2 * (insulation + 1.6) + 1.0
+    X = 2 * 2 * math.pi * 50 * 1e-7 * math.log(2 * (d + 6.0) / d)
+    return Rs / R / (1 + (Rs / X) ** 2)
+
+
+def test_mv_catalog_is_covered():
+    assert len(mv_single_core) > 10
+
+
+def test_trefoil_matches_closed_form():
+    factors = calc_sheath_loss_factors(mv_single_core, "Trefoil")
+    for cable, (worst, mean) in zip(mv_single_core, factors):
+        assert worst == pytest.approx(trefoil_closed_form(cable), rel=1e-12)
+        assert mean == pytest.approx(worst, rel=1e-12)
+
+
+def test_screen_material_and_reference_temperature_come_from_the_settings():
+    cable = mv_single_core[5]
+    sheath_settings.update(screen_resistivity=2.8264e-8, screen_alpha=0.00403)
+    aluminium = calc_sheath_loss_factors([cable], "Trefoil")[0][0]
+    assert aluminium == pytest.approx(trefoil_closed_form(cable, 2.8264e-8, 0.00403), rel=1e-12)
+    thermal_settings["reference_temp"] = 25.0
+    assert calc_sheath_loss_factors([cable], "Trefoil")[0][0] == pytest.approx(
+        trefoil_closed_form(cable, 2.8264e-8, 0.00403), rel=1e-12)
+    assert calc_sheath_loss_factors([cable], "Trefoil")[0][0] != aluminium
+
+
+def test_flat_outer_phase_is_worst():
+    for (worst, mean), (trefoil, _) in zip(calc_sheath_loss_factors(mv_single_core, "Flat"),
+                                           calc_sheath_loss_factors(mv_single_core, "Trefoil")):
+        assert worst > mean > 0
+        assert mean > trefoil  # wider spacing links more flux into the screens
+
+
+def test_single_point_and_lv_cables_have_no_loss():
+    lv = [c for c in cable_list if parse_voltage_kV(c["voltage"]) <= 1 or not c["code"].startswith("1x")]
+    assert all(f == (0.0, 0.0) for f in calc_sheath_loss_factors(lv, "Flat"))
+    sheath_settings["bonding"] = "Single point"
+    assert all(f == (0.0, 0.0) for f in calc_sheath_loss_factors(mv_single_core, "Flat"))
+
+
+def test_cross_bonding_caps_at_the_residual():
+    both_ends = calc_sheath_loss_factors(mv_single_core, "Flat")
+    sheath_settings["bonding"] = "Cross-bonded"
+    for (worst, mean), (solid, _) in zip(calc_sheath_loss_factors(mv_single_core, "Flat"), both_ends):
+        assert worst == min(solid, sheath_settings["cross_bonded_residual"])
+        assert mean <= worst
+
+
+def test_base_capacity_is_derated_by_the_worst_phase():
+    for cable in mv_single_core:
+        worst = get_sheath_loss_factors(cable, "Flat")[0]
+        assert get_base_capacity(cable, "Flat") == pytest.approx(cable["fcc"] / math.sqrt(1 + worst))
+    sheath_settings["bonding"] = "Single point"
+    assert all(get_base_capacity(c, "Flat") == c["fcc"] for c in mv_single_core)
+
+
+def test_cached_factors_follow_settings_changes():
+    cable = mv_single_core[0]
+    before = get_sheath_loss_factors(cable, "Trefoil")
+    sheath_settings["screen_mm2"] = [(float("inf"), 35)]
+    after = get_sheath_loss_factors(cable, "Trefoil")
+    assert after != before
+    assert after == calc_sheath_loss_factors([cable], "Trefoil")[0]
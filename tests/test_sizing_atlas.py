@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from cable_engine import (atlas_lookup, build_sizing_atlas, close_sizing_atlas, filter_cables, open_sizing_atlas,
+                          sheath_settings, sizing_atlas_stale, transient_settings, validate_sizing_atlas)
+
+
+@pytest.fixture
+def make_atlas(tmp_path):
+    opened = []
+
+    def make(cable_type="Three-core", ambients=None, s_step=0.05, s_count=200):
+        path = str(tmp_path / f"grid{len(opened)}.atlas")
+        build_sizing_atlas(path, cable_type, "Flat", [0.4, 10.0], s_step, s_count, ambients)
+        atlas = open_sizing_atlas(path)
+        opened.append(atlas)
+        return atlas
+
+    yield make
+    for atlas in opened:
+        close_sizing_atlas(atlas)
+
+
+def cheapest_id(S_MVA, V, N, ambient, cable_type):
+    candidates = filter_cables(S_MVA, 0.0, V, N, ambient, cable_type, "Flat")
+    return min(candidates, key=lambda c: c["price"])["id"] if candidates else 0
+
+
+@pytest.mark.parametrize("cyclic", [False, True])
+@pytest.mark.parametrize("ambients", [None, [20], [5, 12, 20, 40]])
+def test_grid_nodes_match_the_filter(make_atlas, ambients, cyclic):
+    transient_settings["use_cyclic_rating"] = cyclic
+    atlas = make_atlas("Single-core", ambients)
+    header = atlas["header"]
+    for V in header["voltages"]:
+        for N in range(1, header["max_circuits"] + 1):
+            for ambient in header["ambients"]:
+                for k in range(0, header["s_count"], 7):
+                    S_MVA = (k + 1) * header["s_step"]
+                    assert atlas_lookup(atlas, S_MVA, V, N, ambient)[0] == cheapest_id(S_MVA, V, N, ambient,
+                                                                                      "Single-core")
+
+
+def test_ambients_round_up_on_an_uneven_grid(make_atlas):
+    atlas = make_atlas(ambients=[5, 12, 20, 40])
+    for ambient, node in ((4, 5), (5, 5), (6, 12), (12, 12), (13, 20), (21, 40)):
+        assert atlas_lookup(atlas, 2.0, 10.0, 1, ambient) == atlas_lookup(atlas, 2.0, 10.0, 1, node)
+    assert atlas_lookup(atlas, 2.0, 10.0, 1, 13)[0] == cheapest_id(2.0, 10.0, 1, 20, "Three-core")
+
+
+def test_points_outside_the_grid(make_atlas):
+    atlas = make_atlas()
+    assert atlas_lookup(atlas, 1.0, 6.0, 1, 20) is None  # voltage not in the grid
+    assert atlas_lookup(atlas, 1.0, 10.0, 7, 20) is None
+    assert atlas_lookup(atlas, 1000.0, 10.0, 1, 20) is None
+    assert atlas_lookup(make_atlas(ambients=[5, 20, 30]), 1.0, 10.0, 1, 31) is None  # no hotter node
+
+
+@pytest.mark.parametrize("ambients", [None, [15, 25, 30]])
+def test_random_points_are_never_unsafe(make_atlas, ambients):
+    random.seed(7)
+    stats = validate_sizing_atlas(make_atlas(ambients=ambients), samples=300)
+    assert stats["unsafe"] == 0
+    assert stats["exact"] + stats["conservative"] == 300
+
+
+def test_model_changes_make_the_atlas_stale(make_atlas):
+    atlas = make_atlas()
+    assert not sizing_atlas_stale(atlas)
+    sheath_settings["bonding"] = "Single point"
+    assert sizing_atlas_stale(atlas)
+    sheath_settings["bonding"] = "Both ends"
+    transient_settings["use_cyclic_rating"] = True
+    assert sizing_atlas_stale(atlas)
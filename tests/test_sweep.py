@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from cable_engine import (build_extrema_table, calc_performance, calc_sweep_curves, decimate_columns, economic_settings,
+                          filter_cables, range_extrema)
+
+INF = float("inf")
+
+
+def gapped_values(seed, n):
+    rng = random.Random(seed)
+    ys = [rng.choice([rng.uniform(-5, 5), round(rng.uniform(0, 3))]) for _ in range(n)]  # some ties
+    feasible = [rng.random() > 0.1 for _ in range(n)]
+    return [y if f else INF for y, f in zip(ys, feasible)], [y if f else -INF for y, f in zip(ys, feasible)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_range_extrema_match_a_scan(seed):
+    rng = random.Random(seed)
+    low, high = gapped_values(seed, rng.randint(1, 300))
+    table = build_extrema_table(low, high)
+    for _ in range(300):
+        start = rng.randrange(len(low))
+        stop = rng.randint(start + 1, len(low))
+        lo, hi = range_extrema(table, low, high, start, stop)
+        assert start <= lo < stop and start <= hi < stop
+        assert low[lo] == min(low[start:stop])
+        assert high[hi] == max(high[start:stop])
+
+
+def test_columns_keep_first_lowest_highest_and_last_point():
+    low, high = gapped_values(11, 1000)
+    table = build_extrema_table(low, high)
+    bounds = list(range(0, 1000, 13)) + [1000]
+    for (start, stop), column in zip(zip(bounds, bounds[1:]), decimate_columns(table, low, high, bounds)):
+        kept = [k for k in range(start, stop) if low[k] != INF]
+        if not kept:
+            assert column is None
+            continue
+        assert column == sorted(column)
+        assert kept[0] in column and kept[-1] in column
+        assert min(low[k] for k in column) == min(low[k] for k in kept)
+        assert max(high[k] for k in column) == max(high[k] for k in kept)
+
+
+@pytest.mark.parametrize("economics", [{}, {"years": 25, "discount_rate": 0.06, "load_growth": 0.02,
+                                             "price_escalation": 0.03, "residual_value": 0.1}])
+@pytest.mark.parametrize("variable", ["length", "power"])
+def test_sweep_points_match_calc_performance(feeder_inputs, variable, economics):
+    economic_settings.update(economics)
+    cables = filter_cables(feeder_inputs["P"], feeder_inputs["Q"], feeder_inputs["V"], feeder_inputs["N"],
+                           feeder_inputs["ambient"], feeder_inputs["cable_type"], feeder_inputs["arrangement"])
+    x_values = [0.5, 1.0, 2.5]
+    curves = calc_sweep_curves(cables, feeder_inputs, variable, x_values)
+    for k, cable in enumerate(cables):
+        for j, x in enumerate(x_values):
+            inputs = dict(feeder_inputs)
+            if variable == "length":
+                inputs["length"] = x
+            else:
+                inputs["Q"] = feeder_inputs["Q"] * x / feeder_inputs["P"]
+                inputs["P"] = x
+            r = calc_performance(cable, inputs["P"], inputs["Q"], inputs["V"], inputs["N"], inputs["arrangement"],
+                                 inputs["length"], inputs["ambient"], inputs["load_type"])
+            assert curves["regulation"][k][j] == pytest.approx(r["voltage_regulation_percent"], rel=1e-6)
+            assert curves["losses"][k][j] == pytest.approx(r["P_loss_total_kW"], rel=1e-6)
+            assert curves["lifecycle"][k][j] == pytest.approx(r["lifecycle_cost"], rel=1e-6)
+            assert curves["feasible"][k][j] == (r["capacity_check"] == "PASS")
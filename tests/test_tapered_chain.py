@@ -0,0 +1,81 @@
+import itertools
+
+import pytest
+
+from cable_engine import calc_performance, filter_cables, optimize_tapered_chain, read_collector_chain
+
+sections = [{"name": "A", "length": 3.0, "P": 1.0, "Q": 0.4}, {"name": "B", "length": 2.0, "P": 1.5, "Q": 0.5},
+            {"name": "C", "length": 4.0, "P": 0.8, "Q": 0.3}]
+flows = [(3.3, 1.2), (2.3, 0.8), (0.8, 0.3)]  # each section carries everything beyond it
+
+
+@pytest.fixture
+def chain_inputs(feeder_inputs):
+    return dict(feeder_inputs, V=10.0, N=1, ambient=20.0)
+
+
+def section_options(inputs):
+    options = []
+    for section, (P, Q) in zip(sections, flows):
+        options.append([])
+        for cable in filter_cables(P, Q, inputs["V"], inputs["N"], inputs["ambient"], inputs["cable_type"],
+                                   inputs["arrangement"]):
+            r = calc_performance(cable, P, Q, inputs["V"], inputs["N"], inputs["arrangement"], section["length"],
+                                 inputs["ambient"], inputs["load_type"])
+            options[-1].append((r["lifecycle_cost"], r["voltage_regulation_percent"], cable["id"]))
+    return options
+
+
+def brute_force(inputs, reg_limit):
+    best = None
+    for combo in itertools.product(*section_options(inputs)):
+        cost, drop = sum(o[0] for o in combo), sum(o[1] for o in combo)
+        if drop <= reg_limit and (best is None or cost < best[0]):
+            best = (cost, drop, [o[2] for o in combo])
+    return best
+
+
+@pytest.mark.parametrize("reg_limit", [3.0, 4.5, 5.0, 6.0, 8.0, 20.0])
+def test_matches_brute_force(chain_inputs, reg_limit):
+    result = optimize_tapered_chain(sections, chain_inputs, reg_limit, resolution=20000)
+    best = brute_force(chain_inputs, reg_limit)
+    assert result["feasible"] == (best is not None)
+    if best is None:
+        return
+    assert [row["cable"]["id"] for row in result["sections"]] == best[2]
+    assert result["cost"] == pytest.approx(best[0])
+    assert result["drop"] == pytest.approx(best[1]) and result["drop"] <= reg_limit
+    assert result["sections"][-1]["cumulative"] == result["drop"]
+
+
+def test_coarse_budget_stays_feasible(chain_inputs):
+    # rounding drops up may cost optimality but never the limit
+    for resolution in (5, 20, 100):
+        result = optimize_tapered_chain(sections, chain_inputs, 5.0, resolution=resolution)
+        if result["feasible"]:
+            assert result["drop"] <= 5.0
+            assert result["cost"] >= brute_force(chain_inputs, 5.0)[0] - 1e-6
+
+
+def test_uniform_reference(chain_inputs):
+    result = optimize_tapered_chain(sections, chain_inputs, 5.0)
+    uniform = result["uniform"]
+    assert uniform["drop"] <= 5.0
+    assert result["cost"] <= uniform["cost"]
+    head = filter_cables(*flows[0], chain_inputs["V"], chain_inputs["N"], chain_inputs["ambient"],
+                         chain_inputs["cable_type"], chain_inputs["arrangement"])
+    assert uniform["cable"] in head
+    options = section_options(chain_inputs)
+    within = [c for c in head
+              if sum(next(o[1] for o in opts if o[2] == c["id"]) for opts in options) <= 5.0]
+    assert uniform["cable"] == min(within, key=lambda c: c["price"])
+
+
+def test_read_collector_chain(tmp_path):
+    path = tmp_path / "chain.csv"
+    path.write_text("name,length,P,Q\nA,\"3,0\",1,0.4\nB,2,1.5,\n", encoding="utf-8")
+    assert read_collector_chain(str(path)) == [{"name": "A", "length": 3.0, "P": 1.0, "Q": 0.4},
+                                               {"name": "B", "length": 2.0, "P": 1.5, "Q": 0.0}]
+    path.write_text("name,length,P\nA,x,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Line 2"):
+        read_collector_chain(str(path))
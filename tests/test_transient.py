@@ -0,0 +1,88 @@
+import pytest
+
+from cable_engine import (_thermal_transition, build_thermal_networks, cable_list, calc_cyclic_factors,
+                          calc_emergency_times, conductor_area_mm2, get_base_capacity, model_fingerprint,
+                          transient_settings)
+
+
+def networks_for(codes, ambient=20.0):
+    cables = [next(c for c in cable_list if c["code"] == code) for code in codes]
+    return build_thermal_networks(cables, [get_base_capacity(c, "Trefoil") for c in cables], ambient)
+
+
+def euler(network, x1, x2, w, seconds, dt=0.05):
+    # C1 dx1/dt = W w - (x1 - x2) / T1, C2 dx2/dt = (x1 - x2) / T1 - x2 / T2
+    for _ in range(round(seconds / dt)):
+        flow = (x1 - x2) / network["T1"]
+        x1, x2 = (x1 + dt * (network["W"] * w - flow) / network["C1"],
+                  x2 + dt * (flow - x2 / network["T2"]) / network["C2"])
+    return x1, x2
+
+
+def test_conductor_area_mm2():
+    assert conductor_area_mm2("3x95+50 mm2") == 335
+    assert conductor_area_mm2("1x240 mm2") == 240
+    assert conductor_area_mm2("3x2.5 mm2") == 7.5
+    assert conductor_area_mm2("special") == 0.0
+
+
+@pytest.mark.parametrize("code", ["1x10 mm2", "1x240 mm2", "3x95+50 mm2"])
+def test_transition_matches_small_step_integration(code):
+    network = networks_for([code])[0]
+    m11, m12, m21, m22, q1, q2 = _thermal_transition(network, 600)
+    for x1, x2, w in ((0.0, 0.0, 1.0), (50.0, 20.0, 0.3), (80.0, 40.0, 1.5)):
+        exact = (m11 * x1 + m12 * x2 + q1 * w, m21 * x1 + m22 * x2 + q2 * w)
+        assert exact == pytest.approx(euler(network, x1, x2, w, 600), rel=1e-3, abs=1e-6)
+
+
+def test_transition_keeps_the_steady_state():
+    network = networks_for(["1x240 mm2"])[0]
+    m11, m12, m21, m22, q1, q2 = _thermal_transition(network, 3600)
+    ss1, ss2 = network["limit"], network["W"] * network["T2"]
+    assert network["W"] * (network["T1"] + network["T2"]) == pytest.approx(ss1)
+    assert m11 * ss1 + m12 * ss2 + q1 == pytest.approx(ss1)
+    assert m21 * ss1 + m22 * ss2 + q2 == pytest.approx(ss2)
+
+
+def test_cyclic_factors():
+    networks = networks_for(["1x10 mm2", "1x240 mm2", "3x95+50 mm2"]) + [None]
+    factors = calc_cyclic_factors(networks)
+    assert factors[-1] is None
+    assert all(f > 1 for f in factors[:-1])
+    # heavier conductors store more heat and ride through the daily peak better
+    assert factors[1] > factors[0]
+    assert calc_cyclic_factors(networks, [1.0] * 24)[:-1] == pytest.approx([1.0] * 3)
+
+
+def test_emergency_times_match_small_step_integration():
+    transient_settings["emergency_hours"] = 2
+    network = networks_for(["1x95 mm2"])[0]
+    hours = calc_emergency_times([network], [0.6], [1.4])[0]
+    assert hours is not None
+    ss = 0.36 * network["W"]
+    x1, x2 = ss * (network["T1"] + network["T2"]), ss * network["T2"]
+    before = euler(network, x1, x2, 1.96, hours * 3600 - 60, dt=0.5)[0]
+    after = euler(network, x1, x2, 1.96, hours * 3600 + 60, dt=0.5)[0]
+    assert before < network["limit"] < after
+
+
+def test_emergency_time_edge_cases():
+    networks = networks_for(["1x95 mm2"] * 4) + [None]
+    times = calc_emergency_times(networks, [0.5, 0.5, 1.1, 0.9, 0.5], [1.0, 1.001, 1.5, 3.0, 2.0])
+    assert times[0] is None  # the continuous rating can be held forever
+    assert times[1] is None  # reached only after the horizon
+    assert times[2] == 0.0  # already above the limit before the overload
+    assert times[3] is not None and times[3] < 1
+    assert times[4] is None
+    more = calc_emergency_times(networks[3:4], [0.9], [3.5])[0]
+    assert more < times[3]
+
+
+def test_what_if_cycle_leaves_the_model_alone():
+    networks = networks_for(["1x95 mm2", "1x240 mm2"])
+    fingerprint = model_fingerprint()
+    default = calc_cyclic_factors(networks)
+    flatter = calc_cyclic_factors(networks, [0.8] * 12 + [1.0] * 12)
+    assert all(f < d for f, d in zip(flatter, default))  # less time to cool between peaks
+    assert model_fingerprint() == fingerprint
+    assert calc_cyclic_factors(networks) == default
@@ -0,0 +1,96 @@
+import itertools
+import random
+
+import pytest
+
+from cable_engine import (cable_list, calc_performance, get_base_capacity, optimize_trench_grouping,
+                          parse_trench_routes, parse_voltage_kV, thermal_settings, transient_settings)
+
+
+def cables_in_trench(inputs):
+    return inputs["N"] * 3 if inputs["cable_type"] == "Single-core" else inputs["N"]
+
+
+def cheapest_passing(inputs, length, grouping):
+    costs = []
+    for cable in cable_list:
+        if (cable["code"].startswith("1x") != (inputs["cable_type"] == "Single-core")
+                or parse_voltage_kV(cable["voltage"]) < inputs["V"]
+                or get_base_capacity(cable, inputs["arrangement"]) is None):
+            continue
+        r = calc_performance(cable, inputs["P"], inputs["Q"], inputs["V"], inputs["N"], inputs["arrangement"],
+                             length, inputs["ambient"], inputs["load_type"], grouping=grouping)
+        if r["capacity_check"] == "PASS":
+            costs.append(r["lifecycle_cost"])
+    return min(costs) if costs else None
+
+
+def brute_force_cost(feeders):
+    best = None
+    for assignment in itertools.product(*[range(len(f["routes"])) for f in feeders]):
+        counts = {}
+        for feeder, ri in zip(feeders, assignment):
+            trench = feeder["routes"][ri][0]
+            counts[trench] = counts.get(trench, 0) + cables_in_trench(feeder["inputs"])
+        costs = [cheapest_passing(f["inputs"], f["routes"][ri][1], counts[f["routes"][ri][0]] -
+                                  cables_in_trench(f["inputs"])) for f, ri in zip(feeders, assignment)]
+        if None not in costs and (best is None or sum(costs) < best):
+            best = sum(costs)
+    return best
+
+
+def random_feeders(seed):
+    rng = random.Random(seed)
+    feeders = []
+    for k in range(rng.randint(2, 4)):
+        inputs = {"load_type": "Industrial", "cable_type": rng.choice(["Three-core", "Single-core"]),
+                  "arrangement": "Flat", "P": rng.uniform(0.5, 5.0), "Q": 0.5, "V": 10.0, "N": 1, "length": 1.0,
+                  "ambient": 25.0}
+        routes = [("A", rng.uniform(0.8, 1.5)), ("B", rng.uniform(0.8, 1.5)), ("C", rng.uniform(1.0, 2.0))]
+        feeders.append({"name": f"F{k}", "inputs": inputs, "routes": routes[:rng.randint(1, 3)]})
+    return feeders
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_small_instances_reach_the_brute_force_optimum(seed):
+    thermal_settings["enabled"] = False  # costs then do not depend on the trench loading
+    feeders = random_feeders(seed)
+    assert optimize_trench_grouping(feeders)["total_cost"] == pytest.approx(brute_force_cost(feeders))
+
+
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_chosen_cables_pass_at_their_trench_loading(cyclic):
+    transient_settings["use_cyclic_rating"] = cyclic
+    inputs = {"load_type": "Industrial", "cable_type": "Three-core", "arrangement": "Flat", "P": 4.0, "Q": 1.0,
+              "V": 10.0, "N": 1, "length": 1.0, "ambient": 30.0}
+    feeders = [{"name": f"F{k}", "inputs": dict(inputs), "routes": [("T1", 1.0), ("T2", 1.4)]} for k in range(5)]
+    result = optimize_trench_grouping(feeders)
+    for row in result["feeders"]:
+        assert row["cable"] is not None
+        grouping = result["loadings"][row["trench"]]["cables"] - 1
+        r = calc_performance(row["cable"], 4.0, 1.0, 10.0, 1, "Flat", row["length"], 30.0, "Industrial",
+                             grouping=grouping)
+        assert r["capacity_check"] == "PASS"
+
+
+def test_infeasible_feeders_are_listed_not_costed():
+    inputs = {"load_type": "Industrial", "cable_type": "Three-core", "arrangement": "Flat", "P": 2.0, "Q": 0.5,
+              "V": 10.0, "N": 1, "length": 1.0, "ambient": 25.0}
+    feeders = [{"name": "small", "inputs": dict(inputs), "routes": [("T1", 1.0)]},
+               {"name": "huge", "inputs": dict(inputs, P=500.0), "routes": [("T2", 1.0)]}]
+    result = optimize_trench_grouping(feeders)
+    assert result["infeasible"] == ["huge"]
+    assert result["feeders"][1]["cable"] is None and result["feeders"][1]["cost"] is None
+    assert result["total_cost"] == result["feeders"][0]["cost"]
+
+
+def test_parse_trench_routes():
+    by_name = {"F1": {"inputs": {}}, "Main: south": {"inputs": {}}}
+    feeders = parse_trench_routes("F1: T1=0.40, T2=0.55\n\nMain: south: T3=1\n", by_name)
+    assert [f["routes"] for f in feeders] == [[("T1", 0.4), ("T2", 0.55)], [("T3", 1.0)]]
+    for text, message in (("F1: T1=0.4\nF2: T1=1", "Line 2: unknown feeder"),
+                          ("F1: T1=0.4, T2", "Line 1: expected"),
+                          ("F1: =0.4", "Line 1: expected"),
+                          ("F1: T1=abc", "Line 1: invalid length")):
+        with pytest.raises(ValueError, match=message):
+            parse_trench_routes(text, by_name)
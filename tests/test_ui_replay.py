@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("ttkbootstrap")
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO, "2517126_project_final (1).py")
+
+# runs the app in --record mode and types a short session into it from inside its own mainloop
+RECORD_DRIVER = r'''
+import runpy
+import sys
+import tkinter
+
+app, session = sys.argv[1], sys.argv[2]
+sys.argv = [app, "--record", session]
+run_mainloop = tkinter.Misc.mainloop
+
+
+def key(widget, keysym):
+    widget.focus_force()
+    widget.event_generate("<KeyPress>", keysym=keysym, when="now")
+    widget.event_generate("<KeyRelease>", keysym=keysym, when="now")
+
+
+def pick(combo, value):
+    combo.set(value)
+    combo.event_generate("<<ComboboxSelected>>")
+
+
+def mainloop(self, n=0):
+    g = sys._getframe(1).f_globals  # the app module, which has just called root.mainloop()
+    entry, tree = g["active_power_spin"], g["tree"]
+    steps = [lambda k=k: key(entry, k) for k in ("End", "BackSpace", "BackSpace", "BackSpace", "2", "period", "5")]
+    steps += [lambda: pick(g["cable_type_combo"], "Three-core"),
+              lambda: g["circuits_spin"].event_generate("<<Increment>>"),
+              lambda: tree.selection_set(tree.get_children("")[:1]),
+              g["on_close"]]
+    for k, step in enumerate(steps):
+        self.after(1500 + 700 * k, step)  # after start_recording, with time for the debounced filter
+    run_mainloop(self, n)
+
+
+tkinter.Misc.mainloop = tkinter.Tk.mainloop = mainloop
+runpy.run_path(app, run_name="__main__")
+'''
+
+
+@pytest.fixture(scope="module")
+def display():
+    # an existing display, or a private Xvfb for the recording step
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None or not sys.platform.startswith("linux"):
+        pytest.skip("needs a display or Xvfb")
+    number = next(n for n in range(150, 200) if not os.path.exists(f"/tmp/.X{n}-lock"))
+    proc = subprocess.Popen([xvfb, f":{number}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            break
+        time.sleep(0.05)
+    yield f":{number}"
+    proc.terminate()
+    proc.wait()
+
+
+def test_record_replay_report(display, tmp_path):
+    session, report_path, driver = tmp_path / "session.json", tmp_path / "report.json", tmp_path / "driver.py"
+    driver.write_text(RECORD_DRIVER, encoding="utf-8")
+    env = dict(os.environ, DISPLAY=display)
+    record = subprocess.run([sys.executable, str(driver), APP, str(session)], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert record.returncode == 0, record.stderr
+
+    events = json.loads(session.read_text(encoding="utf-8"))["events"]
+    kinds = [e["kind"] for e in events]
+    assert kinds.count("key") == 7 and {"combobox", "spin", "tree_select"} <= set(kinds)
+    assert [e for e in events if e["kind"] == "key"][-1]["value"] == "2.5"
+
+    replay_env = dict(env)
+    if shutil.which("Xvfb"):
+        del replay_env["DISPLAY"]  # without a display the replay starts Xvfb itself
+    replay = subprocess.run([sys.executable, APP, "--replay", str(session), "--report", str(report_path)],
+                            cwd=tmp_path, env=replay_env, capture_output=True, text=True, timeout=300)
+    assert replay.returncode == 0, replay.stdout + replay.stderr
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert (report["events"], report["skipped"], report["diverged"], report["timeouts"]) == (len(events), 0, 0, 0)
+    assert set(report["interactions"]) == set(kinds)
+    for kind, row in report["interactions"].items():
+        assert row["count"] == kinds.count(kind)
+        assert 0 <= row["p50_ms"] <= row["p99_ms"] <= row["max_ms"] < 10000
+    assert "p50 ms" in replay.stdout